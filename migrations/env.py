@@ -11,18 +11,35 @@ import alembic_postgresql_enum
 
 
 from backend.configs.config import settings
-from backend.models import Observation, User  # noqa: F401
+from backend.models import (  # noqa: F401
+    IdempotencyKey,
+    Observation,
+    ObservationDailyCount,
+    ObservationQuotaUsage,
+    ObservationStatusCount,
+    ObservationUserCount,
+    RateLimitBucket,
+    User,
+)
+from backend.utils.online_migrations import migration_server_settings
+from backend.utils.partitions import PARTITION_TABLE_PATTERN
 
 config = context.config
 
 if config.config_file_name is not None:
-    fileConfig(config.config_file_name)
+    # Keep the application's loggers, `backend-db` logs migration retries and backfill progress through them
+    fileConfig(config.config_file_name, disable_existing_loggers=False)
 
 config.set_main_option("sqlalchemy.url", str(settings.database_url))
 
 target_metadata = SQLModel.metadata
 
 
+def include_name(name, type_, parent_names) -> bool:
+    # Monthly partitions of observations are created by `backend-db create-partitions`, not by the models
+    return not (type_ == "table" and PARTITION_TABLE_PATTERN.fullmatch(name or ""))
+
+
 def run_migrations_offline() -> None:
     url = config.get_main_option("sqlalchemy.url")
     output_buffer = config.attributes.get("output_buffer")
@@ -33,7 +50,9 @@ def run_migrations_offline() -> None:
         dialect_opts={"paramstyle": "named"},
         compare_type=True,
         compare_server_default=True,
+        include_name=include_name,
         output_buffer=output_buffer,
+        transaction_per_migration=True,
     )
 
     with context.begin_transaction():
@@ -46,6 +65,10 @@ def do_run_migrations(connection) -> None:
         target_metadata=target_metadata,
         compare_type=True,
         compare_server_default=True,
+        include_name=include_name,
+        # Commit every migration on its own: locks are held for one migration only, autocommit blocks (concurrent
+        # index builds, batched backfills) do not commit half of another migration, and a retry resumes where it failed
+        transaction_per_migration=True,
     )
 
     with context.begin_transaction():
@@ -57,6 +80,7 @@ async def run_migrations_online() -> None:
         config.get_section(config.config_ini_section, {}),
         prefix="sqlalchemy.",
         poolclass=pool.NullPool,
+        connect_args={"server_settings": migration_server_settings()},
     )
 
     async with connectable.connect() as connection:
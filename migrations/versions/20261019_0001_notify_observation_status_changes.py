@@ -0,0 +1,55 @@
+"""notify observation status changes
+
+Revision ID: 20261019_0001
+Revises: 20260601_0002
+Create Date: 2026-10-19 09:12:41.318204
+"""
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20261019_0001'
+down_revision: str | None = '20260601_0002'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Publish every status transition on the 'observation_status' channel.
+    # Notifications are only delivered on commit, so listeners never see rolled back transitions.
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION notify_observation_status_change() RETURNS trigger AS $$
+        BEGIN
+            PERFORM pg_notify(
+                'observation_status',
+                json_build_object(
+                    'id', NEW.id,
+                    'user_id', NEW.user_id,
+                    'status', NEW.status,
+                    'previous_status', OLD.status,
+                    'updated_on', NEW.updated_on
+                )::text
+            );
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER trg_observations_notify_status_change
+        AFTER UPDATE OF status ON observations
+        FOR EACH ROW
+        WHEN (OLD.status IS DISTINCT FROM NEW.status)
+        EXECUTE FUNCTION notify_observation_status_change()
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS trg_observations_notify_status_change ON observations")
+    op.execute("DROP FUNCTION IF EXISTS notify_observation_status_change()")
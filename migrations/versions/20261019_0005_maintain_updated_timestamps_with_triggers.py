@@ -0,0 +1,67 @@
+"""maintain updated timestamps with triggers
+
+Revision ID: 20261019_0005
+Revises: 20261019_0004
+Create Date: 2026-10-19 13:22:07.514630
+"""
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20261019_0005'
+down_revision: str | None = '20261019_0004'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Maintain observations.updated_on and users.updated_at in the database, so set-based UPDATE statements keep them
+    # current without loading ORM objects. The columns hold naive UTC timestamps; clock_timestamp() is the time of the
+    # update itself rather than the start of its transaction, like the ORM listeners these triggers replace.
+    # BEFORE triggers run ahead of trg_observations_notify_status_change, so its payload carries the new updated_on.
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION set_observations_updated_on() RETURNS trigger AS $$
+        BEGIN
+            NEW.updated_on := timezone('utc', clock_timestamp());
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER trg_observations_set_updated_on
+        BEFORE UPDATE ON observations
+        FOR EACH ROW
+        EXECUTE FUNCTION set_observations_updated_on()
+        """
+    )
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION set_users_updated_at() RETURNS trigger AS $$
+        BEGIN
+            NEW.updated_at := timezone('utc', clock_timestamp());
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER trg_users_set_updated_at
+        BEFORE UPDATE ON users
+        FOR EACH ROW
+        EXECUTE FUNCTION set_users_updated_at()
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS trg_users_set_updated_at ON users")
+    op.execute("DROP FUNCTION IF EXISTS set_users_updated_at()")
+    op.execute("DROP TRIGGER IF EXISTS trg_observations_set_updated_on ON observations")
+    op.execute("DROP FUNCTION IF EXISTS set_observations_updated_on()")
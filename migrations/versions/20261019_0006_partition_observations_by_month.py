@@ -0,0 +1,138 @@
+"""partition observations by month
+
+Revision ID: 20261019_0006
+Revises: 20261019_0005
+Create Date: 2026-10-19 15:03:48.271954
+"""
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+from backend.utils.online_migrations import set_migration_timeouts
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20261019_0006'
+down_revision: str | None = '20261019_0005'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def _restore_constraints_and_triggers(primary_key: str) -> None:
+    # Indexes and constraints are created after the rows are copied, which is faster than maintaining them row by row
+    op.execute(f"ALTER TABLE observations ADD CONSTRAINT observations_pkey PRIMARY KEY ({primary_key})")
+    op.execute("ALTER TABLE observations ADD CONSTRAINT observations_user_id_fkey FOREIGN KEY (user_id) REFERENCES users (id)")
+    op.execute("CREATE INDEX ix_observations_user_id_updated_on ON observations (user_id, updated_on)")
+    op.execute(
+        """
+        CREATE TRIGGER trg_observations_set_updated_on
+        BEFORE UPDATE ON observations
+        FOR EACH ROW
+        EXECUTE FUNCTION set_observations_updated_on()
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER trg_observations_notify_status_change
+        AFTER UPDATE OF status ON observations
+        FOR EACH ROW
+        WHEN (OLD.status IS DISTINCT FROM NEW.status)
+        EXECUTE FUNCTION notify_observation_status_change()
+        """
+    )
+
+
+def _swap_in(new_table: str) -> None:
+    # The id sequence outlives the old table and keeps numbering the rows of the new one
+    op.execute("ALTER SEQUENCE observations_id_seq OWNED BY NONE")
+    op.execute("DROP TABLE observations")
+    op.execute(f"ALTER TABLE {new_table} RENAME TO observations")
+    op.execute("ALTER SEQUENCE observations_id_seq OWNED BY observations.id")
+
+
+def upgrade() -> None:
+    # Rows are copied into a table partitioned by month of created_on. Writes wait for the copy (reads do not), so on a
+    # large table run it when few observations are submitted.
+    set_migration_timeouts(statement_timeout=0)
+    op.execute("LOCK TABLE observations IN SHARE MODE")
+    op.execute(
+        """
+        CREATE TABLE observations_partitioned (LIKE observations INCLUDING DEFAULTS INCLUDING CONSTRAINTS)
+        PARTITION BY RANGE (created_on)
+        """
+    )
+    # Catches rows of months without a partition, so submissions never fail when `backend-db create-partitions` fell behind
+    op.execute("CREATE TABLE observations_default PARTITION OF observations_partitioned DEFAULT")
+    op.execute(
+        """
+        DO $$
+        DECLARE
+            month timestamp;
+        BEGIN
+            FOR month IN
+                SELECT generate_series(
+                    date_trunc('month', least(min(created_on), timezone('utc', now()))),
+                    date_trunc('month', timezone('utc', now())) + interval '3 months',
+                    interval '1 month'
+                )
+                FROM observations
+            LOOP
+                EXECUTE format(
+                    'CREATE TABLE %I PARTITION OF observations_partitioned FOR VALUES FROM (%L) TO (%L)',
+                    'observations_' || to_char(month, 'YYYY_MM'), month, month + interval '1 month'
+                );
+            END LOOP;
+        END
+        $$
+        """
+    )
+    op.execute("INSERT INTO observations_partitioned SELECT * FROM observations")
+    _swap_in("observations_partitioned")
+
+    # The primary key of a partitioned table has to include the partition key, ids stay unique through the sequence
+    _restore_constraints_and_triggers("id, created_on")
+    # Only the queue is scanned by the processor, so its index stays small however many months are kept
+    op.execute("CREATE INDEX ix_observations_pending_created_on ON observations (created_on) WHERE status = 'PENDING'")
+
+    # Used by `backend-db create-partitions`: creates the partition of a month, moving its rows out of the default
+    # partition first. Returns NULL when the partition already exists.
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION create_observations_partition(month date) RETURNS text AS $$
+        DECLARE
+            lower_bound timestamp := date_trunc('month', month);
+            upper_bound timestamp := date_trunc('month', month) + interval '1 month';
+            partition_name text := 'observations_' || to_char(month, 'YYYY_MM');
+        BEGIN
+            IF to_regclass(partition_name) IS NOT NULL THEN
+                RETURN NULL;
+            END IF;
+            EXECUTE format('CREATE TABLE %I (LIKE observations INCLUDING DEFAULTS INCLUDING CONSTRAINTS)', partition_name);
+            EXECUTE format(
+                'WITH moved AS (DELETE FROM observations_default WHERE created_on >= %L AND created_on < %L RETURNING *) '
+                'INSERT INTO %I SELECT * FROM moved',
+                lower_bound, upper_bound, partition_name
+            );
+            EXECUTE format(
+                'ALTER TABLE observations ATTACH PARTITION %I FOR VALUES FROM (%L) TO (%L)',
+                partition_name, lower_bound, upper_bound
+            );
+            RETURN partition_name;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute("ANALYZE observations")
+
+
+def downgrade() -> None:
+    # Partitions detached by `backend-db archive-partitions` are not copied back
+    set_migration_timeouts(statement_timeout=0)
+    op.execute("LOCK TABLE observations IN SHARE MODE")
+    op.execute("DROP FUNCTION IF EXISTS create_observations_partition(date)")
+    op.execute("CREATE TABLE observations_unpartitioned (LIKE observations INCLUDING DEFAULTS INCLUDING CONSTRAINTS)")
+    op.execute("INSERT INTO observations_unpartitioned SELECT * FROM observations")
+    _swap_in("observations_unpartitioned")
+    _restore_constraints_and_triggers("id")
+    op.execute("ANALYZE observations")
@@ -0,0 +1,191 @@
+"""add observation counters
+
+Revision ID: 20261019_0007
+Revises: 20261019_0006
+Create Date: 2026-10-19 16:41:12.903518
+"""
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from backend.utils.online_migrations import set_migration_timeouts
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20261019_0007'
+down_revision: str | None = '20261019_0006'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+STATUS = postgresql.ENUM('PENDING', 'IN_PROGRESS', 'COMPLETED', 'FAILED', 'CANCELLED', name='observationstatusenum', create_type=False)
+
+# Upserts adding the `delta` column of the rows selected by `{deltas}` to the counters. Rows are upserted in key order,
+# so concurrent statements lock shared counter rows in the same order instead of deadlocking. Global counters are
+# sharded by `id % 16` (`COUNTER_SHARDS`), so concurrent submissions rarely wait for each other's counter row.
+USER_COUNTS_UPSERT = """
+    INSERT INTO observation_user_counts AS c (user_id, status, count)
+    SELECT user_id, status, sum(delta) FROM ({deltas}) d GROUP BY user_id, status ORDER BY user_id, status
+    ON CONFLICT (user_id, status) DO UPDATE SET count = c.count + EXCLUDED.count
+"""
+STATUS_COUNTS_UPSERT = """
+    INSERT INTO observation_status_counts AS c (status, shard, count)
+    SELECT status, id % 16, sum(delta) FROM ({deltas}) d GROUP BY 1, 2 ORDER BY 1, 2
+    ON CONFLICT (status, shard) DO UPDATE SET count = c.count + EXCLUDED.count
+"""
+DAILY_COUNTS_UPSERT = """
+    INSERT INTO observation_daily_counts AS c (day, shard, count)
+    SELECT created_on::date, id % 16, sum(delta) FROM ({deltas}) d GROUP BY 1, 2 ORDER BY 1, 2
+    ON CONFLICT (day, shard) DO UPDATE SET count = c.count + EXCLUDED.count
+"""
+
+
+def _counting_function(name: str, deltas: str, upserts: tuple[str, ...]) -> str:
+    statements = ";\n".join(upsert.format(deltas=deltas) for upsert in upserts)
+    return f"""
+        CREATE OR REPLACE FUNCTION {name}() RETURNS trigger AS $$
+        BEGIN
+            {statements};
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """
+
+
+def upgrade() -> None:
+    op.create_table('observation_user_counts',
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('status', STATUS, nullable=False),
+    sa.Column('count', sa.BigInteger(), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('user_id', 'status')
+    )
+    op.create_table('observation_status_counts',
+    sa.Column('status', STATUS, nullable=False),
+    sa.Column('shard', sa.SmallInteger(), nullable=False),
+    sa.Column('count', sa.BigInteger(), nullable=False),
+    sa.PrimaryKeyConstraint('status', 'shard')
+    )
+    op.create_table('observation_daily_counts',
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('shard', sa.SmallInteger(), nullable=False),
+    sa.Column('count', sa.BigInteger(), nullable=False),
+    sa.PrimaryKeyConstraint('day', 'shard')
+    )
+
+    # Statement-level triggers count the rows of a whole INSERT (a batch submission, a schedule import, a COPY) with
+    # one upsert per counter row instead of one per observation
+    op.execute(
+        _counting_function(
+            "count_inserted_observations",
+            "SELECT *, 1 AS delta FROM new_rows",
+            (USER_COUNTS_UPSERT, STATUS_COUNTS_UPSERT, DAILY_COUNTS_UPSERT),
+        )
+    )
+    op.execute(
+        _counting_function(
+            "count_deleted_observations",
+            "SELECT *, -1 AS delta FROM old_rows",
+            (USER_COUNTS_UPSERT, STATUS_COUNTS_UPSERT, DAILY_COUNTS_UPSERT),
+        )
+    )
+    op.execute(
+        _counting_function(
+            "count_observation_status_changes",
+            """
+            SELECT n.user_id, n.status, n.id, 1 AS delta FROM new_rows n JOIN old_rows o ON o.id = n.id WHERE o.status <> n.status
+            UNION ALL
+            SELECT o.user_id, o.status, o.id, -1 AS delta FROM new_rows n JOIN old_rows o ON o.id = n.id WHERE o.status <> n.status
+            """,
+            (USER_COUNTS_UPSERT, STATUS_COUNTS_UPSERT),
+        )
+    )
+    # Transition tables rule out column lists and multiple events, so every event has its own trigger
+    op.execute(
+        """
+        CREATE TRIGGER trg_observations_count_inserts
+        AFTER INSERT ON observations
+        REFERENCING NEW TABLE AS new_rows
+        FOR EACH STATEMENT
+        EXECUTE FUNCTION count_inserted_observations()
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER trg_observations_count_deletes
+        AFTER DELETE ON observations
+        REFERENCING OLD TABLE AS old_rows
+        FOR EACH STATEMENT
+        EXECUTE FUNCTION count_deleted_observations()
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER trg_observations_count_status_changes
+        AFTER UPDATE ON observations
+        REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+        FOR EACH STATEMENT
+        EXECUTE FUNCTION count_observation_status_changes()
+        """
+    )
+
+    # Used by `backend-db archive-partitions`: removes the observations of a detached partition from the counters
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION uncount_observation_partition(partition_table regclass) RETURNS void AS $$
+        BEGIN
+            EXECUTE format($sql$
+                UPDATE observation_user_counts c SET count = c.count - p.count
+                FROM (SELECT user_id, status, count(*) AS count FROM %s GROUP BY user_id, status) p
+                WHERE c.user_id = p.user_id AND c.status = p.status
+            $sql$, partition_table);
+            EXECUTE format($sql$
+                UPDATE observation_status_counts c SET count = c.count - p.count
+                FROM (SELECT status, id %% 16 AS shard, count(*) AS count FROM %s GROUP BY 1, 2) p
+                WHERE c.status = p.status AND c.shard = p.shard
+            $sql$, partition_table);
+            EXECUTE format($sql$
+                DELETE FROM observation_daily_counts c
+                USING (SELECT DISTINCT created_on::date AS day FROM %s) p
+                WHERE c.day = p.day
+            $sql$, partition_table);
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+
+    # Count the existing observations, with writes paused so no observation is counted twice or missed
+    set_migration_timeouts(statement_timeout=0)
+    op.execute("LOCK TABLE observations IN SHARE MODE")
+    op.execute(
+        """
+        INSERT INTO observation_user_counts (user_id, status, count)
+        SELECT user_id, status, count(*) FROM observations GROUP BY user_id, status
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO observation_status_counts (status, shard, count)
+        SELECT status, id % 16, count(*) FROM observations GROUP BY 1, 2
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO observation_daily_counts (day, shard, count)
+        SELECT created_on::date, id % 16, count(*) FROM observations GROUP BY 1, 2
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP FUNCTION IF EXISTS uncount_observation_partition(regclass)")
+    op.execute("DROP TRIGGER IF EXISTS trg_observations_count_status_changes ON observations")
+    op.execute("DROP TRIGGER IF EXISTS trg_observations_count_deletes ON observations")
+    op.execute("DROP TRIGGER IF EXISTS trg_observations_count_inserts ON observations")
+    op.execute("DROP FUNCTION IF EXISTS count_observation_status_changes()")
+    op.execute("DROP FUNCTION IF EXISTS count_deleted_observations()")
+    op.execute("DROP FUNCTION IF EXISTS count_inserted_observations()")
+    op.drop_table('observation_daily_counts')
+    op.drop_table('observation_status_counts')
+    op.drop_table('observation_user_counts')
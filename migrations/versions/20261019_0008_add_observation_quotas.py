@@ -0,0 +1,82 @@
+"""add observation quotas
+
+Revision ID: 20261019_0008
+Revises: 20261019_0007
+Create Date: 2026-10-19 18:12:37.506281
+"""
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20261019_0008'
+down_revision: str | None = '20261019_0007'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table('observation_quota_usage',
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('integration_time', sa.Float(), nullable=False),
+    sa.Column('pending', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('user_id', 'day')
+    )
+
+    # Submissions reserve quota in the application (`backend.utils.quotas`), observations leaving the queue release it
+    # here, whatever changes their status: cancellation, the processor or an ad-hoc UPDATE. Integration time is only
+    # given back for cancelled observations, completed and failed ones used the telescope. Usage never goes below zero,
+    # observations imported from schedules are not charged for but are released like any other.
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION release_observation_quota() RETURNS trigger AS $$
+        BEGIN
+            UPDATE observation_quota_usage q
+            SET pending = greatest(q.pending - r.pending, 0),
+                integration_time = greatest(q.integration_time - r.integration_time, 0)
+            FROM (
+                SELECT o.user_id, o.created_on::date AS day, count(*) AS pending,
+                       coalesce(sum(o.integration_time) FILTER (WHERE n.status = 'CANCELLED'), 0) AS integration_time
+                FROM old_rows o JOIN new_rows n ON n.id = o.id
+                WHERE o.status = 'PENDING' AND n.status <> 'PENDING'
+                GROUP BY 1, 2
+            ) r
+            WHERE q.user_id = r.user_id AND q.day = r.day;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER trg_observations_release_quota
+        AFTER UPDATE ON observations
+        REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+        FOR EACH STATEMENT
+        EXECUTE FUNCTION release_observation_quota()
+        """
+    )
+
+    # Today's observations already count against today's quota
+    op.execute("LOCK TABLE observations IN SHARE MODE")
+    op.execute(
+        """
+        INSERT INTO observation_quota_usage (user_id, day, integration_time, pending)
+        SELECT user_id, created_on::date,
+               coalesce(sum(integration_time) FILTER (WHERE status <> 'CANCELLED'), 0),
+               count(*) FILTER (WHERE status = 'PENDING')
+        FROM observations
+        WHERE created_on >= date_trunc('day', timezone('utc', now()))
+        GROUP BY 1, 2
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS trg_observations_release_quota ON observations")
+    op.execute("DROP FUNCTION IF EXISTS release_observation_quota()")
+    op.drop_table('observation_quota_usage')
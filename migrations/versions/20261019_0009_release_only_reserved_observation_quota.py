@@ -0,0 +1,53 @@
+"""release only reserved observation quota
+
+Revision ID: 20261019_0009
+Revises: 20261019_0008
+Create Date: 2026-10-19 21:03:48.219764
+"""
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20261019_0009'
+down_revision: str | None = '20261019_0008'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Gives back the quota of observations leaving the queue, see migration 20261019_0008. `{reserved}` restricts the rows
+# released.
+RELEASE_FUNCTION = """
+    CREATE OR REPLACE FUNCTION release_observation_quota() RETURNS trigger AS $$
+    BEGIN
+        UPDATE observation_quota_usage q
+        SET pending = greatest(q.pending - r.pending, 0),
+            integration_time = greatest(q.integration_time - r.integration_time, 0)
+        FROM (
+            SELECT o.user_id, o.created_on::date AS day, count(*) AS pending,
+                   coalesce(sum(o.integration_time) FILTER (WHERE n.status = 'CANCELLED'), 0) AS integration_time
+            FROM old_rows o JOIN new_rows n ON n.id = o.id
+            WHERE o.status = 'PENDING' AND n.status <> 'PENDING'{reserved}
+            GROUP BY 1, 2
+        ) r
+        WHERE q.user_id = r.user_id AND q.day = r.day;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+"""
+
+
+def upgrade() -> None:
+    # Observations imported from schedules or seeded never reserved quota, so leaving the queue must not release the
+    # quota other submissions of their user reserved. Only API submissions set the flag. Existing rows were all released
+    # so far and the 20261019_0008 backfill counted today's, so they are added as reserved: with a constant default the
+    # column is only recorded in the catalog, without rewriting the partitions. New rows then default to unreserved.
+    op.add_column('observations', sa.Column('quota_reserved', sa.Boolean(), server_default=sa.true(), nullable=False))
+    op.alter_column('observations', 'quota_reserved', server_default=sa.false())
+    op.execute(RELEASE_FUNCTION.format(reserved=" AND o.quota_reserved"))
+
+
+def downgrade() -> None:
+    op.execute(RELEASE_FUNCTION.format(reserved=""))
+    op.drop_column('observations', 'quota_reserved')
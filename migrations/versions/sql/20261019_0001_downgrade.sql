@@ -0,0 +1,14 @@
+-- Downgrade SQL for revision 20261019_0001
+
+BEGIN;
+
+-- Running downgrade 20261019_0001 -> 20260601_0002
+
+DROP TRIGGER IF EXISTS trg_observations_notify_status_change ON observations;
+
+DROP FUNCTION IF EXISTS notify_observation_status_change();
+
+UPDATE alembic_version SET version_num='20260601_0002' WHERE alembic_version.version_num = '20261019_0001';
+
+COMMIT;
+
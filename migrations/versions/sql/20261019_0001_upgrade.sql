@@ -0,0 +1,32 @@
+-- Upgrade SQL for revision 20261019_0001
+
+BEGIN;
+
+-- Running upgrade 20260601_0002 -> 20261019_0001
+
+CREATE OR REPLACE FUNCTION notify_observation_status_change() RETURNS trigger AS $$
+        BEGIN
+            PERFORM pg_notify(
+                'observation_status',
+                json_build_object(
+                    'id', NEW.id,
+                    'user_id', NEW.user_id,
+                    'status', NEW.status,
+                    'previous_status', OLD.status,
+                    'updated_on', NEW.updated_on
+                )::text
+            );
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql;
+
+CREATE TRIGGER trg_observations_notify_status_change
+        AFTER UPDATE OF status ON observations
+        FOR EACH ROW
+        WHEN (OLD.status IS DISTINCT FROM NEW.status)
+        EXECUTE FUNCTION notify_observation_status_change();
+
+UPDATE alembic_version SET version_num='20261019_0001' WHERE alembic_version.version_num = '20260601_0002';
+
+COMMIT;
+
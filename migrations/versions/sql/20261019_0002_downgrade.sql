@@ -0,0 +1,12 @@
+-- Downgrade SQL for revision 20261019_0002
+
+BEGIN;
+
+-- Running downgrade 20261019_0002 -> 20261019_0001
+
+DROP INDEX ix_observations_user_id_updated_on;
+
+UPDATE alembic_version SET version_num='20261019_0001' WHERE alembic_version.version_num = '20261019_0002';
+
+COMMIT;
+
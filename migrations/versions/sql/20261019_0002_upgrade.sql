@@ -0,0 +1,12 @@
+-- Upgrade SQL for revision 20261019_0002
+
+BEGIN;
+
+-- Running upgrade 20261019_0001 -> 20261019_0002
+
+CREATE INDEX ix_observations_user_id_updated_on ON observations (user_id, updated_on);
+
+UPDATE alembic_version SET version_num='20261019_0002' WHERE alembic_version.version_num = '20261019_0001';
+
+COMMIT;
+
@@ -0,0 +1,16 @@
+-- Downgrade SQL for revision 20261019_0003
+
+BEGIN;
+
+-- Running downgrade 20261019_0003 -> 20261019_0002
+
+DROP INDEX ix_idempotency_keys_expires_on;
+
+DROP INDEX ix_idempotency_keys_scope_key;
+
+DROP TABLE idempotency_keys;
+
+UPDATE alembic_version SET version_num='20261019_0002' WHERE alembic_version.version_num = '20261019_0003';
+
+COMMIT;
+
@@ -0,0 +1,26 @@
+-- Upgrade SQL for revision 20261019_0003
+
+BEGIN;
+
+-- Running upgrade 20261019_0002 -> 20261019_0003
+
+CREATE TABLE idempotency_keys (
+    id SERIAL NOT NULL, 
+    scope VARCHAR(255) NOT NULL, 
+    key VARCHAR(255) NOT NULL, 
+    request_fingerprint VARCHAR(64) NOT NULL, 
+    status_code INTEGER NOT NULL, 
+    response_body JSONB NOT NULL, 
+    created_on TIMESTAMP WITHOUT TIME ZONE NOT NULL, 
+    expires_on TIMESTAMP WITHOUT TIME ZONE NOT NULL, 
+    PRIMARY KEY (id)
+);
+
+CREATE UNIQUE INDEX ix_idempotency_keys_scope_key ON idempotency_keys (scope, key);
+
+CREATE INDEX ix_idempotency_keys_expires_on ON idempotency_keys (expires_on);
+
+UPDATE alembic_version SET version_num='20261019_0003' WHERE alembic_version.version_num = '20261019_0002';
+
+COMMIT;
+
@@ -0,0 +1,12 @@
+-- Downgrade SQL for revision 20261019_0004
+
+BEGIN;
+
+-- Running downgrade 20261019_0004 -> 20261019_0003
+
+DROP TABLE rate_limit_buckets;
+
+UPDATE alembic_version SET version_num='20261019_0003' WHERE alembic_version.version_num = '20261019_0004';
+
+COMMIT;
+
@@ -0,0 +1,18 @@
+-- Upgrade SQL for revision 20261019_0004
+
+BEGIN;
+
+-- Running upgrade 20261019_0003 -> 20261019_0004
+
+CREATE UNLOGGED TABLE rate_limit_buckets (
+    key VARCHAR(320) NOT NULL, 
+    tokens FLOAT NOT NULL, 
+    allowed BOOLEAN NOT NULL, 
+    updated_on TIMESTAMP WITHOUT TIME ZONE NOT NULL, 
+    PRIMARY KEY (key)
+);
+
+UPDATE alembic_version SET version_num='20261019_0004' WHERE alembic_version.version_num = '20261019_0003';
+
+COMMIT;
+
@@ -0,0 +1,18 @@
+-- Downgrade SQL for revision 20261019_0005
+
+BEGIN;
+
+-- Running downgrade 20261019_0005 -> 20261019_0004
+
+DROP TRIGGER IF EXISTS trg_users_set_updated_at ON users;
+
+DROP FUNCTION IF EXISTS set_users_updated_at();
+
+DROP TRIGGER IF EXISTS trg_observations_set_updated_on ON observations;
+
+DROP FUNCTION IF EXISTS set_observations_updated_on();
+
+UPDATE alembic_version SET version_num='20261019_0004' WHERE alembic_version.version_num = '20261019_0005';
+
+COMMIT;
+
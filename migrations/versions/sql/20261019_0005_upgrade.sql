@@ -0,0 +1,34 @@
+-- Upgrade SQL for revision 20261019_0005
+
+BEGIN;
+
+-- Running upgrade 20261019_0004 -> 20261019_0005
+
+CREATE OR REPLACE FUNCTION set_observations_updated_on() RETURNS trigger AS $$
+        BEGIN
+            NEW.updated_on := timezone('utc', clock_timestamp());
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql;
+
+CREATE TRIGGER trg_observations_set_updated_on
+        BEFORE UPDATE ON observations
+        FOR EACH ROW
+        EXECUTE FUNCTION set_observations_updated_on();
+
+CREATE OR REPLACE FUNCTION set_users_updated_at() RETURNS trigger AS $$
+        BEGIN
+            NEW.updated_at := timezone('utc', clock_timestamp());
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql;
+
+CREATE TRIGGER trg_users_set_updated_at
+        BEFORE UPDATE ON users
+        FOR EACH ROW
+        EXECUTE FUNCTION set_users_updated_at();
+
+UPDATE alembic_version SET version_num='20261019_0005' WHERE alembic_version.version_num = '20261019_0004';
+
+COMMIT;
+
@@ -0,0 +1,47 @@
+-- Downgrade SQL for revision 20261019_0006
+
+BEGIN;
+
+-- Running downgrade 20261019_0006 -> 20261019_0005
+
+SET LOCAL statement_timeout = 0;
+
+LOCK TABLE observations IN SHARE MODE;
+
+DROP FUNCTION IF EXISTS create_observations_partition(date);
+
+CREATE TABLE observations_unpartitioned (LIKE observations INCLUDING DEFAULTS INCLUDING CONSTRAINTS);
+
+INSERT INTO observations_unpartitioned SELECT * FROM observations;
+
+ALTER SEQUENCE observations_id_seq OWNED BY NONE;
+
+DROP TABLE observations;
+
+ALTER TABLE observations_unpartitioned RENAME TO observations;
+
+ALTER SEQUENCE observations_id_seq OWNED BY observations.id;
+
+ALTER TABLE observations ADD CONSTRAINT observations_pkey PRIMARY KEY (id);
+
+ALTER TABLE observations ADD CONSTRAINT observations_user_id_fkey FOREIGN KEY (user_id) REFERENCES users (id);
+
+CREATE INDEX ix_observations_user_id_updated_on ON observations (user_id, updated_on);
+
+CREATE TRIGGER trg_observations_set_updated_on
+        BEFORE UPDATE ON observations
+        FOR EACH ROW
+        EXECUTE FUNCTION set_observations_updated_on();
+
+CREATE TRIGGER trg_observations_notify_status_change
+        AFTER UPDATE OF status ON observations
+        FOR EACH ROW
+        WHEN (OLD.status IS DISTINCT FROM NEW.status)
+        EXECUTE FUNCTION notify_observation_status_change();
+
+ANALYZE observations;
+
+UPDATE alembic_version SET version_num='20261019_0005' WHERE alembic_version.version_num = '20261019_0006';
+
+COMMIT;
+
@@ -0,0 +1,93 @@
+-- Upgrade SQL for revision 20261019_0006
+
+BEGIN;
+
+-- Running upgrade 20261019_0005 -> 20261019_0006
+
+SET LOCAL statement_timeout = 0;
+
+LOCK TABLE observations IN SHARE MODE;
+
+CREATE TABLE observations_partitioned (LIKE observations INCLUDING DEFAULTS INCLUDING CONSTRAINTS)
+        PARTITION BY RANGE (created_on);
+
+CREATE TABLE observations_default PARTITION OF observations_partitioned DEFAULT;
+
+DO $$
+        DECLARE
+            month timestamp;
+        BEGIN
+            FOR month IN
+                SELECT generate_series(
+                    date_trunc('month', least(min(created_on), timezone('utc', now()))),
+                    date_trunc('month', timezone('utc', now())) + interval '3 months',
+                    interval '1 month'
+                )
+                FROM observations
+            LOOP
+                EXECUTE format(
+                    'CREATE TABLE %I PARTITION OF observations_partitioned FOR VALUES FROM (%L) TO (%L)',
+                    'observations_' || to_char(month, 'YYYY_MM'), month, month + interval '1 month'
+                );
+            END LOOP;
+        END
+        $$;
+
+INSERT INTO observations_partitioned SELECT * FROM observations;
+
+ALTER SEQUENCE observations_id_seq OWNED BY NONE;
+
+DROP TABLE observations;
+
+ALTER TABLE observations_partitioned RENAME TO observations;
+
+ALTER SEQUENCE observations_id_seq OWNED BY observations.id;
+
+ALTER TABLE observations ADD CONSTRAINT observations_pkey PRIMARY KEY (id, created_on);
+
+ALTER TABLE observations ADD CONSTRAINT observations_user_id_fkey FOREIGN KEY (user_id) REFERENCES users (id);
+
+CREATE INDEX ix_observations_user_id_updated_on ON observations (user_id, updated_on);
+
+CREATE TRIGGER trg_observations_set_updated_on
+        BEFORE UPDATE ON observations
+        FOR EACH ROW
+        EXECUTE FUNCTION set_observations_updated_on();
+
+CREATE TRIGGER trg_observations_notify_status_change
+        AFTER UPDATE OF status ON observations
+        FOR EACH ROW
+        WHEN (OLD.status IS DISTINCT FROM NEW.status)
+        EXECUTE FUNCTION notify_observation_status_change();
+
+CREATE INDEX ix_observations_pending_created_on ON observations (created_on) WHERE status = 'PENDING';
+
+CREATE OR REPLACE FUNCTION create_observations_partition(month date) RETURNS text AS $$
+        DECLARE
+            lower_bound timestamp := date_trunc('month', month);
+            upper_bound timestamp := date_trunc('month', month) + interval '1 month';
+            partition_name text := 'observations_' || to_char(month, 'YYYY_MM');
+        BEGIN
+            IF to_regclass(partition_name) IS NOT NULL THEN
+                RETURN NULL;
+            END IF;
+            EXECUTE format('CREATE TABLE %I (LIKE observations INCLUDING DEFAULTS INCLUDING CONSTRAINTS)', partition_name);
+            EXECUTE format(
+                'WITH moved AS (DELETE FROM observations_default WHERE created_on >= %L AND created_on < %L RETURNING *) '
+                'INSERT INTO %I SELECT * FROM moved',
+                lower_bound, upper_bound, partition_name
+            );
+            EXECUTE format(
+                'ALTER TABLE observations ATTACH PARTITION %I FOR VALUES FROM (%L) TO (%L)',
+                partition_name, lower_bound, upper_bound
+            );
+            RETURN partition_name;
+        END;
+        $$ LANGUAGE plpgsql;
+
+ANALYZE observations;
+
+UPDATE alembic_version SET version_num='20261019_0006' WHERE alembic_version.version_num = '20261019_0005';
+
+COMMIT;
+
@@ -0,0 +1,30 @@
+-- Downgrade SQL for revision 20261019_0007
+
+BEGIN;
+
+-- Running downgrade 20261019_0007 -> 20261019_0006
+
+DROP FUNCTION IF EXISTS uncount_observation_partition(regclass);
+
+DROP TRIGGER IF EXISTS trg_observations_count_status_changes ON observations;
+
+DROP TRIGGER IF EXISTS trg_observations_count_deletes ON observations;
+
+DROP TRIGGER IF EXISTS trg_observations_count_inserts ON observations;
+
+DROP FUNCTION IF EXISTS count_observation_status_changes();
+
+DROP FUNCTION IF EXISTS count_deleted_observations();
+
+DROP FUNCTION IF EXISTS count_inserted_observations();
+
+DROP TABLE observation_daily_counts;
+
+DROP TABLE observation_status_counts;
+
+DROP TABLE observation_user_counts;
+
+UPDATE alembic_version SET version_num='20261019_0006' WHERE alembic_version.version_num = '20261019_0007';
+
+COMMIT;
+
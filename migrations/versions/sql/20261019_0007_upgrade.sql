@@ -0,0 +1,149 @@
+-- Upgrade SQL for revision 20261019_0007
+
+BEGIN;
+
+-- Running upgrade 20261019_0006 -> 20261019_0007
+
+CREATE TABLE observation_user_counts (
+    user_id INTEGER NOT NULL, 
+    status observationstatusenum NOT NULL, 
+    count BIGINT NOT NULL, 
+    PRIMARY KEY (user_id, status), 
+    FOREIGN KEY(user_id) REFERENCES users (id)
+);
+
+CREATE TABLE observation_status_counts (
+    status observationstatusenum NOT NULL, 
+    shard SMALLINT NOT NULL, 
+    count BIGINT NOT NULL, 
+    PRIMARY KEY (status, shard)
+);
+
+CREATE TABLE observation_daily_counts (
+    day DATE NOT NULL, 
+    shard SMALLINT NOT NULL, 
+    count BIGINT NOT NULL, 
+    PRIMARY KEY (day, shard)
+);
+
+CREATE OR REPLACE FUNCTION count_inserted_observations() RETURNS trigger AS $$
+        BEGIN
+            
+    INSERT INTO observation_user_counts AS c (user_id, status, count)
+    SELECT user_id, status, sum(delta) FROM (SELECT *, 1 AS delta FROM new_rows) d GROUP BY user_id, status ORDER BY user_id, status
+    ON CONFLICT (user_id, status) DO UPDATE SET count = c.count + EXCLUDED.count
+;
+
+    INSERT INTO observation_status_counts AS c (status, shard, count)
+    SELECT status, id % 16, sum(delta) FROM (SELECT *, 1 AS delta FROM new_rows) d GROUP BY 1, 2 ORDER BY 1, 2
+    ON CONFLICT (status, shard) DO UPDATE SET count = c.count + EXCLUDED.count
+;
+
+    INSERT INTO observation_daily_counts AS c (day, shard, count)
+    SELECT created_on::date, id % 16, sum(delta) FROM (SELECT *, 1 AS delta FROM new_rows) d GROUP BY 1, 2 ORDER BY 1, 2
+    ON CONFLICT (day, shard) DO UPDATE SET count = c.count + EXCLUDED.count
+;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION count_deleted_observations() RETURNS trigger AS $$
+        BEGIN
+            
+    INSERT INTO observation_user_counts AS c (user_id, status, count)
+    SELECT user_id, status, sum(delta) FROM (SELECT *, -1 AS delta FROM old_rows) d GROUP BY user_id, status ORDER BY user_id, status
+    ON CONFLICT (user_id, status) DO UPDATE SET count = c.count + EXCLUDED.count
+;
+
+    INSERT INTO observation_status_counts AS c (status, shard, count)
+    SELECT status, id % 16, sum(delta) FROM (SELECT *, -1 AS delta FROM old_rows) d GROUP BY 1, 2 ORDER BY 1, 2
+    ON CONFLICT (status, shard) DO UPDATE SET count = c.count + EXCLUDED.count
+;
+
+    INSERT INTO observation_daily_counts AS c (day, shard, count)
+    SELECT created_on::date, id % 16, sum(delta) FROM (SELECT *, -1 AS delta FROM old_rows) d GROUP BY 1, 2 ORDER BY 1, 2
+    ON CONFLICT (day, shard) DO UPDATE SET count = c.count + EXCLUDED.count
+;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION count_observation_status_changes() RETURNS trigger AS $$
+        BEGIN
+            
+    INSERT INTO observation_user_counts AS c (user_id, status, count)
+    SELECT user_id, status, sum(delta) FROM (
+            SELECT n.user_id, n.status, n.id, 1 AS delta FROM new_rows n JOIN old_rows o ON o.id = n.id WHERE o.status <> n.status
+            UNION ALL
+            SELECT o.user_id, o.status, o.id, -1 AS delta FROM new_rows n JOIN old_rows o ON o.id = n.id WHERE o.status <> n.status
+            ) d GROUP BY user_id, status ORDER BY user_id, status
+    ON CONFLICT (user_id, status) DO UPDATE SET count = c.count + EXCLUDED.count
+;
+
+    INSERT INTO observation_status_counts AS c (status, shard, count)
+    SELECT status, id % 16, sum(delta) FROM (
+            SELECT n.user_id, n.status, n.id, 1 AS delta FROM new_rows n JOIN old_rows o ON o.id = n.id WHERE o.status <> n.status
+            UNION ALL
+            SELECT o.user_id, o.status, o.id, -1 AS delta FROM new_rows n JOIN old_rows o ON o.id = n.id WHERE o.status <> n.status
+            ) d GROUP BY 1, 2 ORDER BY 1, 2
+    ON CONFLICT (status, shard) DO UPDATE SET count = c.count + EXCLUDED.count
+;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+
+CREATE TRIGGER trg_observations_count_inserts
+        AFTER INSERT ON observations
+        REFERENCING NEW TABLE AS new_rows
+        FOR EACH STATEMENT
+        EXECUTE FUNCTION count_inserted_observations();
+
+CREATE TRIGGER trg_observations_count_deletes
+        AFTER DELETE ON observations
+        REFERENCING OLD TABLE AS old_rows
+        FOR EACH STATEMENT
+        EXECUTE FUNCTION count_deleted_observations();
+
+CREATE TRIGGER trg_observations_count_status_changes
+        AFTER UPDATE ON observations
+        REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+        FOR EACH STATEMENT
+        EXECUTE FUNCTION count_observation_status_changes();
+
+CREATE OR REPLACE FUNCTION uncount_observation_partition(partition_table regclass) RETURNS void AS $$
+        BEGIN
+            EXECUTE format($sql$
+                UPDATE observation_user_counts c SET count = c.count - p.count
+                FROM (SELECT user_id, status, count(*) AS count FROM %s GROUP BY user_id, status) p
+                WHERE c.user_id = p.user_id AND c.status = p.status
+            $sql$, partition_table);
+            EXECUTE format($sql$
+                UPDATE observation_status_counts c SET count = c.count - p.count
+                FROM (SELECT status, id %% 16 AS shard, count(*) AS count FROM %s GROUP BY 1, 2) p
+                WHERE c.status = p.status AND c.shard = p.shard
+            $sql$, partition_table);
+            EXECUTE format($sql$
+                DELETE FROM observation_daily_counts c
+                USING (SELECT DISTINCT created_on::date AS day FROM %s) p
+                WHERE c.day = p.day
+            $sql$, partition_table);
+        END;
+        $$ LANGUAGE plpgsql;
+
+SET LOCAL statement_timeout = 0;
+
+LOCK TABLE observations IN SHARE MODE;
+
+INSERT INTO observation_user_counts (user_id, status, count)
+        SELECT user_id, status, count(*) FROM observations GROUP BY user_id, status;
+
+INSERT INTO observation_status_counts (status, shard, count)
+        SELECT status, id % 16, count(*) FROM observations GROUP BY 1, 2;
+
+INSERT INTO observation_daily_counts (day, shard, count)
+        SELECT created_on::date, id % 16, count(*) FROM observations GROUP BY 1, 2;
+
+UPDATE alembic_version SET version_num='20261019_0007' WHERE alembic_version.version_num = '20261019_0006';
+
+COMMIT;
+
@@ -0,0 +1,16 @@
+-- Downgrade SQL for revision 20261019_0008
+
+BEGIN;
+
+-- Running downgrade 20261019_0008 -> 20261019_0007
+
+DROP TRIGGER IF EXISTS trg_observations_release_quota ON observations;
+
+DROP FUNCTION IF EXISTS release_observation_quota();
+
+DROP TABLE observation_quota_usage;
+
+UPDATE alembic_version SET version_num='20261019_0007' WHERE alembic_version.version_num = '20261019_0008';
+
+COMMIT;
+
@@ -0,0 +1,52 @@
+-- Upgrade SQL for revision 20261019_0008
+
+BEGIN;
+
+-- Running upgrade 20261019_0007 -> 20261019_0008
+
+CREATE TABLE observation_quota_usage (
+    user_id INTEGER NOT NULL, 
+    day DATE NOT NULL, 
+    integration_time FLOAT NOT NULL, 
+    pending INTEGER NOT NULL, 
+    PRIMARY KEY (user_id, day), 
+    FOREIGN KEY(user_id) REFERENCES users (id)
+);
+
+CREATE OR REPLACE FUNCTION release_observation_quota() RETURNS trigger AS $$
+        BEGIN
+            UPDATE observation_quota_usage q
+            SET pending = greatest(q.pending - r.pending, 0),
+                integration_time = greatest(q.integration_time - r.integration_time, 0)
+            FROM (
+                SELECT o.user_id, o.created_on::date AS day, count(*) AS pending,
+                       coalesce(sum(o.integration_time) FILTER (WHERE n.status = 'CANCELLED'), 0) AS integration_time
+                FROM old_rows o JOIN new_rows n ON n.id = o.id
+                WHERE o.status = 'PENDING' AND n.status <> 'PENDING'
+                GROUP BY 1, 2
+            ) r
+            WHERE q.user_id = r.user_id AND q.day = r.day;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+
+CREATE TRIGGER trg_observations_release_quota
+        AFTER UPDATE ON observations
+        REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+        FOR EACH STATEMENT
+        EXECUTE FUNCTION release_observation_quota();
+
+LOCK TABLE observations IN SHARE MODE;
+
+INSERT INTO observation_quota_usage (user_id, day, integration_time, pending)
+        SELECT user_id, created_on::date,
+               coalesce(sum(integration_time) FILTER (WHERE status <> 'CANCELLED'), 0),
+               count(*) FILTER (WHERE status = 'PENDING')
+        FROM observations
+        WHERE created_on >= date_trunc('day', timezone('utc', now()))
+        GROUP BY 1, 2;
+
+UPDATE alembic_version SET version_num='20261019_0008' WHERE alembic_version.version_num = '20261019_0007';
+
+COMMIT;
+
@@ -0,0 +1,31 @@
+-- Upgrade SQL for revision 20261019_0009
+
+BEGIN;
+
+-- Running upgrade 20261019_0008 -> 20261019_0009
+
+ALTER TABLE observations ADD COLUMN quota_reserved BOOLEAN DEFAULT true NOT NULL;
+
+ALTER TABLE observations ALTER COLUMN quota_reserved SET DEFAULT false;
+
+CREATE OR REPLACE FUNCTION release_observation_quota() RETURNS trigger AS $$
+    BEGIN
+        UPDATE observation_quota_usage q
+        SET pending = greatest(q.pending - r.pending, 0),
+            integration_time = greatest(q.integration_time - r.integration_time, 0)
+        FROM (
+            SELECT o.user_id, o.created_on::date AS day, count(*) AS pending,
+                   coalesce(sum(o.integration_time) FILTER (WHERE n.status = 'CANCELLED'), 0) AS integration_time
+            FROM old_rows o JOIN new_rows n ON n.id = o.id
+            WHERE o.status = 'PENDING' AND n.status <> 'PENDING' AND o.quota_reserved
+            GROUP BY 1, 2
+        ) r
+        WHERE q.user_id = r.user_id AND q.day = r.day;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+
+UPDATE alembic_version SET version_num='20261019_0009' WHERE alembic_version.version_num = '20261019_0008';
+
+COMMIT;
+
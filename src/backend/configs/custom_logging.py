@@ -1,26 +1,130 @@
+import atexit
+import copy
+import json
 import logging
-from logging.handlers import RotatingFileHandler
+import queue
+from collections import Counter
+from datetime import UTC, datetime
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 
+from backend.configs.config import settings
+
 LOGFILES_DIR_NAME = ".logs"
 
+# Background listeners per logger name, stopped (and drained) at interpreter exit
+_queue_listeners: dict[str, QueueListener] = {}
+
+
+class JsonFormatter(logging.Formatter):
+    """Format records as single-line JSON objects for log shippers."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "timestamp": datetime.fromtimestamp(record.created, tz=UTC).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "thread": record.threadName,
+            "module": record.module,
+            "line": record.lineno,
+            "message": record.getMessage(),
+        }
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+
+        return json.dumps(entry, ensure_ascii=False)
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Keep only every n-th INFO/DEBUG record emitted from the same logging call site.
+
+    Warnings and errors are never sampled, and the first record of every call site is always kept.
+    """
+
+    def __init__(self, sample_every: int) -> None:
+        super().__init__()
+        self.sample_every = sample_every
+        self._seen: Counter[tuple[str, int]] = Counter()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if self.sample_every <= 1 or record.levelno >= logging.WARNING:
+            return True
+
+        key = (record.pathname, record.lineno)
+        count = self._seen[key]
+        self._seen[key] = count + 1
+        return count % self.sample_every == 0
+
+
+class _DeferredFormattingQueueHandler(QueueHandler):
+    """
+    Queue handler leaving the formatting to the handlers behind the listener.
+
+    The default `QueueHandler.prepare` formats the whole record (including tracebacks) into the message,
+    which would bake the text layout into JSON output. Only the message arguments and the traceback are resolved here,
+    as they may reference objects that change once the call returns.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+
+        return record
+
+
+def stop_queue_listeners() -> None:
+    """Flush queued records and stop every background logging thread."""
+    while _queue_listeners:
+        _, listener = _queue_listeners.popitem()
+        listener.stop()
+
+
+atexit.register(stop_queue_listeners)
 
-def setup_logger(name: str, level: int = logging.INFO) -> logging.Logger:
+
+def setup_logger(
+    name: str,
+    level: int = logging.INFO,
+    *,
+    use_queue: bool | None = None,
+    json_format: bool | None = None,
+    sample_every: int | None = None,
+) -> logging.Logger:
     """
     Set up a logger with a specific name and configuration.
     Note: This could also be used to modify an existing logger's configuration.
 
+    In queue mode the calling thread only puts records on an in-memory queue, while a background thread
+    writes them to the console and the (rotating) log file, so logging never blocks the event loop on I/O.
+
     Args:
         name (str): The name of the logger.
         level (int): The logging level. Default is logging.INFO.
+        use_queue (bool | None): Hand records to a background thread. Defaults to the `log_queue` setting.
+        json_format (bool | None): Emit JSON lines instead of text. Defaults to the `log_format` setting.
+        sample_every (int | None): Keep every n-th INFO/DEBUG record per call site. Defaults to the `log_sample_every` setting.
 
     Returns:
         logging.Logger: The configured logger instance.
     """
-    formatter = logging.Formatter(
-        "%(asctime)s - %(threadName)s:%(thread)d - %(module)s:%(lineno)d - %(levelname)s - %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-    )
+    use_queue = settings.log_queue if use_queue is None else use_queue
+    json_format = settings.log_format == "json" if json_format is None else json_format
+    sample_every = settings.log_sample_every if sample_every is None else sample_every
+
+    if json_format:
+        formatter: logging.Formatter = JsonFormatter()
+    else:
+        formatter = logging.Formatter(
+            "%(asctime)s - %(threadName)s:%(thread)d - %(module)s:%(lineno)d - %(levelname)s - %(message)s",
+            datefmt="%Y-%m-%d %H:%M:%S",
+        )
 
     if not Path(LOGFILES_DIR_NAME).exists():
         Path(LOGFILES_DIR_NAME).mkdir(parents=True, exist_ok=True)
@@ -30,6 +134,13 @@ def setup_logger(name: str, level: int = logging.INFO) -> logging.Logger:
     if logger.hasHandlers():
         logger.handlers.clear()
 
+    for existing_filter in [f for f in logger.filters if isinstance(f, SamplingFilter)]:
+        logger.removeFilter(existing_filter)
+
+    previous_listener = _queue_listeners.pop(name, None)
+    if previous_listener is not None:
+        previous_listener.stop()
+
     logger.setLevel(logging.DEBUG)
 
     file_handler = RotatingFileHandler(
@@ -44,8 +155,19 @@ def setup_logger(name: str, level: int = logging.INFO) -> logging.Logger:
     console_handler.setFormatter(formatter)
     console_handler.setLevel(level)  # Console handler logs from the specified level and above
 
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    handlers: list[logging.Handler] = [file_handler, console_handler]
+    if use_queue:
+        queue_handler = _DeferredFormattingQueueHandler(queue.SimpleQueue())
+        listener = QueueListener(queue_handler.queue, file_handler, console_handler, respect_handler_level=True)
+        listener.start()
+        _queue_listeners[name] = listener
+        handlers = [queue_handler]
+
+    for handler in handlers:
+        logger.addHandler(handler)
+
+    # Sampling runs in the calling thread, so dropped records never reach the queue or the handlers
+    logger.addFilter(SamplingFilter(sample_every))
 
     logger.propagate = False  # Prevent log messages from being propagated to the root logger
     logger.debug(f"Logger '{name}' initialized with level {logging.getLevelName(level)}")
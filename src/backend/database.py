@@ -1,12 +1,18 @@
 """Database connection and session management."""
 
+import asyncio
+import time
 from collections.abc import AsyncGenerator
-from contextlib import asynccontextmanager
+from contextlib import AsyncExitStack, asynccontextmanager
 
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from backend.configs.config import settings
+from backend.utils.metrics import Gauge, Histogram, registry
+from backend.utils.sql_instrumentation import instrument_engine
 
 # Database engine
 engine: AsyncEngine | None = None
@@ -14,16 +20,50 @@ engine: AsyncEngine | None = None
 # Session factory
 async_session_maker: async_sessionmaker[AsyncSession] | None = None
 
+# Engine and session factory of read-only sessions, running statements in autocommit mode (on the replica if configured)
+read_engine: AsyncEngine | None = None
+async_read_session_maker: async_sessionmaker[AsyncSession] | None = None
+
+DB_POOL_CHECKOUT_DURATION = registry.register(
+    Histogram("db_pool_checkout_duration_seconds", "Time spent waiting for a pooled database connection, including new connections"),
+)
+
+
+class _TimedQueuePool(AsyncAdaptedQueuePool):
+    """Default async queue pool, additionally recording how long every checkout waited for a connection and how many wait."""
+
+    # Checkouts currently blocked on the pool queue or on opening a connection
+    waiting = 0
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        started = time.perf_counter()
+        self.waiting += 1
+        try:
+            return super()._do_get()
+        finally:
+            self.waiting -= 1
+            DB_POOL_CHECKOUT_DURATION.observe(time.perf_counter() - started)
 
-def initialize_database_connection() -> None:
-    """Initialize database connection and session factory."""
-    global engine, async_session_maker  # noqa: PLW0603
 
-    engine = create_async_engine(
-        str(settings.database_url),
+def _create_engine(url: str) -> AsyncEngine:
+    created = create_async_engine(
+        url,
         echo=settings.db_echo,
-        pool_pre_ping=True,
+        poolclass=_TimedQueuePool,
+        pool_pre_ping=settings.db_pool_pre_ping,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout,
     )
+    instrument_engine(created.sync_engine)
+    return created
+
+
+def initialize_database_connection() -> None:
+    """Initialize database connection and session factory."""
+    global engine, async_session_maker, read_engine, async_read_session_maker  # noqa: PLW0603
+
+    engine = _create_engine(str(settings.database_url))
 
     async_session_maker = async_sessionmaker(
         engine,
@@ -33,13 +73,89 @@ def initialize_database_connection() -> None:
         autoflush=False,
     )
 
+    # Without a replica, read-only sessions share the pool, only switching the checked out connection to autocommit
+    read_engine = _create_engine(str(settings.database_read_url)) if settings.database_read_url is not None else engine
+    async_read_session_maker = async_sessionmaker(
+        read_engine.execution_options(isolation_level="AUTOCOMMIT"),
+        class_=AsyncSession,
+        expire_on_commit=False,
+        autoflush=False,
+    )
+
     if engine is None or async_session_maker is None:
         msg = "Failed to initialize database connection"
         raise RuntimeError(msg)
 
 
+def asyncpg_dsn() -> str:
+    """
+    Return the configured database URL as a plain DSN usable by asyncpg directly.
+
+    SQLAlchemy URLs carry the driver in the scheme (e.g. `postgresql+asyncpg://`), which asyncpg does not understand.
+    This is needed by components that hold a raw driver connection outside of the pool (e.g. LISTEN/NOTIFY).
+    """
+    return make_url(str(settings.database_url)).set(drivername="postgresql").render_as_string(hide_password=False)
+
+
+def database_pool_stats() -> dict[str, int]:
+    """
+    Return a snapshot of the connection pool usage.
+
+    `waiting` counts the checkouts of the primary's pool currently blocked until a connection is returned or opened.
+
+    Returns:
+        dict[str, int]: Pool size, capacity (size plus overflow), checked out connections, overflow in use and waiting sessions
+    """
+    if engine is None:
+        return {"size": 0, "capacity": 0, "checked_out": 0, "overflow": 0, "waiting": 0}
+
+    pool = engine.pool
+    size = pool.size()
+    return {
+        "size": size,
+        "capacity": size + settings.db_max_overflow,
+        "checked_out": pool.checkedout(),
+        "overflow": max(0, pool.overflow()),
+        "waiting": pool.waiting if isinstance(pool, _TimedQueuePool) else 0,
+    }
+
+
+def _pool_stat_gauge(stat: str, documentation: str) -> Gauge:
+    return registry.register(Gauge(f"db_pool_{stat}", documentation, callback=lambda: {(): database_pool_stats()[stat]}))
+
+
+_pool_stat_gauge("size", "Connections kept open in the database pool")
+_pool_stat_gauge("capacity", "Maximum number of connections, pool size plus overflow")
+_pool_stat_gauge("checked_out", "Database connections currently in use")
+_pool_stat_gauge("overflow", "Connections open above the pool size")
+_pool_stat_gauge("waiting", "Checkouts waiting for a database connection")
+
+
+async def open_pool_connections(count: int) -> int:
+    """
+    Open up to `count` database connections at once and return them to the pool, so requests find them ready.
+
+    Returns:
+        int: Number of connections opened, at most the pool size
+
+    Raises:
+        RuntimeError: If the database connection is not initialized
+    """
+    if engine is None:
+        msg = "Database not initialized. Call initialize_database_connection() first."
+        raise RuntimeError(msg)
+
+    count = min(count, settings.db_pool_size)
+    async with AsyncExitStack() as stack:
+        # Held simultaneously, otherwise the pool would hand out the same connection every time
+        await asyncio.gather(*(stack.enter_async_context(engine.connect()) for _ in range(count)))
+    return count
+
+
 async def close_database_connection() -> None:
     """Close database connection."""
+    if read_engine is not None and read_engine is not engine:
+        await read_engine.dispose()
     if engine is not None:
         await engine.dispose()
 
@@ -63,7 +179,9 @@ async def get_db_session() -> AsyncGenerator[AsyncSession]:
     async with async_session_maker() as session:
         try:
             yield session
-            await session.commit()
+            # Routes committing themselves leave nothing to commit, skip the extra COMMIT round trip then
+            if session.in_transaction():
+                await session.commit()
         except Exception:
             await session.rollback()
             raise
@@ -83,3 +201,34 @@ async def get_db() -> AsyncGenerator[AsyncSession]:
     """
     async with get_db_session() as session:
         yield session
+
+
+@asynccontextmanager
+async def get_read_db_session() -> AsyncGenerator[AsyncSession]:
+    """
+    Get a read-only database session.
+
+    Statements run in autocommit mode, so a read costs no BEGIN and COMMIT round trips, is never left idle in a
+    transaction and can be served by a replica (`database_read_url`) or a statement pooling proxy.
+    Nothing may be written through it: every flush would be committed on its own, and replicas reject writes.
+
+    Yields:
+        AsyncSession: Read-only database session
+    """
+    if async_read_session_maker is None:
+        msg = "Database not initialized. Call initialize_database_connection() first."
+        raise RuntimeError(msg)
+
+    async with async_read_session_maker() as session:
+        yield session
+
+
+async def get_read_db() -> AsyncGenerator[AsyncSession]:
+    """
+    Dependency for read-only FastAPI routes to get a read-only database session (see `get_read_db_session`).
+
+    Yields:
+        AsyncSession: Read-only database session
+    """
+    async with get_read_db_session() as session:
+        yield session
@@ -7,18 +7,34 @@ import asyncio
 import logging
 import re
 import sys
+import time
 from datetime import UTC, datetime
 from io import StringIO
 from pathlib import Path
-from typing import Protocol, TextIO
+from typing import TYPE_CHECKING, Protocol, TextIO
 
+import asyncpg
 from alembic import command
 from alembic.config import Config
 from sqlalchemy import text
 from sqlalchemy.engine import URL, make_url
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.asyncio import create_async_engine
 
 from backend.configs.config import settings
+from backend.configs.custom_logging import setup_logger
+from backend.database import asyncpg_dsn, close_database_connection, get_db_session, initialize_database_connection
+from backend.utils.auth import get_local_user_by_user_id
+from backend.utils.idempotency import delete_expired_idempotency_keys
+from backend.utils.observation_counters import reconcile_observation_counters
+from backend.utils.online_migrations import is_retryable_lock_error, lock_retry_delay, migration_server_settings
+from backend.utils.partitions import add_months, archive_observation_partitions, create_observation_partitions
+from backend.utils.quotas import delete_expired_quota_usage
+from backend.utils.schedule_import import import_schedule
+from backend.utils.synthetic_data import seed_database
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
 
 _DATE_REVISION_PATTERN = re.compile(r"^(?P<date>\d{8})_(?P<counter>\d{4})$")
 
@@ -128,6 +144,28 @@ def _generate_sql_for_revision(script: _AlembicScriptLike) -> None:
     )
 
 
+def _upgrade(config: Config, revision: str) -> None:
+    """
+    Apply migrations, retrying the migration that failed on a lock (see `backend.utils.online_migrations`).
+
+    Every migration commits on its own, so a retry resumes at the migration that timed out.
+
+    Raises:
+        DBAPIError: If a migration still fails on a lock after `migration_lock_retries` retries, or fails otherwise
+    """
+    for attempt in range(settings.migration_lock_retries + 1):
+        try:
+            command.upgrade(config, revision)
+        except DBAPIError as exc:
+            if not is_retryable_lock_error(exc) or attempt == settings.migration_lock_retries:
+                raise
+            delay = lock_retry_delay(attempt)
+            logger.warning(f"Migration failed on a lock ({exc.orig}), retrying in {delay:.0f}s ({attempt + 1}/{settings.migration_lock_retries})")
+            time.sleep(delay)
+        else:
+            return
+
+
 def _parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         prog="backend-db",
@@ -163,6 +201,41 @@ def _parse_args() -> argparse.Namespace:
     subparsers.add_parser("current", help="Show current migration version.")
     subparsers.add_parser("history", help="Show migration history.")
 
+    subparsers.add_parser("prune-idempotency-keys", help="Delete expired Idempotency-Key records.")
+    subparsers.add_parser("prune-quota-usage", help="Delete the observation quota usage of past days.")
+    subparsers.add_parser("reconcile-counters", help="Recount the observation counters and correct any drift.")
+
+    import_parser = subparsers.add_parser("import-schedule", help="Import an observation schedule from a CSV file.")
+    import_parser.add_argument("file", type=Path, help="CSV file with a header row naming the observation fields.")
+    import_parser.add_argument("--user-id", required=True, help="User ID (e.g. the Supabase 'sub' claim) of the existing owner.")
+    import_parser.add_argument("--partial", action="store_true", help="Import the valid rows even if some rows are invalid.")
+
+    partitions_parser = subparsers.add_parser("create-partitions", help="Create the monthly observation partitions of the coming months.")
+    partitions_parser.add_argument(
+        "--months-ahead",
+        type=int,
+        default=settings.observation_partitions_ahead,
+        help=f"Months after the current one to create partitions for (default: {settings.observation_partitions_ahead}).",
+    )
+
+    archive_parser = subparsers.add_parser("archive-partitions", help="Detach and archive the observation partitions of old months.")
+    archive_parser.add_argument(
+        "--older-than-months",
+        type=int,
+        default=settings.observation_archive_after_months,
+        help=f"Archive months that ended at least this many months ago (default: {settings.observation_archive_after_months}).",
+    )
+    archive_parser.add_argument("--export-dir", type=Path, help="Export every archived partition to <partition>.csv.gz in this directory.")
+    archive_parser.add_argument("--drop", action="store_true", help="Drop archived partitions once exported (requires --export-dir).")
+
+    seed_parser = subparsers.add_parser("seed", help="Bulk load synthetic users and observations for benchmarking.")
+    seed_parser.add_argument("--users", type=int, default=10_000, help="Number of users to create (default: 10000).")
+    seed_parser.add_argument("--observations", type=int, default=1_000_000, help="Number of observations to create (default: 1000000).")
+    seed_parser.add_argument("--days", type=int, default=365, help="Spread creation timestamps over this many days (default: 365).")
+    seed_parser.add_argument("--batch-size", type=int, default=50_000, help="Rows per COPY (default: 50000).")
+    seed_parser.add_argument("--jobs", type=int, default=1, help="Processes generating and copying observations (default: 1).")
+    seed_parser.add_argument("--seed", type=int, help="Random seed for a reproducible data set.")
+
     return parser.parse_args()
 
 
@@ -202,7 +275,114 @@ async def _create_database_if_not_exists() -> None:
         await engine.dispose()
 
 
-def main() -> None:  # noqa: C901, PLR0911, PLR0912
+async def _prune_idempotency_keys() -> None:
+    initialize_database_connection()
+    try:
+        async with get_db_session() as session:
+            deleted = await delete_expired_idempotency_keys(session)
+        logger.info(f"Deleted {deleted} expired idempotency keys.")
+    finally:
+        await close_database_connection()
+
+
+async def _prune_quota_usage() -> None:
+    initialize_database_connection()
+    try:
+        async with get_db_session() as session:
+            deleted = await delete_expired_quota_usage(session)
+        logger.info(f"Deleted {deleted} quota usage records of past days.")
+    finally:
+        await close_database_connection()
+
+
+async def _reconcile_counters() -> None:
+    initialize_database_connection()
+    try:
+        async with get_db_session() as session:
+            drift = await reconcile_observation_counters(session)
+        logger.info(f"Reconciled observation counters, {sum(drift.values())} rows corrected.")
+    finally:
+        await close_database_connection()
+
+
+async def _read_chunks(path: Path, chunk_size: int = 64 * 1024) -> AsyncIterator[bytes]:
+    with path.open("rb") as file:
+        while chunk := await asyncio.to_thread(file.read, chunk_size):
+            yield chunk
+
+
+async def _import_schedule(path: Path, user_id: str, *, partial: bool) -> bool:
+    initialize_database_connection()
+    try:
+        async with get_db_session() as session:
+            user = await get_local_user_by_user_id(session, user_id)
+            if user is None:
+                logger.error(f"User '{user_id}' does not exist.")
+                return False
+            result = await import_schedule(session, _read_chunks(path), user.id, partial=partial)
+    except ValueError as exc:
+        logger.error(f"Invalid schedule: {exc}")  # noqa: TRY400
+        return False
+    finally:
+        await close_database_connection()
+
+    for error in result.errors:
+        logger.warning(f"Row {error.row}{f', column {error.column}' if error.column else ''}: {error.message} (value: {error.value!r})")
+    if result.errors_truncated:
+        logger.warning("More errors occurred than are listed.")
+    if result.rejected and not partial:
+        logger.error(f"Rejected {result.rejected} rows, nothing was imported. Fix them or use --partial.")
+        return False
+
+    logger.info(f"Imported {result.imported} observations, rejected {result.rejected} rows.")
+    return True
+
+
+async def _connect_for_maintenance() -> asyncpg.Connection:
+    # Waits for locks on `observations` no longer than migrations do, while VACUUM and exports may run long
+    return await asyncpg.connect(asyncpg_dsn(), server_settings={**migration_server_settings(), "statement_timeout": "0"})
+
+
+async def _create_partitions(months_ahead: int) -> None:
+    current_month = datetime.now(UTC).date().replace(day=1)
+    connection = await _connect_for_maintenance()
+    try:
+        created = await create_observation_partitions(connection, current_month, add_months(current_month, months_ahead))
+    finally:
+        await connection.close()
+    logger.info(f"Created {len(created)} partitions.")
+
+
+async def _archive_partitions(args: argparse.Namespace) -> bool:
+    if args.drop and args.export_dir is None:
+        logger.error("--drop requires --export-dir, archived partitions are only dropped once exported.")
+        return False
+    if args.export_dir is not None:
+        args.export_dir.mkdir(parents=True, exist_ok=True)
+
+    before = add_months(datetime.now(UTC).date().replace(day=1), -args.older_than_months)
+    connection = await _connect_for_maintenance()
+    try:
+        archived = await archive_observation_partitions(connection, before, export_dir=args.export_dir, drop=args.drop)
+    finally:
+        await connection.close()
+    logger.info(f"Archived {len(archived)} partitions of months before {before:%Y-%m}.")
+    return True
+
+
+async def _seed(args: argparse.Namespace) -> None:
+    await seed_database(
+        asyncpg_dsn(),
+        args.users,
+        args.observations,
+        days=args.days,
+        batch_size=args.batch_size,
+        jobs=args.jobs,
+        seed=args.seed,
+    )
+
+
+def main() -> None:  # noqa: C901, PLR0911, PLR0912, PLR0915
     args = _parse_args()
     config = _build_alembic_config()
 
@@ -211,12 +391,14 @@ def main() -> None:  # noqa: C901, PLR0911, PLR0912
         return
 
     if args.command == "init":
+        setup_logger("astro_backend")
         asyncio.run(_create_database_if_not_exists())
-        command.upgrade(config, args.revision)
+        _upgrade(config, args.revision)
         return
 
     if args.command == "upgrade":
-        command.upgrade(config, args.revision)
+        setup_logger("astro_backend")
+        _upgrade(config, args.revision)
         return
 
     if args.command == "downgrade":
@@ -253,6 +435,43 @@ def main() -> None:  # noqa: C901, PLR0911, PLR0912
         command.history(config)
         return
 
+    if args.command == "prune-idempotency-keys":
+        setup_logger("astro_backend")
+        asyncio.run(_prune_idempotency_keys())
+        return
+
+    if args.command == "prune-quota-usage":
+        setup_logger("astro_backend")
+        asyncio.run(_prune_quota_usage())
+        return
+
+    if args.command == "reconcile-counters":
+        setup_logger("astro_backend")
+        asyncio.run(_reconcile_counters())
+        return
+
+    if args.command == "import-schedule":
+        setup_logger("astro_backend")
+        if not asyncio.run(_import_schedule(args.file, args.user_id, partial=args.partial)):
+            sys.exit(1)
+        return
+
+    if args.command == "create-partitions":
+        setup_logger("astro_backend")
+        asyncio.run(_create_partitions(args.months_ahead))
+        return
+
+    if args.command == "archive-partitions":
+        setup_logger("astro_backend")
+        if not asyncio.run(_archive_partitions(args)):
+            sys.exit(1)
+        return
+
+    if args.command == "seed":
+        setup_logger("astro_backend")
+        asyncio.run(_seed(args))
+        return
+
     msg = f"Unsupported command: {args.command}"
     raise ValueError(msg)
 
@@ -1,21 +1,32 @@
+import os
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
-from typing import Annotated
+from functools import cache
+from importlib.util import find_spec
+from typing import TYPE_CHECKING, Annotated
 
 import uvicorn
 from fastapi import Body, FastAPI, Request, status
 from fastapi.exceptions import RequestValidationError, StarletteHTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi.responses import FileResponse, JSONResponse, PlainTextResponse
 from fastapi.staticfiles import StaticFiles
-from fastapi.templating import Jinja2Templates
-from starlette.templating import _TemplateResponse
 
 from backend.configs.config import settings
 from backend.configs.custom_logging import setup_logger
 from backend.database import close_database_connection, initialize_database_connection
 from backend.models import StatusResponse
-from backend.routers import observations, web
+from backend.routers import admin, observations, web
+from backend.utils import metrics
+from backend.utils.loop_monitor import event_loop_monitor
+from backend.utils.observation_events import observation_event_broker
+from backend.utils.sql_instrumentation import QueryBudgetMiddleware
+from backend.utils.timing import ServerTimingMiddleware, TimedRoute
+from backend.utils.warmup import warm_up
+
+if TYPE_CHECKING:
+    from fastapi.templating import Jinja2Templates
+    from starlette.templating import _TemplateResponse
 
 logger = setup_logger("astro_backend")
 
@@ -25,23 +36,30 @@ async def lifespan(_: FastAPI) -> AsyncGenerator[None]:
     """
     Lifecycle manager for the FastAPI application.
 
-    Handles startup and shutdown events.
+    Handles startup and shutdown events. In production mode this runs once in every worker process,
+    so it is the place for per-worker resources (database pool, change listener, ...).
     """
-    logger.info("Starting up the Astro BEAM Backend application...")
+    logger.info("Starting up the Astro BEAM Backend application in worker process %s...", os.getpid())
     # Perform startup tasks here
     try:
+        await event_loop_monitor.start()
         initialize_database_connection()
+        await observation_event_broker.start()
         logger.info("All services initialized successfully")
+        if settings.warmup_enabled:
+            await warm_up()
     except Exception:
         logger.exception("Failed to initialize services")
         raise
 
     yield  # Application runs until shutdown
 
-    logger.info("Shutting down the Astro BEAM Backend application...")
+    logger.info("Shutting down the Astro BEAM Backend application in worker process %s...", os.getpid())
     # Perform shutdown tasks here
     try:
+        await observation_event_broker.stop()
         await close_database_connection()
+        await event_loop_monitor.stop()
         logger.info("All services closed successfully")
     except Exception:
         logger.exception("Error during shutdown")
@@ -53,12 +71,21 @@ app = FastAPI(
     description="Backend API for the Astro BEAM project",
     lifespan=lifespan,
 )
+app.router.route_class = TimedRoute
 
 app.docs_url = "/docs" if settings.debug else None
 app.redoc_url = "/redoc" if settings.debug else None
 
 app.mount("/static", StaticFiles(directory="static"), name="static")
-templates = Jinja2Templates(directory="jinja_templates")  # Do not rename this directory to "templates", used in CHANGELOG generation
+
+
+@cache
+def _templates() -> "Jinja2Templates":
+    """Load the error page templates on first use, Jinja2 is not imported to serve the API."""
+    from fastapi.templating import Jinja2Templates  # noqa: PLC0415
+
+    return Jinja2Templates(directory="jinja_templates")  # Do not rename this directory to "templates", used in CHANGELOG generation
+
 
 # Configure CORS middleware
 app.add_middleware(
@@ -67,8 +94,13 @@ app.add_middleware(
     allow_credentials=settings.cors_allow_credentials,
     allow_methods=settings.cors_allow_methods,
     allow_headers=settings.cors_allow_headers,
+    expose_headers=["Server-Timing", "X-DB-Query-Count", "X-DB-Query-Duration-Ms"],
 )
 
+app.add_middleware(QueryBudgetMiddleware)
+# Added last so it is the outermost middleware and its `total` covers the whole stack
+app.add_middleware(ServerTimingMiddleware)
+
 app.include_router(
     observations.router,
     prefix="/v1",
@@ -77,6 +109,10 @@ app.include_router(
     web.router,
     prefix="/v1",
 )
+app.include_router(
+    admin.router,
+    prefix="/v1",
+)
 
 
 @app.get(
@@ -125,17 +161,32 @@ async def favicon() -> FileResponse:
     return FileResponse("static/favicon.ico")
 
 
+@app.get("/metrics", include_in_schema=False)
+async def prometheus_metrics() -> PlainTextResponse:
+    """
+    Serve the metrics of the worker process handling the scrape in the Prometheus text format.
+
+    Raises:
+        StarletteHTTPException: If metrics are disabled
+    """
+    if not settings.metrics_enabled:
+        raise StarletteHTTPException(status_code=status.HTTP_404_NOT_FOUND)
+
+    return PlainTextResponse(metrics.registry.render(), media_type=metrics.CONTENT_TYPE)
+
+
 @app.exception_handler(StarletteHTTPException)
-async def general_http_exception_handler(request: Request, exception: StarletteHTTPException) -> JSONResponse | _TemplateResponse:
+async def general_http_exception_handler(request: Request, exception: StarletteHTTPException) -> "JSONResponse | _TemplateResponse":
     message = exception.detail if exception.detail else "An error occurred. Please check your request and try again."
 
     if request.url.path.startswith("/v1/"):
         return JSONResponse(
             status_code=exception.status_code,
             content={"detail": message},
+            headers=exception.headers,
         )
 
-    return templates.TemplateResponse(
+    return _templates().TemplateResponse(
         request,
         "error.html",
         {
@@ -144,18 +195,19 @@ async def general_http_exception_handler(request: Request, exception: StarletteH
             "message": message,
         },
         status_code=exception.status_code,
+        headers=exception.headers,
     )
 
 
 @app.exception_handler(RequestValidationError)
-async def validation_exception_handler(request: Request, exception: RequestValidationError) -> JSONResponse | _TemplateResponse:
+async def validation_exception_handler(request: Request, exception: RequestValidationError) -> "JSONResponse | _TemplateResponse":
     if request.url.path.startswith("/v1/"):
         return JSONResponse(
             status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
             content={"detail": exception.errors()},
         )
 
-    return templates.TemplateResponse(
+    return _templates().TemplateResponse(
         request,
         "error.html",  # TODO @dyka3773: Create a dedicated validation error template # noqa: FIX002
         {
@@ -167,13 +219,56 @@ async def validation_exception_handler(request: Request, exception: RequestValid
     )
 
 
+def _select_server_implementations() -> tuple[str, str]:
+    """
+    Select the event loop and HTTP parser explicitly.
+
+    uvicorn's "auto" mode silently falls back to the slower pure-Python implementations,
+    so the fast ones are picked here when installed and the choice is logged.
+
+    Returns:
+        tuple[str, str]: The uvicorn `loop` and `http` implementation names
+    """
+    loop = "uvloop" if find_spec("uvloop") is not None else "asyncio"
+    http = "httptools" if find_spec("httptools") is not None else "h11"
+    if (loop, http) != ("uvloop", "httptools"):
+        logger.warning("uvloop/httptools not available, serving with %s/%s", loop, http)
+
+    return loop, http
+
+
 def main() -> None:
-    """Entry point for running the Astro BEAM Backend application using Uvicorn."""
+    """
+    Entry point for running the Astro BEAM Backend application using Uvicorn.
+
+    In debug mode a single auto-reloading process is served. Otherwise the application is served by one worker process per CPU core
+    (or WORKERS), supervised by uvicorn: dead workers are replaced, workers are recycled after WORKER_MAX_REQUESTS requests,
+    and SIGHUP restarts the workers one at a time, each draining its in-flight requests first, so the port keeps being served.
+    The application is imported here in the supervisor before any worker is spawned, so configuration errors fail fast.
+    """
+    if settings.debug:
+        uvicorn.run(
+            "backend.main:app",
+            host=settings.host,
+            port=settings.port,
+            reload=True,
+        )
+        return
+
+    loop, http = _select_server_implementations()
+    workers = settings.workers or os.cpu_count() or 1
+    logger.info("Serving on %s:%s with %s worker processes (%s/%s)", settings.host, settings.port, workers, loop, http)
+
     uvicorn.run(
         "backend.main:app",
         host=settings.host,
         port=settings.port,
-        reload=settings.debug,
+        workers=workers,
+        loop=loop,
+        http=http,
+        limit_max_requests=settings.worker_max_requests or None,
+        limit_max_requests_jitter=settings.worker_max_requests_jitter,
+        timeout_graceful_shutdown=settings.graceful_shutdown_timeout,
     )
 
 
@@ -1,14 +1,37 @@
 """Database models for the Astro BEAM project."""
 
-from backend.models.observation import Observation, ObservationCreate, ObservationRead, ObservationSubmissionRequest
+from backend.models.idempotency import IdempotencyKey
+from backend.models.observation import (
+    Observation,
+    ObservationBatchSubmissionRequest,
+    ObservationChanges,
+    ObservationCreate,
+    ObservationRead,
+    ObservationSubmissionRequest,
+)
+from backend.models.observation_counts import ObservationDailyCount, ObservationStatusCount, ObservationSummary, ObservationUserCount
+from backend.models.observation_quota import ObservationQuotaUsage
+from backend.models.rate_limit import RateLimitBucket
 from backend.models.responses import StatusResponse
+from backend.models.schedule_import import ScheduleImportResult, ScheduleImportRowError
 from backend.models.user import User, UserCreate, UserRead
 
 __all__ = [
+    "IdempotencyKey",
     "Observation",
+    "ObservationBatchSubmissionRequest",
+    "ObservationChanges",
     "ObservationCreate",
+    "ObservationDailyCount",
+    "ObservationQuotaUsage",
     "ObservationRead",
+    "ObservationStatusCount",
     "ObservationSubmissionRequest",
+    "ObservationSummary",
+    "ObservationUserCount",
+    "RateLimitBucket",
+    "ScheduleImportResult",
+    "ScheduleImportRowError",
     "StatusResponse",
     "User",
     "UserCreate",
@@ -0,0 +1,30 @@
+"""Idempotency key database model."""
+
+from datetime import datetime
+from typing import Any
+
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlmodel import Field, SQLModel, String
+
+from backend.utils.time_utils import utc_now
+
+
+class IdempotencyKey(SQLModel, table=True):
+    """Stored outcome of a request submitted with an `Idempotency-Key` header, replayed to retries of the same request."""
+
+    __tablename__ = "idempotency_keys"
+    __table_args__ = (sa.Index("ix_idempotency_keys_scope_key", "scope", "key", unique=True),)
+
+    id: int | None = Field(default=None, primary_key=True)
+
+    # Keys are only unique per client, so the same key sent by two users never collides
+    scope: str = Field(description="Client the key belongs to (principal subject, or hash of a guest's client IP and user ID)", sa_type=String(255))
+    key: str = Field(description="Client supplied idempotency key", sa_type=String(255))
+    request_fingerprint: str = Field(description="SHA-256 of the request payload the key was first used with", sa_type=String(64))
+
+    status_code: int = Field(description="HTTP status code of the original response")
+    response_body: dict[str, Any] = Field(description="JSON body of the original response", sa_type=JSONB)
+
+    created_on: datetime = Field(default_factory=utc_now, description="Record creation timestamp")
+    expires_on: datetime = Field(index=True, description="Timestamp after which the key may be reused and the record deleted")
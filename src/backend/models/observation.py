@@ -4,10 +4,10 @@ from datetime import datetime
 
 import sqlalchemy as sa
 from pydantic import AnyUrl
-from sqlalchemy import event
 from sqlmodel import CheckConstraint, Field, Relationship, SQLModel, String, Text
 from sqlmodel._compat import SQLModelConfig
 
+from backend.configs.config import settings
 from backend.models.enums.frequencies import BandwidthEnum, CentralFrequencyEnum
 from backend.models.enums.observation_status import ObservationStatusEnum
 from backend.models.enums.observation_type import ObservationTypeEnum
@@ -154,17 +154,46 @@ class ObservationSubmissionRequest(SQLModel):
     requestor: UserCreate | None = Field(default=None, description="Optional guest requestor metadata")
 
 
+class ObservationBatchSubmissionRequest(SQLModel):
+    """Payload for submitting several observation requests at once."""
+
+    # Checked while validating the body, so an oversized batch is rejected before its remaining observations are validated
+    observations: list[ObservationCreate] = Field(
+        min_length=1,
+        max_length=settings.max_observation_batch_size,
+        description="Observation submission payloads",
+    )
+    requestor: UserCreate | None = Field(default=None, description="Optional guest requestor metadata")
+
+
+class ObservationChanges(SQLModel):
+    """Page of observations changed since a delta sync cursor."""
+
+    observations: list[ObservationRead] = Field(description="Observations whose last update is after the cursor, oldest change first")
+    next_cursor: str = Field(description="Opaque cursor to pass as `since` to fetch the next changes")
+    has_more: bool = Field(description="Whether more changes are available right away after this page")
+
+
 class Observation(ObservationBase, table=True):
     """Database model for telescope observations."""
 
     __tablename__ = "observations"
+    # The table is partitioned by month of `created_on` (migration 20261019_0006), with monthly partitions created and
+    # archived by `backend-db`, see `backend.utils.partitions`. The primary key of a partitioned table has to include
+    # the partition key, so it is (id, created_on); ids stay unique through their sequence.
     __table_args__ = (
         CheckConstraint("ra >= 0 AND ra < 360", name="ck_observations_ra_range"),
         CheckConstraint("dec >= -90 AND dec <= 90", name="ck_observations_dec_range"),
         CheckConstraint("integration_time > 0", name="ck_observations_integration_time_positive"),
+        # Serves the delta sync keyset scan: WHERE user_id = ? AND (updated_on, id) > (?, ?) ORDER BY updated_on, id
+        sa.Index("ix_observations_user_id_updated_on", "user_id", "updated_on"),
+        # Serves the processor's queue scan, stays small however many completed observations are kept
+        sa.Index("ix_observations_pending_created_on", "created_on", postgresql_where=sa.text("status = 'PENDING'")),
     )
+    # Fetch the trigger maintained `updated_on` with RETURNING on flush instead of expiring it
+    __mapper_args__ = {"eager_defaults": True}
 
-    id: int | None = Field(default=None, primary_key=True)
+    id: int | None = Field(default=None, primary_key=True, sa_column_kwargs={"autoincrement": True})
 
     # User relationship
     user_id: int = Field(foreign_key="users.id", description="ID of the user who submitted the observation")
@@ -177,17 +206,26 @@ class Observation(ObservationBase, table=True):
         sa_column_kwargs={"server_default": sa.text("'PENDING'")},
     )
     completed_on: datetime | None = Field(default=None, description="Timestamp of completion")
+    # Only set by API submissions, which reserve daily quota (`backend.utils.quotas`). The `trg_observations_release_quota`
+    # trigger gives quota back for these rows only, so imported and seeded observations never release other reservations
+    quota_reserved: bool = Field(
+        default=False,
+        description="Whether the observation reserved daily quota when submitted",
+        sa_column_kwargs={"server_default": sa.false()},
+    )
 
     # Additional metadata
     created_on: datetime = Field(
         default_factory=utc_now,
+        primary_key=True,
         description="Record creation timestamp",
         sa_column_kwargs={"server_default": sa.func.now()},
     )
     updated_on: datetime = Field(
         default_factory=utc_now,
         description="Record update timestamp",
-        sa_column_kwargs={"server_default": sa.func.now()},
+        # Maintained by the `trg_observations_set_updated_on` trigger, so set-based UPDATE statements keep it current too
+        sa_column_kwargs={"server_default": sa.func.now(), "server_onupdate": sa.FetchedValue()},
     )
 
     csv_download_url: AnyUrl | None = Field(
@@ -205,9 +243,3 @@ class Observation(ObservationBase, table=True):
         description="Pre-signed URL for downloading the observation data",
         sa_type=Text,
     )
-
-
-@event.listens_for(Observation, "before_update")
-def update_updated_on(_: object, __: object, target: Observation) -> None:
-    """Automatically update the 'updated_on' timestamp on record update."""
-    target.updated_on = utc_now()
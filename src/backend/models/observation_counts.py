@@ -0,0 +1,58 @@
+"""Observation counter database models, maintained by triggers on `observations`."""
+
+from datetime import date
+
+import sqlalchemy as sa
+from sqlmodel import Field, SQLModel
+
+from backend.models.enums.observation_status import ObservationStatusEnum
+
+# Global counters are spread over this many rows per key, so concurrent submissions rarely update the same row
+COUNTER_SHARDS = 16
+
+
+class ObservationUserCount(SQLModel, table=True):
+    """Number of observations of a user in a status."""
+
+    __tablename__ = "observation_user_counts"
+
+    user_id: int = Field(foreign_key="users.id", primary_key=True, description="ID of the user the observations belong to")
+    status: ObservationStatusEnum = Field(primary_key=True, description="Status of the counted observations")
+    count: int = Field(default=0, sa_type=sa.BigInteger, description="Number of observations")
+
+
+class ObservationStatusCount(SQLModel, table=True):
+    """Share of the number of observations in a status, summed over the shards of the status."""
+
+    __tablename__ = "observation_status_counts"
+
+    status: ObservationStatusEnum = Field(primary_key=True, description="Status of the counted observations")
+    shard: int = Field(primary_key=True, sa_type=sa.SmallInteger, description="Observation id modulo COUNTER_SHARDS")
+    count: int = Field(default=0, sa_type=sa.BigInteger, description="Number of observations")
+
+
+class ObservationDailyCount(SQLModel, table=True):
+    """Share of the number of observations submitted on a (UTC) day, summed over the shards of the day."""
+
+    __tablename__ = "observation_daily_counts"
+
+    day: date = Field(primary_key=True, description="Submission day")
+    shard: int = Field(primary_key=True, sa_type=sa.SmallInteger, description="Observation id modulo COUNTER_SHARDS")
+    count: int = Field(default=0, sa_type=sa.BigInteger, description="Number of observations")
+
+
+class ObservationSummary(SQLModel):
+    """Observation counts per status."""
+
+    counts: dict[ObservationStatusEnum, int] = Field(description="Number of observations per status, every status included")
+    total: int = Field(description="Number of observations in any status")
+
+    @classmethod
+    def from_counts(cls, counts: dict[ObservationStatusEnum, int]) -> "ObservationSummary":
+        """
+        Build a summary from the counts of the statuses that have observations.
+
+        Returns:
+            ObservationSummary: Summary listing every status
+        """
+        return cls(counts={status: counts.get(status, 0) for status in ObservationStatusEnum}, total=sum(counts.values()))
@@ -0,0 +1,21 @@
+"""Observation quota usage database model."""
+
+from datetime import date
+
+from sqlmodel import Field, SQLModel
+
+
+class ObservationQuotaUsage(SQLModel, table=True):
+    """
+    Telescope time and pending observations a user has reserved on a (UTC) day, checked against the daily quotas.
+
+    Submissions reserve quota with a conditional upsert of this row, and a trigger on `observations` (migrations
+    20261019_0008 and 20261019_0009) releases it once the observations that reserved it leave the queue.
+    """
+
+    __tablename__ = "observation_quota_usage"
+
+    user_id: int = Field(foreign_key="users.id", primary_key=True, description="ID of the user the quota belongs to")
+    day: date = Field(primary_key=True, description="Submission day")
+    integration_time: float = Field(default=0, description="Integration seconds of the day's observations, cancelled ones excluded")
+    pending: int = Field(default=0, description="Observations submitted on the day that are still pending")
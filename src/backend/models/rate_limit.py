@@ -0,0 +1,21 @@
+"""Rate limit token bucket database model."""
+
+from datetime import datetime
+
+from sqlmodel import Field, SQLModel, String
+
+
+class RateLimitBucket(SQLModel, table=True):
+    """
+    Token bucket shared by all API workers when the database rate limit backend is selected.
+
+    The table is UNLOGGED: buckets are cheap to write and losing them on a crash only resets clients' budgets.
+    """
+
+    __tablename__ = "rate_limit_buckets"
+    __table_args__ = {"prefixes": ["UNLOGGED"]}
+
+    key: str = Field(primary_key=True, description="Client the bucket belongs to", sa_type=String(320))
+    tokens: float = Field(description="Tokens left after the last request")
+    allowed: bool = Field(description="Whether the last request was admitted")
+    updated_on: datetime = Field(description="Timestamp of the last refill")
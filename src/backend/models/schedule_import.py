@@ -0,0 +1,21 @@
+"""Models reporting the outcome of a bulk observation schedule import."""
+
+from sqlmodel import Field, SQLModel
+
+
+class ScheduleImportRowError(SQLModel):
+    """A value of an uploaded schedule that was rejected."""
+
+    row: int = Field(description="Position of the CSV record in the file, the header is record 1")
+    column: str | None = Field(default=None, description="Column of the rejected value, None for errors about the whole row")
+    value: str | None = Field(default=None, description="The rejected value")
+    message: str = Field(description="Why the value was rejected")
+
+
+class ScheduleImportResult(SQLModel):
+    """Outcome of a schedule import."""
+
+    imported: int = Field(description="Number of observations created")
+    rejected: int = Field(description="Number of rows with at least one invalid value")
+    errors: list[ScheduleImportRowError] = Field(description="Errors of the rejected rows, truncated to the first ones")
+    errors_truncated: bool = Field(default=False, description="Whether more errors occurred than are listed")
@@ -3,8 +3,8 @@
 from datetime import datetime
 from typing import TYPE_CHECKING
 
+import sqlalchemy as sa
 from pydantic import EmailStr
-from sqlalchemy import event
 from sqlmodel import Field, Relationship, SQLModel, String
 from sqlmodel._compat import SQLModelConfig
 
@@ -50,6 +50,8 @@ class User(UserBase, table=True):
     """Database model for application users."""
 
     __tablename__ = "users"
+    # Fetch the trigger maintained `updated_at` with RETURNING on flush instead of expiring it
+    __mapper_args__ = {"eager_defaults": True}
 
     id: int | None = Field(default=None, primary_key=True)
     user_id: str = Field(unique=True, index=True, description="Unique user identifier", sa_type=String())
@@ -62,7 +64,12 @@ class User(UserBase, table=True):
 
     # Metadata
     created_at: datetime = Field(default_factory=utc_now, description="Record creation timestamp")
-    updated_at: datetime = Field(default_factory=utc_now, description="Record update timestamp")
+    updated_at: datetime = Field(
+        default_factory=utc_now,
+        description="Record update timestamp",
+        # Maintained by the `trg_users_set_updated_at` trigger
+        sa_column_kwargs={"server_onupdate": sa.FetchedValue()},
+    )
     is_active: bool = Field(default=True, description="Whether the user is active")
 
     model_config: SQLModelConfig = {
@@ -84,9 +91,3 @@ class User(UserBase, table=True):
         return (
             f"<User(id={self.id}, user_id='{self.user_id}', username='{self.username}', email='{self.email}', auth_provider='{self.auth_provider}')>"
         )
-
-
-@event.listens_for(User, "before_update")
-def update_updated_at(_: object, __: object, target: User) -> None:
-    """Automatically update the 'updated_at' timestamp on record update."""
-    target.updated_at = utc_now()
@@ -0,0 +1,105 @@
+"""Admin router for observatory staff operations."""
+
+import logging
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.database import get_db
+from backend.models import ScheduleImportResult
+from backend.utils.auth import AuthPrincipal, get_local_user_by_user_id, get_or_create_local_user_from_principal, require_admin
+from backend.utils.schedule_import import COLUMNS, import_schedule
+from backend.utils.timing import TimedRoute
+
+router = APIRouter(
+    prefix="/admin",
+    tags=["Admin"],
+    route_class=TimedRoute,
+    responses={
+        status.HTTP_401_UNAUTHORIZED: {"description": "Unauthorized"},
+        status.HTTP_403_FORBIDDEN: {"description": "Administrator privileges are required"},
+    },
+)
+
+logger = logging.getLogger("astro_backend")
+
+CSV_MEDIA_TYPES = ("text/csv", "application/csv")
+
+
+@router.post(
+    "/observations/import",
+    description=(
+        "Import an observation schedule from a CSV file sent as the request body (`Content-Type: text/csv`). "
+        f"The header row names the columns, out of: {', '.join(COLUMNS)}."
+    ),
+    status_code=status.HTTP_202_ACCEPTED,
+    responses={
+        status.HTTP_202_ACCEPTED: {"description": "Schedule imported"},
+        status.HTTP_400_BAD_REQUEST: {"description": "The file is not a valid CSV schedule"},
+        status.HTTP_404_NOT_FOUND: {"description": "User not found"},
+        status.HTTP_415_UNSUPPORTED_MEDIA_TYPE: {"description": "The request body is not CSV"},
+        status.HTTP_422_UNPROCESSABLE_CONTENT: {"description": "Some rows are invalid, nothing was imported"},
+    },
+    openapi_extra={"requestBody": {"required": True, "content": {"text/csv": {"schema": {"type": "string"}}}}},
+)
+async def import_observation_schedule(
+    request: Request,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    admin: Annotated[AuthPrincipal, Depends(require_admin)],
+    user_id: Annotated[str | None, Query(description="User ID of the observations' owner, defaults to the importing administrator")] = None,
+    partial: Annotated[bool, Query(description="Import the valid rows even if some rows are invalid")] = False,  # noqa: FBT002
+) -> ScheduleImportResult:
+    """
+    Create pending observations for every row of an uploaded CSV schedule.
+
+    The body is parsed while it streams in and loaded with COPY (see `backend.utils.schedule_import`),
+    which makes it suitable for schedules with thousands of rows. No confirmation emails are sent.
+
+    Args:
+        request: The request, whose body is the CSV file (`text/csv`)
+        db: Database session dependency
+        admin: The verified administrator importing the schedule
+        user_id: External user ID (e.g. the Supabase 'sub' claim) of an existing user owning the observations
+        partial: Import the valid rows even if some rows are invalid, instead of importing nothing
+
+    Returns:
+        ScheduleImportResult: Number of imported observations and the errors of rejected rows
+
+    Raises:
+        HTTPException: If the body is not a valid schedule, the user does not exist or rows are invalid
+    """
+    media_type = request.headers.get("content-type", "").split(";", 1)[0].strip().lower()
+    if media_type not in CSV_MEDIA_TYPES:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail="The schedule must be sent as text/csv",
+        )
+
+    if user_id is None:
+        owner = await get_or_create_local_user_from_principal(db, admin)
+    else:
+        owner = await get_local_user_by_user_id(db, user_id)
+        if owner is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="User not found",
+            )
+
+    try:
+        result = await import_schedule(db, request.stream(), owner.id, partial=partial)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        ) from e
+
+    if result.rejected and not partial:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+            detail=result.model_dump(),
+        )
+
+    await db.commit()
+    logger.info("Administrator %s imported %s observations for user %s", admin.subject, result.imported, owner.user_id)
+    return result
@@ -1,62 +1,315 @@
 """Telescope router for receiving observation requests."""
 
+import base64
+import binascii
 import logging
 import uuid
-from typing import TYPE_CHECKING, Annotated
-
-from fastapi import APIRouter, Depends, HTTPException, status
+from collections.abc import AsyncGenerator
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Annotated, Any
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response, status
+from fastapi.sse import EventSourceResponse, ServerSentEvent
+from sqlalchemy import Integer, Select, bindparam, insert, tuple_, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
 from backend.configs.config import settings
-from backend.database import get_db
-from backend.models import Observation, ObservationRead, ObservationSubmissionRequest
+from backend.database import get_db, get_db_session, get_read_db
+from backend.models import (
+    Observation,
+    ObservationBatchSubmissionRequest,
+    ObservationChanges,
+    ObservationCreate,
+    ObservationRead,
+    ObservationSubmissionRequest,
+    ObservationSummary,
+    User,
+    UserCreate,
+)
 from backend.models.enums.observation_status import ObservationStatusEnum
+from backend.utils.admission import write_admission
 from backend.utils.auth import (
     AuthPrincipal,
+    get_local_user_by_user_id,
     get_optional_principal,
     get_or_create_guest_user,
     get_or_create_local_user_from_principal,
 )
-from backend.utils.email.service import send_observation_confirmation_email
+from backend.utils.idempotency import build_idempotent_request, get_stored_response, store_response
+from backend.utils.observation_cache import TERMINAL_STATUSES, observation_response_cache
+from backend.utils.observation_counters import observation_status_counts, user_observation_counts
+from backend.utils.observation_events import observation_event_broker
+from backend.utils.quotas import reserve_observation_quota
+from backend.utils.sql_instrumentation import query_budget
 from backend.utils.time_utils import utc_now
+from backend.utils.timing import TimedRoute
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
 
     from sqlalchemy import Result
 
-    from backend.models.user import User
-
 router = APIRouter(
     prefix="/observations",
     tags=["Observation"],
+    route_class=TimedRoute,
 )
 
 logger = logging.getLogger("astro_backend")
 
+MAX_CHANGES_PAGE_SIZE = 1000
+
+# Statements of a single submission, in one transaction: idempotency key lookup, user lookup, user creation (first
+# submission only), quota reservation upsert, observation INSERT ... RETURNING, stored idempotent response, plus the
+# shared rate limit bucket upsert with RATE_LIMIT_BACKEND=database. A plain submission by a known user takes three
+# (asserted by tests/test_submit_query_count.py), plus the pool pre-ping round trip unless DB_POOL_PRE_PING is disabled.
+SUBMIT_QUERY_BUDGET = 7
+
+
+def _build_list_statement(*, for_user: bool) -> Select[tuple[Observation]]:
+    statement = select(Observation)
+    if for_user:
+        statement = statement.where(Observation.user_id == bindparam("user_id"))
+    return statement.order_by(Observation.created_on.desc())
+
+
+def _build_changes_statement(*, for_user: bool, since: bool) -> Select[tuple[Observation]]:
+    # Rows are stamped when written, not when committed: a transaction committing late can hold an older `updated_on`
+    # than rows already delivered, so only changes older than the settle window are returned (see `changes_settle_seconds`)
+    statement = select(Observation).where(Observation.updated_on <= bindparam("settled_before", type_=Observation.updated_on.type))
+    if for_user:
+        statement = statement.where(Observation.user_id == bindparam("user_id"))
+    if since:
+        statement = statement.where(
+            tuple_(Observation.updated_on, Observation.id)
+            > tuple_(bindparam("cursor_updated_on", type_=Observation.updated_on.type), bindparam("cursor_id", type_=Observation.id.type)),
+        )
+    return statement.order_by(Observation.updated_on.asc(), Observation.id.asc()).limit(bindparam("limit", type_=Integer))
+
+
+# Hot statements are built once per process, see `backend.utils.auth.USER_BY_USER_ID`.
+# Variants without a user filter serve guests in debug mode (`debug_allow_guest_history`).
+OBSERVATION_BY_ID = select(Observation).where(Observation.id == bindparam("observation_id"))
+LIST_STATEMENTS = {for_user: _build_list_statement(for_user=for_user) for for_user in (True, False)}
+CHANGES_STATEMENTS = {
+    (for_user, since): _build_changes_statement(for_user=for_user, since=since) for for_user in (True, False) for since in (True, False)
+}
+
+
+def changes_parameters(*, limit: int, user_id: int | None = None, cursor: tuple[datetime, int] | None = None) -> dict[str, Any]:
+    """
+    Build the bind parameters of a `CHANGES_STATEMENTS` statement.
+
+    Shared by the route, the worker warm-up and the statement cache benchmark, so they all bind what the statement expects.
+
+    Args:
+        limit: Maximum number of changes to return, one more row is fetched to tell whether more are available
+        user_id: ID of the user whose changes are fetched, or None for the variants without a user filter
+        cursor: `(updated_on, id)` of the last change already delivered, or None for the variants without a cursor
+
+    Returns:
+        dict[str, Any]: Bind parameters keyed by name
+    """
+    parameters: dict[str, Any] = {"limit": limit + 1, "settled_before": utc_now() - timedelta(seconds=settings.changes_settle_seconds)}
+    if user_id is not None:
+        parameters["user_id"] = user_id
+    if cursor is not None:
+        parameters["cursor_updated_on"], parameters["cursor_id"] = cursor
+    return parameters
+
+
+# Ownership and status are checked by the UPDATE itself, so a cancellation takes one statement without loading the row
+CANCEL_PENDING_OBSERVATION = (
+    update(Observation)
+    .where(
+        Observation.id == bindparam("observation_id"),
+        Observation.user_id == bindparam("user_id"),
+        Observation.status == ObservationStatusEnum.PENDING,
+    )
+    .values(status=ObservationStatusEnum.CANCELLED, completed_on=bindparam("completed_on"))
+    .execution_options(synchronize_session=False)
+)
+
+
+def _encode_changes_cursor(updated_on: datetime, observation_id: int) -> str:
+    """Encode the position of the last delivered change as an opaque, URL-safe cursor."""
+    return base64.urlsafe_b64encode(f"{updated_on.isoformat()}|{observation_id}".encode()).decode("ascii")
+
+
+def _decode_changes_cursor(cursor: str) -> tuple[datetime, int]:
+    """
+    Decode a cursor produced by `_encode_changes_cursor`.
+
+    Args:
+        cursor: The opaque cursor received from the client
+
+    Returns:
+        tuple[datetime, int]: The `updated_on` timestamp and ID of the last delivered change
+
+    Raises:
+        HTTPException: If the cursor is malformed
+    """
+    try:
+        updated_on, _, observation_id = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8").partition("|")
+        return datetime.fromisoformat(updated_on), int(observation_id)
+    except (ValueError, UnicodeError, binascii.Error) as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid changes cursor",
+        ) from exc
+
+
+async def _resolve_submitting_user(db: AsyncSession, principal: AuthPrincipal | None, requestor: UserCreate | None) -> User:
+    """
+    Resolve the local user a submission is made on behalf of.
+
+    Args:
+        db: Database session dependency
+        principal: Optional authenticated user information from Supabase JWT
+        requestor: Optional guest requestor information from the payload
+
+    Returns:
+        User: The authenticated or guest local user
+
+    Raises:
+        HTTPException: If the request is neither authenticated nor carries requestor information
+    """
+    if principal is not None:
+        return await get_or_create_local_user_from_principal(db, principal)
+
+    if not requestor:
+        logger.warning("Unauthorized attempt to submit observation without authentication or requestor information")
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Authentication is required to submit an observation",
+        )
+
+    return await get_or_create_guest_user(db, requestor)
+
+
+async def _resolve_reading_user(db: AsyncSession, principal: AuthPrincipal) -> User:
+    """
+    Resolve the local user of a read request from a read-only session.
+
+    Only a user's first request creates (or relinks, see `get_or_create_local_user_from_principal`) the local user,
+    which is done in a short-lived session on the primary.
+
+    Args:
+        db: Read-only database session
+        principal: The verified Supabase principal
+
+    Returns:
+        User: The local user
+    """
+    user = await get_local_user_by_user_id(db, principal.subject)
+    if user is not None:
+        return user
+
+    async with get_db_session() as write_db:
+        return await get_or_create_local_user_from_principal(write_db, principal)
+
+
+def _new_observation_values(user_id: int, observation: ObservationCreate, curr_timestamp: datetime) -> dict[str, Any]:
+    """
+    Build the column values of a new pending observation row, submitted after reserving its quota.
+
+    Args:
+        user_id: ID of the user submitting the observation
+        observation: The observation parameters
+        curr_timestamp: Submission timestamp, used for the generated ID and the creation/update timestamps
+
+    Returns:
+        dict[str, Any]: Column values keyed by attribute name
+    """
+    # Generate unique observation ID
+    observation_id = f"obs_{curr_timestamp.strftime('%Y%m%d')}_{uuid.uuid4().hex[:8]}"
+
+    return {
+        "user_id": user_id,
+        "target_name": observation.target_name or observation_id,
+        "ra": observation.ra,
+        "dec": observation.dec,
+        "bandwidth": observation.bandwidth,
+        "center_frequency": observation.center_frequency,
+        "velocity_frame": observation.velocity_frame,
+        "observation_type": observation.observation_type,
+        "fft_size": observation.fft_size,
+        "integration_time": observation.integration_time,
+        "planned_start": observation.planned_start.replace(tzinfo=None) if observation.planned_start else None,
+        "output_filename": observation.output_filename,
+        "receive_csv": observation.receive_csv,
+        "perform_data_analysis": observation.perform_data_analysis,
+        "status": ObservationStatusEnum.PENDING,
+        "quota_reserved": True,
+        "created_on": curr_timestamp,
+        "updated_on": curr_timestamp,
+    }
+
+
+def _observation_constraint_errors(index: int, observation: ObservationCreate) -> list[dict[str, Any]]:
+    """
+    Check an observation against the table's check constraints before it reaches the database.
+
+    Args:
+        index: Position of the observation in the submitted batch
+        observation: The observation parameters
+
+    Returns:
+        list[dict[str, Any]]: Validation errors in the same shape as FastAPI's request validation errors
+    """
+    errors: list[dict[str, Any]] = []
+    if not 0 <= observation.ra < 360:  # noqa: PLR2004
+        errors.append({"loc": ["body", "observations", index, "ra"], "msg": "Right Ascension must be in [0, 360)", "input": observation.ra})
+    if not -90 <= observation.dec <= 90:  # noqa: PLR2004
+        errors.append({"loc": ["body", "observations", index, "dec"], "msg": "Declination must be in [-90, 90]", "input": observation.dec})
+    if observation.integration_time <= 0:
+        errors.append(
+            {
+                "loc": ["body", "observations", index, "integration_time"],
+                "msg": "Integration time must be positive",
+                "input": observation.integration_time,
+            },
+        )
+    return errors
+
 
 @router.post(
     "/",
     description="Submit a new telescope observation request.",
     status_code=status.HTTP_202_ACCEPTED,
+    dependencies=[*write_admission, Depends(query_budget(SUBMIT_QUERY_BUDGET))],
     responses={
         status.HTTP_202_ACCEPTED: {"description": "Observation request accepted"},
-        status.HTTP_503_SERVICE_UNAVAILABLE: {"description": "Telescope service unavailable"},
+        status.HTTP_429_TOO_MANY_REQUESTS: {"description": "Too many requests from this client, or daily quota exceeded"},
+        status.HTTP_503_SERVICE_UNAVAILABLE: {"description": "Telescope service unavailable or overloaded"},
     },
 )
-async def submit_observation(
+async def submit_observation(  # noqa: PLR0913, PLR0917
     payload: ObservationSubmissionRequest,
+    request: Request,
+    response: Response,
     db: Annotated[AsyncSession, Depends(get_db)],
     principal: Annotated[AuthPrincipal | None, Depends(get_optional_principal)],
+    idempotency_key: Annotated[
+        str | None,
+        Header(min_length=1, max_length=255, description="Client generated key making retries of this submission safe"),
+    ] = None,
 ) -> ObservationRead:
     """
     Submit a new telescope observation request.
 
+    When an `Idempotency-Key` header is sent, the response is stored together with the observation and retries with the same key
+    get the original response back from a single indexed lookup, without creating another observation or sending another email.
+
     Args:
         payload: Observation submission details, consisting of observation parameters and optional requestor information for guest users.
+        request: Incoming request, whose client address scopes the idempotency keys of guests
+        response: Response used to flag replayed results
         db: Database session dependency
         principal: Optional authenticated user information from Supabase JWT
+        idempotency_key: Optional client generated key identifying this submission across retries
 
     Returns:
         ObservationRead: Confirmation with observation ID and status
@@ -64,59 +317,60 @@ async def submit_observation(
     Raises:
         HTTPException: If submission fails
     """
-    try:
-        if principal is not None:
-            user: User = await get_or_create_local_user_from_principal(db, principal)
-        else:
-            if not payload.requestor:
-                logger.warning("Unauthorized attempt to submit observation without authentication or requestor information")
-                raise HTTPException(  # noqa: TRY301
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="Authentication is required to submit an observation",
-                )
-
-            user = await get_or_create_guest_user(db, payload.requestor)
+    idempotent_request = build_idempotent_request(
+        idempotency_key,
+        principal,
+        payload.requestor,
+        payload,
+        request.client.host if request.client else None,
+    )
+    if idempotent_request is not None:
+        stored_response = await get_stored_response(db, idempotent_request)
+        if stored_response is not None:
+            logger.info("Replaying stored response for idempotency key %s of %s", idempotent_request.key, idempotent_request.scope)
+            response.headers["Idempotent-Replayed"] = "true"
+            return stored_response
 
+    try:
+        user = await _resolve_submitting_user(db, principal, payload.requestor)
         curr_timestamp = utc_now()
-
-        # Generate unique observation ID
-        observation_id = f"obs_{curr_timestamp.strftime('%Y%m%d')}_{uuid.uuid4().hex[:8]}"
+        await reserve_observation_quota(db, user.id, curr_timestamp.date(), [payload.observation])
 
         # Create observation record
-        db_observation = Observation(
-            user_id=user.id,
-            target_name=payload.observation.target_name or observation_id,
-            ra=payload.observation.ra,
-            dec=payload.observation.dec,
-            bandwidth=payload.observation.bandwidth,
-            center_frequency=payload.observation.center_frequency,
-            velocity_frame=payload.observation.velocity_frame,
-            observation_type=payload.observation.observation_type,
-            fft_size=payload.observation.fft_size,
-            integration_time=payload.observation.integration_time,
-            planned_start=payload.observation.planned_start.replace(tzinfo=None) if payload.observation.planned_start else None,
-            output_filename=payload.observation.output_filename,
-            receive_csv=payload.observation.receive_csv,
-            perform_data_analysis=payload.observation.perform_data_analysis,
-            status=ObservationStatusEnum.PENDING,
-            created_on=curr_timestamp,
-            updated_on=curr_timestamp,
-        )
+        db_observation = Observation(**_new_observation_values(user.id, payload.observation, curr_timestamp))
 
-        # Persist observation in database
+        # Persist observation in database, together with the response to replay if this request is retried
         db.add(db_observation)
-        await db.commit()
-        await db.refresh(db_observation)
-
+        if idempotent_request is not None:
+            await db.flush()
+            store_response(db, idempotent_request, status.HTTP_202_ACCEPTED, ObservationRead.model_validate(db_observation).model_dump(mode="json"))
+
+        try:
+            await db.commit()
+        except IntegrityError:
+            if idempotent_request is None:
+                raise
+            # A concurrent retry with the same key committed first, return its result instead of a duplicate
+            await db.rollback()
+            stored_response = await get_stored_response(db, idempotent_request)
+            if stored_response is None:
+                raise
+            response.headers["Idempotent-Replayed"] = "true"
+            return stored_response
+
+        # The INSERT returned the generated ID and every other column was set above, so there is nothing to refresh
         logger.info(
             "Submitted observation request: %s for target %s by user %s",
-            observation_id,
-            payload.observation.target_name,
+            db_observation.id,
+            db_observation.target_name,
             user.username,
         )
 
         # Send confirmation email to user
         # TODO @dyka3773: Make this a background task so we don't block the request on email sending  # noqa: FIX002
+        # The email subsystem (SMTP client, MIME and templates) is only imported once the first email is sent
+        from backend.utils.email.service import send_observation_confirmation_email  # noqa: PLC0415
+
         await send_observation_confirmation_email(db_observation, user)
     except HTTPException:
         raise
@@ -131,6 +385,80 @@ async def submit_observation(
         return ObservationRead.model_validate(db_observation).model_dump()
 
 
+@router.post(
+    "/batch",
+    description="Submit several telescope observation requests at once.",
+    status_code=status.HTTP_202_ACCEPTED,
+    dependencies=write_admission,
+    responses={
+        status.HTTP_202_ACCEPTED: {"description": "Observation requests accepted"},
+        status.HTTP_422_UNPROCESSABLE_CONTENT: {"description": "One or more observations are invalid, none were submitted"},
+        status.HTTP_429_TOO_MANY_REQUESTS: {"description": "Too many requests from this client, or daily quota exceeded"},
+        status.HTTP_503_SERVICE_UNAVAILABLE: {"description": "Telescope service unavailable or overloaded"},
+    },
+)
+async def submit_observation_batch(
+    payload: ObservationBatchSubmissionRequest,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    principal: Annotated[AuthPrincipal | None, Depends(get_optional_principal)],
+) -> list[ObservationRead]:
+    """
+    Submit several telescope observation requests at once.
+
+    The whole batch is validated up front and inserted with a single multi-row `INSERT ... RETURNING`,
+    in one transaction and with one summary confirmation email, so either every observation is accepted or none is.
+
+    Args:
+        payload: Batch submission details, consisting of the observations and optional requestor information for guest users.
+        db: Database session dependency
+        principal: Optional authenticated user information from Supabase JWT
+
+    Returns:
+        list[ObservationRead]: The accepted observations, in submission order
+
+    Raises:
+        HTTPException: If the batch is invalid or submission fails
+    """
+    errors = [error for index, observation in enumerate(payload.observations) for error in _observation_constraint_errors(index, observation)]
+    if errors:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+            detail=errors,
+        )
+
+    try:
+        user = await _resolve_submitting_user(db, principal, payload.requestor)
+
+        curr_timestamp = utc_now()
+        await reserve_observation_quota(db, user.id, curr_timestamp.date(), payload.observations)
+        rows = [_new_observation_values(user.id, observation, curr_timestamp) for observation in payload.observations]
+
+        # insertmanyvalues renders this as multi-row INSERT ... VALUES (...), (...) RETURNING statements, returned in input order
+        result = await db.scalars(insert(Observation).returning(Observation, sort_by_parameter_order=True), rows)
+        db_observations: Sequence[Observation] = result.all()
+        await db.commit()
+
+        logger.info(
+            "Submitted batch of %s observation requests by user %s",
+            len(db_observations),
+            user.username,
+        )
+
+        from backend.utils.email.service import send_observation_batch_confirmation_email  # noqa: PLC0415
+
+        await send_observation_batch_confirmation_email(db_observations, user)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.exception("Failed to submit observation batch")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"Failed to submit observations: {e!s}",
+        ) from e
+    else:
+        return [ObservationRead.model_validate(obs).model_dump() for obs in db_observations]
+
+
 @router.get(
     "/",
     description="Get a list of all telescope observations for the authenticated user.",
@@ -141,14 +469,14 @@ async def submit_observation(
     },
 )
 async def list_observations(
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_read_db)],
     principal: Annotated[AuthPrincipal | None, Depends(get_optional_principal)],
 ) -> list[ObservationRead]:
     """
     Get a list of all telescope observations for the authenticated user.
 
     Args:
-        db: Database session dependency
+        db: Read-only database session dependency
         principal: Optional authenticated user information from Supabase JWT
 
     Returns:
@@ -158,11 +486,11 @@ async def list_observations(
         HTTPException: If user is not authenticated
     """
     try:
-        observation_query = select(Observation)
+        parameters: dict[str, Any] = {}
 
         if principal is not None:
-            user = await get_or_create_local_user_from_principal(db, principal)
-            observation_query = observation_query.where(Observation.user_id == user.id)
+            user = await _resolve_reading_user(db, principal)
+            parameters["user_id"] = user.id
         elif not settings.debug_allow_guest_history:
             logger.warning("Unauthorized attempt to list observations without authentication")
             raise HTTPException(  # noqa: TRY301
@@ -170,7 +498,7 @@ async def list_observations(
                 detail="Authentication is required",
             )
 
-        observation_list: Result[tuple[Observation]] = await db.execute(observation_query.order_by(Observation.created_on.desc()))
+        observation_list: Result[tuple[Observation]] = await db.execute(LIST_STATEMENTS[principal is not None], parameters)
         observations: Sequence[Observation] = observation_list.scalars().all()
     except HTTPException:
         raise
@@ -184,10 +512,167 @@ async def list_observations(
         return [ObservationRead.model_validate(obs).model_dump() for obs in observations]
 
 
+@router.get(
+    "/summary",
+    description="Count the authenticated user's observations per status.",
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_200_OK: {"description": "Observation counts retrieved successfully"},
+        status.HTTP_401_UNAUTHORIZED: {"description": "Unauthorized"},
+    },
+)
+async def get_observation_summary(
+    db: Annotated[AsyncSession, Depends(get_read_db)],
+    principal: Annotated[AuthPrincipal | None, Depends(get_optional_principal)],
+) -> ObservationSummary:
+    """
+    Count the authenticated user's observations per status, from the counters maintained by the database.
+
+    Args:
+        db: Read-only database session dependency
+        principal: Optional authenticated user information from Supabase JWT
+
+    Returns:
+        ObservationSummary: Number of observations per status
+
+    Raises:
+        HTTPException: If user is not authenticated
+    """
+    if principal is not None:
+        user = await _resolve_reading_user(db, principal)
+        return ObservationSummary.from_counts(await user_observation_counts(db, user.id))
+
+    if not settings.debug_allow_guest_history:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Authentication is required",
+        )
+    # Guests see every observation in the list, their summary counts them all as well
+    return ObservationSummary.from_counts(await observation_status_counts(db))
+
+
+@router.get(
+    "/changes",
+    description="Get the authenticated user's observations that changed since a delta sync cursor.",
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_200_OK: {"description": "Changed observations retrieved successfully"},
+        status.HTTP_400_BAD_REQUEST: {"description": "Invalid cursor"},
+        status.HTTP_401_UNAUTHORIZED: {"description": "Unauthorized"},
+    },
+)
+async def list_observation_changes(
+    db: Annotated[AsyncSession, Depends(get_read_db)],
+    principal: Annotated[AuthPrincipal | None, Depends(get_optional_principal)],
+    since: Annotated[str | None, Query(description="Cursor returned by a previous call; omit for a full initial sync")] = None,
+    limit: Annotated[int, Query(ge=1, le=MAX_CHANGES_PAGE_SIZE, description="Maximum number of changes to return")] = 100,
+) -> ObservationChanges:
+    """
+    Get the observations whose `updated_on` advanced past the given cursor, including cancellations.
+
+    Changes are returned in `(updated_on, id)` order so the returned cursor can be used to resume exactly after the last change.
+    Changes made in the last `changes_settle_seconds` are held back until no transaction can still commit a change ordered
+    before them, so a change is never skipped by a cursor that already moved past its position.
+
+    Args:
+        db: Read-only database session dependency
+        principal: Optional authenticated user information from Supabase JWT
+        since: Cursor returned by a previous call, or None for a full initial sync
+        limit: Maximum number of changes to return
+
+    Returns:
+        ObservationChanges: The changed observations and the cursor to resume from
+
+    Raises:
+        HTTPException: If user is not authenticated or the cursor is invalid
+    """
+    user_id = None
+    if principal is not None:
+        user = await _resolve_reading_user(db, principal)
+        user_id = user.id
+    elif not settings.debug_allow_guest_history:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Authentication is required",
+        )
+
+    cursor = _decode_changes_cursor(since) if since is not None else None
+    parameters = changes_parameters(limit=limit, user_id=user_id, cursor=cursor)
+
+    result: Result[tuple[Observation]] = await db.execute(CHANGES_STATEMENTS[principal is not None, since is not None], parameters)
+    observations: Sequence[Observation] = result.scalars().all()
+
+    page = observations[:limit]
+    next_cursor = _encode_changes_cursor(page[-1].updated_on, page[-1].id) if page else since or ""
+
+    return ObservationChanges(
+        observations=[ObservationRead.model_validate(obs) for obs in page],
+        next_cursor=next_cursor,
+        has_more=len(observations) > limit,
+    )
+
+
+@router.get(
+    "/events",
+    description="Stream status changes of the authenticated user's observations as Server-Sent Events.",
+    response_class=EventSourceResponse,
+    responses={
+        status.HTTP_200_OK: {"description": "Event stream opened"},
+        status.HTTP_401_UNAUTHORIZED: {"description": "Unauthorized"},
+    },
+)
+async def stream_observation_events(
+    principal: Annotated[AuthPrincipal | None, Depends(get_optional_principal)],
+) -> AsyncGenerator[ServerSentEvent]:
+    """
+    Stream status changes of the authenticated user's observations.
+
+    The user is resolved with a short-lived session so no database connection is held while the stream is open;
+    events are then delivered from the worker's shared change listener.
+
+    Args:
+        principal: Optional authenticated user information from Supabase JWT
+
+    Yields:
+        ServerSentEvent: One `status` event per observation status transition
+
+    Raises:
+        HTTPException: If user is not authenticated
+    """
+    if principal is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Authentication is required",
+        )
+
+    async with get_db_session() as db:
+        user = await get_or_create_local_user_from_principal(db, principal)
+        user_id = user.id
+
+    async with observation_event_broker.subscription(user_id) as events:
+        while True:
+            event = await events.get()
+            yield ServerSentEvent(
+                data=event.to_dict(),
+                event="status",
+                id=f"{event.observation_id}:{event.updated_on}",
+            )
+
+
+def _terminal_observation_response(body: bytes) -> Response:
+    """Respond with a serialized terminal observation, which clients may cache as it never changes again."""
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={"Cache-Control": f"private, max-age={settings.observation_cache_max_age}, immutable"},
+    )
+
+
 @router.get(
     "/{observation_id}",
     description="Get details of a specific telescope observation by ID.",
     status_code=status.HTTP_200_OK,
+    response_model=ObservationRead,
     responses={
         status.HTTP_200_OK: {"description": "Observation details retrieved successfully"},
         status.HTTP_404_NOT_FOUND: {"description": "Observation not found"},
@@ -195,26 +680,35 @@ async def list_observations(
 )
 async def get_observation(
     observation_id: int,
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_read_db)],
     principal: Annotated[AuthPrincipal | None, Depends(get_optional_principal)],
-) -> ObservationRead:
+) -> Response:
     """
     Get details of a specific telescope observation by ID.
 
+    Completed, failed and cancelled observations never change again: once loaded they are served from the worker's
+    `observation_response_cache` without touching the database, and sent with `Cache-Control: private, immutable`.
+
     Args:
         observation_id: ID of the observation to retrieve
-        db: Database session dependency
+        db: Read-only database session dependency
         principal: Optional authenticated user information from Supabase JWT
 
     Returns:
-        ObservationRead: Details of the requested observation
+        Response: JSON details of the requested observation
 
     Raises:
         HTTPException: If observation not found
     """
+    cached = observation_response_cache.get(observation_id)
+    if cached is not None and (
+        (principal is not None and cached.owner == principal.subject) or (principal is None and settings.debug_allow_guest_history)
+    ):
+        return _terminal_observation_response(cached.body)
+
     # TODO @dyka3773: Refactor to only fetch the requested observation if the user is authenticated and it belongs to them or is made by a guest  # noqa: FIX002
     #                 To do that we can filter using the user_id from the principal or if the user it belongs to has auth_provider='guest'
-    result = await db.execute(select(Observation).where(Observation.id == observation_id))
+    result = await db.execute(OBSERVATION_BY_ID, {"observation_id": observation_id})
     observation = result.scalar_one_or_none()
     if observation is None:
         raise HTTPException(
@@ -223,7 +717,7 @@ async def get_observation(
         )
 
     if principal is not None:
-        user = await get_or_create_local_user_from_principal(db, principal)
+        user = await _resolve_reading_user(db, principal)
         if observation.user_id != user.id:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -235,16 +729,25 @@ async def get_observation(
             detail="Authentication is required",
         )
 
-    return ObservationRead.model_validate(observation).model_dump()
+    body = ObservationRead.model_validate(observation).model_dump_json().encode()
+    if observation.status not in TERMINAL_STATUSES:
+        return Response(content=body, media_type="application/json")
+
+    # Cached for the principal it was checked for, other principals go through the ownership check above once
+    observation_response_cache.put(observation_id, principal.subject if principal is not None else None, body)
+    return _terminal_observation_response(body)
 
 
 @router.delete(
     "/{observation_id}",
     description="Cancel a pending telescope observation request.",
     status_code=status.HTTP_204_NO_CONTENT,
+    dependencies=write_admission,
     responses={
         status.HTTP_204_NO_CONTENT: {"description": "Observation cancelled successfully"},
         status.HTTP_404_NOT_FOUND: {"description": "Observation not found"},
+        status.HTTP_429_TOO_MANY_REQUESTS: {"description": "Too many requests from this client"},
+        status.HTTP_503_SERVICE_UNAVAILABLE: {"description": "Service overloaded"},
     },
 )
 async def cancel_observation(
@@ -265,15 +768,13 @@ async def cancel_observation(
     """
     # TODO @dyka3773: Refactor to only allow cancellation if the user is authenticated and it belongs to them or is made by a guest  # noqa: FIX002
     #                 To do that we can filter using the user_id from the principal or if the user it belongs to has auth_provider='guest'
-    result = await db.execute(select(Observation).where(Observation.id == observation_id))
-    observation = result.scalar_one_or_none()
-    if observation is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Observation not found",
-        )
-
     if principal is None:
+        result = await db.execute(OBSERVATION_BY_ID, {"observation_id": observation_id})
+        if result.scalar_one_or_none() is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Observation not found",
+            )
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Authentication is required",
@@ -281,20 +782,23 @@ async def cancel_observation(
 
     user = await get_or_create_local_user_from_principal(db, principal)
 
-    if observation.user_id != user.id:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Observation not found",
-        )
-
-    if observation.status != ObservationStatusEnum.PENDING:
+    result = await db.execute(
+        CANCEL_PENDING_OBSERVATION,
+        {"observation_id": observation_id, "user_id": user.id, "completed_on": utc_now()},
+    )
+    if result.rowcount == 0:
+        # Nothing was cancelled, load the observation only to tell why
+        result = await db.execute(OBSERVATION_BY_ID, {"observation_id": observation_id})
+        observation = result.scalar_one_or_none()
+        if observation is None or observation.user_id != user.id:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Observation not found",
+            )
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="Only pending observations can be cancelled",
         )
 
-    observation.status = ObservationStatusEnum.CANCELLED
-    observation.completed_on = utc_now()
-    db.add(observation)
     await db.commit()
     logger.info("Cancelled observation request: %s", observation_id)
@@ -2,15 +2,22 @@
 
 import logging
 from datetime import UTC, datetime
+from typing import Annotated
 
-from fastapi import APIRouter, status
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.configs.config import settings
-from backend.models import StatusResponse
+from backend.database import get_read_db
+from backend.models import ObservationSummary, StatusResponse
+from backend.models.enums.observation_status import ObservationStatusEnum
+from backend.utils.observation_counters import observation_status_counts, observations_submitted_on
+from backend.utils.timing import TimedRoute, route_timings
 
 router = APIRouter(
     prefix="/web",
     tags=["Web"],
+    route_class=TimedRoute,
     responses={
         status.HTTP_200_OK: {"description": "Successful Response"},
     },
@@ -50,21 +57,57 @@ async def health_check() -> StatusResponse:
         status.HTTP_200_OK: {"description": "System status retrieved successfully"},
     },
 )
-async def get_system_status() -> StatusResponse:
+async def get_system_status(db: Annotated[AsyncSession, Depends(get_read_db)]) -> StatusResponse:
     """
     Get overall system status including telescope and observation queue info.
 
+    Observation numbers are read from the counters maintained by the database, not counted per request.
+
+    Args:
+        db: Read-only database session dependency
+
     Returns:
         StatusResponse: System status information
     """
+    now = datetime.now(UTC)
+    summary = ObservationSummary.from_counts(await observation_status_counts(db))
     return StatusResponse(
         status="operational",
         message="All systems nominal",
         data={
-            # TODO @dyka3773: Replace mock data with real-time system metrics  # noqa: FIX002
+            # TODO @dyka3773: Replace mock data with real-time telescope metrics  # noqa: FIX002
             "active_telescopes": 1,
-            "observations_today": 42,
-            "queue_length": 5,
-            "last_updated": datetime.now(UTC).isoformat(),
+            "observations_today": await observations_submitted_on(db, now.date()),
+            "queue_length": summary.counts[ObservationStatusEnum.PENDING],
+            "observations_by_status": summary.model_dump(mode="json")["counts"],
+            "last_updated": now.isoformat(),
         },
     )
+
+
+@router.get(
+    "/timings",
+    description="Get per-route request phase timings of the serving worker process (debug mode only).",
+    responses={
+        status.HTTP_200_OK: {"description": "Route timings retrieved successfully"},
+        status.HTTP_404_NOT_FOUND: {"description": "Not available outside of debug mode"},
+    },
+)
+async def get_route_timings() -> StatusResponse:
+    """
+    Get per-route request phase timings of the serving worker process.
+
+    Raises:
+        HTTPException: If debug mode is disabled
+
+    Returns:
+        StatusResponse: Request count, mean and max duration per route and phase
+    """
+    if not settings.debug:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+
+    return StatusResponse(
+        status="success",
+        message="Route timings of this worker process",
+        data=route_timings.snapshot(),
+    )
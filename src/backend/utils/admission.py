@@ -0,0 +1,205 @@
+"""Admission control for write endpoints: per-client token bucket rate limiting and database pool aware load shedding."""
+
+from __future__ import annotations
+
+import logging
+import math
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Annotated
+
+import sqlalchemy as sa
+from fastapi import Depends, HTTPException, Request, status
+from sqlalchemy import bindparam
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession  # noqa: TC002  # FastAPI resolves the dependency annotations at runtime
+
+from backend.configs.config import settings
+from backend.database import database_pool_stats, get_db
+from backend.models import RateLimitBucket
+from backend.utils.auth import AuthPrincipal, get_optional_principal
+
+if TYPE_CHECKING:
+    from sqlalchemy.sql.dml import ReturningInsert
+    from sqlalchemy.sql.elements import ColumnElement
+
+logger = logging.getLogger("astro_backend")
+
+# Upper bound of buckets kept by a single worker, idle clients are evicted first
+MAX_IN_MEMORY_BUCKETS = 100_000
+
+
+class RateLimiter(ABC):
+    """Token bucket rate limiter keyed by an arbitrary client key."""
+
+    def __init__(self, burst: int, refill_per_second: float) -> None:
+        self.burst = burst
+        self.refill_per_second = refill_per_second
+
+    @abstractmethod
+    async def acquire(self, key: str, db: AsyncSession) -> float:
+        """
+        Take one token from the bucket of a client.
+
+        Args:
+            key: Client the request is attributed to
+            db: Database session of the request
+
+        Returns:
+            float: 0 if the request is admitted, otherwise the seconds until a token becomes available
+        """
+
+    def _retry_after(self, tokens: float) -> float:
+        return max((1 - tokens) / self.refill_per_second, 0.001)
+
+
+@dataclass(slots=True)
+class _Bucket:
+    tokens: float
+    updated: float
+
+
+class InMemoryRateLimiter(RateLimiter):
+    """Rate limiter holding its buckets in the worker process; limits are enforced per worker."""
+
+    def __init__(self, burst: int, refill_per_second: float) -> None:
+        super().__init__(burst, refill_per_second)
+        self._buckets: OrderedDict[str, _Bucket] = OrderedDict()
+
+    async def acquire(self, key: str, db: AsyncSession) -> float:  # noqa: ARG002
+        now = time.monotonic()
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = _Bucket(tokens=self.burst, updated=now)
+            self._buckets[key] = bucket
+            if len(self._buckets) > MAX_IN_MEMORY_BUCKETS:
+                self._buckets.popitem(last=False)
+        else:
+            self._buckets.move_to_end(key)
+            bucket.tokens = min(self.burst, bucket.tokens + (now - bucket.updated) * self.refill_per_second)
+            bucket.updated = now
+
+        if bucket.tokens >= 1:
+            bucket.tokens -= 1
+            return 0
+
+        return self._retry_after(bucket.tokens)
+
+
+def _build_acquire_statement() -> ReturningInsert[tuple[float, bool]]:
+    table = RateLimitBucket.__table__
+    burst = bindparam("burst", type_=sa.Float)
+    elapsed = sa.func.extract("epoch", sa.func.now() - table.c.updated_on)
+    refilled: ColumnElement[float] = sa.func.least(burst, table.c.tokens + elapsed * bindparam("refill_per_second", type_=sa.Float))
+
+    return (
+        insert(RateLimitBucket)
+        .values(key=bindparam("key"), tokens=burst - 1, allowed=True, updated_on=sa.func.now())
+        .on_conflict_do_update(
+            index_elements=[RateLimitBucket.key],
+            set_={
+                "tokens": sa.case((refilled >= 1, refilled - 1), else_=refilled),
+                "allowed": refilled >= 1,
+                "updated_on": sa.func.now(),
+            },
+        )
+        .returning(RateLimitBucket.tokens, RateLimitBucket.allowed)
+    )
+
+
+# Built once per process, see `backend.utils.auth.USER_BY_USER_ID`
+ACQUIRE_TOKEN = _build_acquire_statement()
+
+
+class DatabaseRateLimiter(RateLimiter):
+    """Rate limiter sharing its buckets between all workers through a single atomic upsert per request."""
+
+    async def acquire(self, key: str, db: AsyncSession) -> float:
+        # Committed right away on the request's own session: the bucket row is not kept locked for the rest of the
+        # request, and a request failing later still spends its token
+        result = await db.execute(ACQUIRE_TOKEN, {"key": key, "burst": self.burst, "refill_per_second": self.refill_per_second})
+        tokens, allowed = result.one()
+        await db.commit()
+
+        return 0 if allowed else self._retry_after(tokens)
+
+
+def _build_rate_limiter() -> RateLimiter:
+    if settings.rate_limit_backend == "database":
+        return DatabaseRateLimiter(settings.rate_limit_burst, settings.rate_limit_refill_per_second)
+
+    return InMemoryRateLimiter(settings.rate_limit_burst, settings.rate_limit_refill_per_second)
+
+
+rate_limiter = _build_rate_limiter()
+
+
+async def _rate_limit_key(request: Request, principal: AuthPrincipal | None) -> str:
+    """Attribute a request to the principal subject, then the guest requestor email, then the client IP."""
+    if principal is not None:
+        return f"user:{principal.subject}"
+
+    try:
+        body = await request.json()
+    except ValueError:
+        body = None
+
+    requestor = body.get("requestor") if isinstance(body, dict) else None
+    email = requestor.get("email") if isinstance(requestor, dict) else None
+    if isinstance(email, str) and email:
+        return f"guest:{email.strip().lower()}"
+
+    return f"ip:{request.client.host if request.client else 'unknown'}"
+
+
+async def shed_load_when_database_saturated() -> None:
+    """
+    Fail fast instead of queueing once too many requests already wait for a database connection.
+
+    Raises:
+        HTTPException: 503 with a `Retry-After` header when the pool wait queue is saturated
+    """
+    waiting = database_pool_stats()["waiting"]
+    if waiting >= settings.load_shed_max_pool_waiters:
+        logger.warning("Shedding write request, %s requests are already waiting for a database connection", waiting)
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="The service is overloaded, please retry shortly",
+            headers={"Retry-After": str(settings.load_shed_retry_after_seconds)},
+        )
+
+
+async def enforce_rate_limit(
+    request: Request,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    principal: Annotated[AuthPrincipal | None, Depends(get_optional_principal)],
+) -> None:
+    """
+    Admit a write request only if its client still has tokens left.
+
+    Args:
+        request: The incoming request
+        db: Database session of the request, shared with the route (FastAPI caches dependencies per request)
+        principal: Optional authenticated user information from Supabase JWT
+
+    Raises:
+        HTTPException: 429 with a `Retry-After` header when the client exceeded its rate
+    """
+    if not settings.rate_limit_enabled:
+        return
+
+    key = await _rate_limit_key(request, principal)
+    retry_after = await rate_limiter.acquire(key, db)
+    if retry_after > 0:
+        logger.warning("Rate limited write request of %s", key)
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many requests, please slow down",
+            headers={"Retry-After": str(math.ceil(retry_after))},
+        )
+
+
+# Load shedding runs first, so saturated workers reject requests before spending time on JWT verification
+write_admission = [Depends(shed_load_when_database_saturated), Depends(enforce_rate_limit)]
@@ -4,24 +4,28 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
-from functools import lru_cache
 from hashlib import sha256
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Annotated, Any
 
-import jwt
-from fastapi import Header, HTTPException, status
-from jwt import PyJWKClient
+from fastapi import Depends, Header, HTTPException, status
+from sqlalchemy import bindparam
 from sqlalchemy.exc import IntegrityError
 from sqlmodel import select
 
 from backend.configs.config import settings
 from backend.models import User, UserCreate
+from backend.utils.timing import request_phase
 
 if TYPE_CHECKING:
     from sqlalchemy.ext.asyncio import AsyncSession
 
 logger = logging.getLogger("astro_backend")
 
+# Hot statements are built once per process: executing them only binds parameters, and their cache key (memoized on the
+# statement) finds the compiled SQL in the engine's compiled cache, instead of building and hashing a new statement per request
+USER_BY_USER_ID = select(User).where(User.user_id == bindparam("user_id"))
+USER_BY_EMAIL = select(User).where(User.email == bindparam("email"))
+
 
 @dataclass(slots=True)
 class AuthPrincipal:
@@ -61,62 +65,6 @@ def _derive_username(email: str, subject: str) -> str:
     return f"{_normalize_username(local_part)}_{digest}"
 
 
-@lru_cache(maxsize=1)
-def _jwks_client() -> PyJWKClient:
-    """
-    Get a cached PyJWKClient instance for fetching JWKS keys.
-
-    Raises:
-        RuntimeError: If the Supabase JWKS URL is not configured
-
-    Returns:
-        PyJWKClient: A cached PyJWKClient instance
-    """
-    jwks_url = settings.supabase_jwks_endpoint
-    if not jwks_url:
-        msg = "Supabase JWKS URL is not configured"
-        raise RuntimeError(msg)
-
-    return PyJWKClient(jwks_url)
-
-
-def _decode_supabase_token(token: str) -> dict[str, Any]:
-    """
-    Decode and verify a Supabase JWT, returning the claims if valid.
-
-    Args:
-        token (str): The JWT token to decode and verify
-
-    Raises:
-        RuntimeError: If the Supabase issuer URL is not configured
-        ValueError: If the JWT header is missing the algorithm
-
-    Returns:
-        dict[str, Any]: The decoded JWT claims
-    """
-    issuer = settings.supabase_issuer_url
-    if not issuer:
-        msg = "Supabase issuer URL is not configured"
-        raise RuntimeError(msg)
-
-    # Get the algorithm from the JWT header
-    header = jwt.get_unverified_header(token)
-    algorithm = header.get("alg")
-    if not algorithm:
-        msg = "JWT header missing algorithm"
-        raise ValueError(msg)
-
-    signing_key: jwt.PyJWK = _jwks_client().get_signing_key_from_jwt(token)
-    return jwt.decode(
-        token,
-        signing_key.key,
-        algorithms=[signing_key.algorithm_name],
-        audience=settings.supabase_audience,
-        issuer=issuer,
-        options={"require": ["exp", "iat", "sub"]},
-    )
-
-
 async def get_optional_principal(authorization: str | None = Header(default=None)) -> AuthPrincipal | None:
     """
     Return a verified Supabase principal if the request carries a bearer token.
@@ -139,7 +87,11 @@ async def get_optional_principal(authorization: str | None = Header(default=None
         )
 
     try:
-        claims = _decode_supabase_token(token.strip())
+        with request_phase("auth"):
+            # PyJWT and its crypto backend load on first use, the worker warm-up loads them before serving requests
+            from backend.utils.jwks import decode_supabase_token  # noqa: PLC0415
+
+            claims = decode_supabase_token(token.strip())
     except Exception as exc:
         logger.warning("Failed to decode Supabase token: %s", exc)
         raise HTTPException(
@@ -158,6 +110,33 @@ async def get_optional_principal(authorization: str | None = Header(default=None
     return AuthPrincipal(subject=subject, email=email, username=_derive_username(email, subject), claims=claims)
 
 
+async def require_admin(principal: Annotated[AuthPrincipal | None, Depends(get_optional_principal)]) -> AuthPrincipal:
+    """
+    Return the verified principal if it belongs to an administrator (see `admin_user_ids`).
+
+    Args:
+        principal: The verified principal of the request, if any
+
+    Returns:
+        AuthPrincipal: The administrator's principal
+
+    Raises:
+        HTTPException: 401 without a valid token, 403 if the user is not an administrator
+    """
+    if principal is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Authentication is required",
+        )
+    if principal.subject not in settings.admin_user_ids:
+        logger.warning("User %s attempted to use an admin endpoint", principal.subject)
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Administrator privileges are required",
+        )
+    return principal
+
+
 def build_guest_user(requestor: UserCreate) -> UserCreate:
     """Normalize a guest requestor payload for persistence."""
     return UserCreate(
@@ -189,7 +168,7 @@ async def get_local_user_by_user_id(db: AsyncSession, user_id: str) -> User | No
     Returns:
         User | None: The local user if found, otherwise None
     """
-    result = await db.execute(select(User).where(User.user_id == user_id))
+    result = await db.execute(USER_BY_USER_ID, {"user_id": user_id})
     return result.scalar_one_or_none()
 
 
@@ -204,7 +183,7 @@ async def get_local_user_by_email(db: AsyncSession, email: str) -> User | None:
     Returns:
         User | None: The local user if found, otherwise None
     """
-    result = await db.execute(select(User).where(User.email == email))
+    result = await db.execute(USER_BY_EMAIL, {"email": email})
     return result.scalar_one_or_none()
 
 
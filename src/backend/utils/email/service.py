@@ -1,6 +1,8 @@
 """Email service for sending observation confirmation emails."""
 
 import logging
+import time
+from collections.abc import Sequence
 from email.mime.multipart import MIMEMultipart
 from typing import TYPE_CHECKING
 
@@ -9,14 +11,28 @@ import aiosmtplib
 from backend.configs.config import settings
 from backend.models.observation import Observation
 from backend.models.user import User
-from backend.utils.email.templates.html import create_html_email_body_for_completion, create_html_email_body_for_confirmation
-from backend.utils.email.templates.text import create_text_email_body_for_completion, create_text_email_body_for_confirmation
+from backend.utils.email.templates.html import (
+    create_html_email_body_for_batch_confirmation,
+    create_html_email_body_for_completion,
+    create_html_email_body_for_confirmation,
+)
+from backend.utils.email.templates.text import (
+    create_text_email_body_for_batch_confirmation,
+    create_text_email_body_for_completion,
+    create_text_email_body_for_confirmation,
+)
+from backend.utils.metrics import Histogram, registry
+from backend.utils.timing import request_phase
 
 if TYPE_CHECKING:
     from email.mime.text import MIMEText
 
 logger = logging.getLogger("astro_backend")
 
+EMAIL_SEND_DURATION = registry.register(
+    Histogram("email_send_duration_seconds", "Time spent delivering an email to the SMTP server", ("outcome",)),
+)
+
 
 async def send_observation_confirmation_email(observation: Observation, user: User) -> None:
     """
@@ -60,6 +76,47 @@ async def send_observation_confirmation_email(observation: Observation, user: Us
         # The observation is already saved, so we just log the error
 
 
+async def send_observation_batch_confirmation_email(observations: Sequence[Observation], user: User) -> None:
+    """
+    Send a single summary email to the user after a successful batch submission.
+
+    Args:
+        observations: The submitted observations
+        user: The user who submitted the observations
+
+    Raises:
+        Exception: If email sending fails
+    """
+    try:
+        # Create message
+        message = MIMEMultipart("alternative")
+        message["To"] = user.email
+        message["Subject"] = f"Observation Requests Confirmed: {len(observations)} observations"
+
+        # Create email body
+        text_body: MIMEText = create_text_email_body_for_batch_confirmation(observations, user)
+        html_body: MIMEText = create_html_email_body_for_batch_confirmation(observations, user)
+
+        message.attach(text_body)
+        message.attach(html_body)
+
+        # Send email
+        await _send_email(message=message)
+
+        logger.info(
+            "Sent batch confirmation email to %s for %s observations",
+            user.email,
+            len(observations),
+        )
+    except Exception:
+        logger.exception(
+            "Failed to send batch confirmation email to %s for %s observations",
+            user.email,
+            len(observations),
+        )
+        # Don't raise - we don't want email failures to fail the batch submission
+
+
 async def send_observation_completion_email(observation: Observation, user: User) -> None:
     """
     Send an email notification to the user when their observation is completed.
@@ -110,11 +167,17 @@ async def _send_email(message: MIMEMultipart) -> None:
     """
     message["From"] = settings.smtp_sender_email
 
-    await aiosmtplib.send(
-        message,
-        hostname=settings.smtp_server,
-        port=settings.smtp_port,
-        use_tls=settings.smtp_use_tls,
-        username=settings.smtp_username,
-        password=settings.smtp_password,
-    )
+    started, outcome = time.perf_counter(), "failure"
+    try:
+        with request_phase("email"):
+            await aiosmtplib.send(
+                message,
+                hostname=settings.smtp_server,
+                port=settings.smtp_port,
+                use_tls=settings.smtp_use_tls,
+                username=settings.smtp_username,
+                password=settings.smtp_password,
+            )
+        outcome = "success"
+    finally:
+        EMAIL_SEND_DURATION.observe(time.perf_counter() - started, outcome)
@@ -1,4 +1,5 @@
 import html
+from collections.abc import Sequence
 from email.mime.text import MIMEText
 
 from backend.models.observation import Observation
@@ -245,3 +246,105 @@ def create_html_email_body_for_completion(observation: Observation, user: User)
 """,
         _subtype="html",
     )
+
+
+def create_html_email_body_for_batch_confirmation(observations: Sequence[Observation], user: User) -> MIMEText:
+    """Create HTML email body summarizing a batch submission."""
+    summary_rows = "\n".join(
+        f"""<tr>
+                    <td>{html.escape(str(observation.id))}</td>
+                    <td>{html.escape(observation.target_name)}</td>
+                    <td>{html.escape(str(observation.ra))}°</td>
+                    <td>{html.escape(str(observation.dec))}°</td>
+                    <td>{html.escape(str(observation.integration_time))} s</td>
+                </tr>"""
+        for observation in observations
+    )
+
+    return MIMEText(
+        f"""
+<!DOCTYPE html>
+<html>
+<head>
+    <style>
+        body {{
+            font-family: Arial, sans-serif;
+            line-height: 1.6;
+            color: #333;
+        }}
+        .container {{
+            max-width: 600px;
+            margin: 0 auto;
+            padding: 20px;
+        }}
+        .header {{
+            background-color: #4a90e2;
+            color: white;
+            padding: 20px;
+            text-align: center;
+            border-radius: 5px 5px 0 0;
+        }}
+        .content {{
+            background-color: #f9f9f9;
+            padding: 20px;
+            border: 1px solid #ddd;
+            border-radius: 0 0 5px 5px;
+        }}
+        .details {{
+            background-color: white;
+            padding: 15px;
+            margin: 15px 0;
+            border-left: 4px solid #4a90e2;
+            border-collapse: collapse;
+            width: 100%;
+        }}
+        .details th {{
+            color: #4a90e2;
+            text-align: left;
+        }}
+        .details td, .details th {{
+            padding: 4px 8px;
+        }}
+        .footer {{
+            text-align: center;
+            margin-top: 20px;
+            color: #777;
+            font-size: 12px;
+        }}
+    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>Observation Requests Confirmed</h1>
+        </div>
+        <div class="content">
+            <p>Dear {html.escape(user.username)},</p>
+            <p>Your batch of {len(observations)} observation requests has been successfully submitted!</p>
+
+            <table class="details">
+                <tr>
+                    <th>Observation ID</th>
+                    <th>Target Name</th>
+                    <th>RA</th>
+                    <th>Dec</th>
+                    <th>Integration Time</th>
+                </tr>
+                {summary_rows}
+            </table>
+
+            <p>Your observations have been queued for processing. You will receive updates as the observations progress.</p>
+
+            <p>Thank you for using Astro BEAM!</p>
+
+            <p>Best regards,<br>The Astro BEAM Team</p>
+        </div>
+        <div class="footer">
+            <p>This is an automated message. Please do not reply to this email.</p>
+        </div>
+    </div>
+</body>
+</html>
+""",
+        _subtype="html",
+    )
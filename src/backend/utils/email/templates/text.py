@@ -1,3 +1,4 @@
+from collections.abc import Sequence
 from email.mime.text import MIMEText
 
 from backend.models.observation import Observation
@@ -73,3 +74,31 @@ The Astro BEAM Team
 """,
         _subtype="plain",
     )
+
+
+def create_text_email_body_for_batch_confirmation(observations: Sequence[Observation], user: User) -> MIMEText:
+    """Create plain text email body summarizing a batch submission."""
+    summary_lines = "\n".join(
+        f"- #{observation.id} {observation.target_name}: RA {observation.ra}°, Dec {observation.dec}°, {observation.integration_time} seconds"
+        for observation in observations
+    )
+
+    return MIMEText(
+        f"""
+Dear {user.username},
+
+Your batch of {len(observations)} observation requests has been successfully submitted!
+
+Submitted Observations:
+-----------------------
+{summary_lines}
+
+Your observations have been queued for processing. You will receive updates as the observations progress.
+
+Thank you for using Astro BEAM!
+
+Best regards,
+The Astro BEAM Team
+""",
+        _subtype="plain",
+    )
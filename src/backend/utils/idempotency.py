@@ -0,0 +1,150 @@
+"""Helpers for replaying the stored response of requests retried with the same `Idempotency-Key`."""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from datetime import timedelta
+from hashlib import sha256
+from typing import TYPE_CHECKING, Any
+
+from fastapi import HTTPException, status
+from sqlalchemy import bindparam, delete
+from sqlmodel import select
+
+from backend.configs.config import settings
+from backend.models import IdempotencyKey
+from backend.utils.time_utils import utc_now
+
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from backend.models import UserCreate
+    from backend.utils.auth import AuthPrincipal
+
+logger = logging.getLogger("astro_backend")
+
+# Built once per process, see `backend.utils.auth.USER_BY_USER_ID`
+STORED_RESPONSE = select(IdempotencyKey).where(IdempotencyKey.scope == bindparam("scope"), IdempotencyKey.key == bindparam("key"))
+
+
+@dataclass(slots=True, frozen=True)
+class IdempotentRequest:
+    """A request carrying an `Idempotency-Key`, identified by the client it came from and the payload it was sent with."""
+
+    scope: str
+    key: str
+    fingerprint: str
+
+
+def build_idempotent_request(
+    key: str | None,
+    principal: AuthPrincipal | None,
+    requestor: UserCreate | None,
+    payload: BaseModel,
+    client_host: str | None,
+) -> IdempotentRequest | None:
+    """
+    Identify an idempotent request without touching the database.
+
+    Keys are scoped to the principal subject, so the same key sent by two clients never collides. Guests are not
+    authenticated and their user ID is whatever the payload claims, so their keys are scoped to the client IP together
+    with that user ID: another guest can only replay a stored response by sending the same key and user ID from the
+    same address (e.g. behind the same proxy).
+
+    Args:
+        key: The `Idempotency-Key` header value, if any
+        principal: Optional authenticated user information from Supabase JWT
+        requestor: Optional guest requestor information from the payload
+        payload: The request payload
+        client_host: IP address of the client, as seen by the server
+
+    Returns:
+        IdempotentRequest | None: The identified request, or None if no key was sent or the request cannot be attributed to a client
+    """
+    if key is None:
+        return None
+
+    if principal is not None:
+        scope = principal.subject
+    elif requestor is not None:
+        # Hashed, so arbitrarily long claimed user IDs fit the scope column
+        scope = f"guest:{sha256(f'{client_host or "unknown"}|{requestor.user_id}'.encode()).hexdigest()}"
+    else:
+        return None
+
+    return IdempotentRequest(scope=scope, key=key, fingerprint=sha256(payload.model_dump_json().encode("utf-8")).hexdigest())
+
+
+async def get_stored_response(db: AsyncSession, request: IdempotentRequest) -> dict[str, Any] | None:
+    """
+    Look up the stored response of an earlier request sent with the same key, using a single indexed lookup.
+
+    Args:
+        db: Database session dependency
+        request: The idempotent request being handled
+
+    Returns:
+        dict[str, Any] | None: The stored response body, or None if the key has not been used (or has expired)
+
+    Raises:
+        HTTPException: If the key was already used with a different payload
+    """
+    result = await db.execute(STORED_RESPONSE, {"scope": request.scope, "key": request.key})
+    stored = result.scalar_one_or_none()
+    if stored is None:
+        return None
+
+    if stored.expires_on <= utc_now():
+        # Expired but not yet pruned, free the key so it can be stored again with this request
+        await db.delete(stored)
+        await db.flush()
+        return None
+
+    if stored.request_fingerprint != request.fingerprint:
+        logger.warning("Idempotency key %s of %s reused with a different payload", request.key, request.scope)
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+            detail="Idempotency-Key has already been used with a different request payload",
+        )
+
+    return stored.response_body
+
+
+def store_response(db: AsyncSession, request: IdempotentRequest, status_code: int, response_body: dict[str, Any]) -> None:
+    """
+    Add the response of a request to the session, so it is committed atomically with the request's own changes.
+
+    Args:
+        db: Database session dependency
+        request: The idempotent request being handled
+        status_code: HTTP status code of the response
+        response_body: JSON-serializable response body
+    """
+    curr_timestamp = utc_now()
+    db.add(
+        IdempotencyKey(
+            scope=request.scope,
+            key=request.key,
+            request_fingerprint=request.fingerprint,
+            status_code=status_code,
+            response_body=response_body,
+            created_on=curr_timestamp,
+            expires_on=curr_timestamp + timedelta(hours=settings.idempotency_key_ttl_hours),
+        ),
+    )
+
+
+async def delete_expired_idempotency_keys(db: AsyncSession) -> int:
+    """
+    Delete every idempotency key past its expiry.
+
+    Args:
+        db: Database session dependency
+
+    Returns:
+        int: Number of deleted keys
+    """
+    result = await db.execute(delete(IdempotencyKey).where(IdempotencyKey.expires_on <= utc_now()))
+    return result.rowcount
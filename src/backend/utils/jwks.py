@@ -0,0 +1,93 @@
+"""
+Supabase JWT verification against the project's JWKS.
+
+Kept apart from `backend.utils.auth` so PyJWT and its crypto backend are only imported once a token is verified
+(or by the worker warm-up), not whenever the application is imported.
+"""
+
+from functools import lru_cache
+from typing import Any
+
+import jwt
+from jwt import PyJWKClient
+
+from backend.configs.config import settings
+from backend.utils.metrics import Counter, Gauge, registry
+
+JWKS_KEY_LOOKUPS = registry.register(Counter("jwks_key_lookups_total", "Signing key lookups for JWT verification"))
+JWKS_FETCHES = registry.register(Counter("jwks_fetches_total", "JWKS downloads from Supabase, i.e. signing key cache misses"))
+registry.register(
+    Gauge(
+        "jwks_cache_hit_ratio",
+        "Share of signing key lookups served from the JWKS cache",
+        callback=lambda: {(): 1 - JWKS_FETCHES.value() / JWKS_KEY_LOOKUPS.value()} if JWKS_KEY_LOOKUPS.value() else {},
+    ),
+)
+
+
+class _InstrumentedJWKClient(PyJWKClient):
+    """JWKS client counting key lookups and JWKS downloads, the ratio of both is the cache hit ratio."""
+
+    def get_signing_key_from_jwt(self, token: str) -> jwt.PyJWK:
+        JWKS_KEY_LOOKUPS.inc()
+        return super().get_signing_key_from_jwt(token)
+
+    def fetch_data(self) -> Any:  # noqa: ANN401
+        JWKS_FETCHES.inc()
+        return super().fetch_data()
+
+
+@lru_cache(maxsize=1)
+def jwks_client() -> PyJWKClient:
+    """
+    Get a cached PyJWKClient instance for fetching JWKS keys.
+
+    Raises:
+        RuntimeError: If the Supabase JWKS URL is not configured
+
+    Returns:
+        PyJWKClient: A cached PyJWKClient instance
+    """
+    jwks_url = settings.supabase_jwks_endpoint
+    if not jwks_url:
+        msg = "Supabase JWKS URL is not configured"
+        raise RuntimeError(msg)
+
+    return _InstrumentedJWKClient(jwks_url)
+
+
+def decode_supabase_token(token: str) -> dict[str, Any]:
+    """
+    Decode and verify a Supabase JWT, returning the claims if valid.
+
+    Args:
+        token (str): The JWT token to decode and verify
+
+    Raises:
+        RuntimeError: If the Supabase issuer URL is not configured
+        ValueError: If the JWT header is missing the algorithm
+
+    Returns:
+        dict[str, Any]: The decoded JWT claims
+    """
+    issuer = settings.supabase_issuer_url
+    if not issuer:
+        msg = "Supabase issuer URL is not configured"
+        raise RuntimeError(msg)
+
+    # Get the algorithm from the JWT header
+    header = jwt.get_unverified_header(token)
+    algorithm = header.get("alg")
+    if not algorithm:
+        msg = "JWT header missing algorithm"
+        raise ValueError(msg)
+
+    signing_key: jwt.PyJWK = jwks_client().get_signing_key_from_jwt(token)
+    return jwt.decode(
+        token,
+        signing_key.key,
+        algorithms=[signing_key.algorithm_name],
+        audience=settings.supabase_audience,
+        issuer=issuer,
+        options={"require": ["exp", "iat", "sub"]},
+    )
@@ -0,0 +1,112 @@
+"""Event loop lag monitor reporting the stack of code blocking the loop."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import sys
+import threading
+import time
+import traceback
+
+from backend.configs.config import settings
+from backend.utils.metrics import Counter, Gauge, Histogram, registry
+
+logger = logging.getLogger("astro_backend")
+
+EVENT_LOOP_LAG = registry.register(
+    Histogram(
+        "event_loop_lag_seconds",
+        "Delay between the scheduled and the actual wake-up of the loop monitor",
+        buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0),
+    ),
+)
+EVENT_LOOP_LAG_LAST = registry.register(Gauge("event_loop_lag_last_seconds", "Most recently measured event loop lag"))
+EVENT_LOOP_BLOCKED = registry.register(Counter("event_loop_blocked_total", "Times the event loop was blocked for longer than the threshold"))
+# Updated from the watchdog thread, create the series up front so rendering never sees the dictionary grow
+EVENT_LOOP_BLOCKED.inc(amount=0)
+
+
+class EventLoopMonitor:
+    """
+    Measure event loop lag continuously and capture what blocks the loop.
+
+    A task on the loop wakes up every `interval` seconds and records how late it was woken up. A watchdog thread
+    checks the time of the last wake-up; once the loop has not been able to run the task for `threshold` seconds,
+    it logs the stack of the loop thread, i.e. the callback or coroutine that is blocking it, while it still blocks.
+    """
+
+    def __init__(self, interval: float, threshold: float) -> None:
+        self._interval = interval
+        self._threshold = threshold
+        self._heartbeat = time.monotonic()
+        self._loop_thread_id: int | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._watchdog: threading.Thread | None = None
+        self._stopped = threading.Event()
+        self._logger = logger
+
+    async def start(self, log: logging.Logger | None = None) -> None:
+        """
+        Start measuring the lag of the running event loop, unless disabled in the settings.
+
+        Args:
+            log: Logger to report blocked loops to, the `astro_backend` logger by default
+        """
+        if self._task is not None or not settings.loop_monitor_enabled:
+            return
+
+        self._logger = log or logger
+        self._loop_thread_id = threading.get_ident()
+        self._heartbeat = time.monotonic()
+        self._stopped.clear()
+        self._task = asyncio.create_task(self._measure_lag(), name="event-loop-monitor")
+        self._watchdog = threading.Thread(target=self._watch, name="event-loop-watchdog", daemon=True)
+        self._watchdog.start()
+
+    async def stop(self) -> None:
+        """Stop the lag measurement and the watchdog thread."""
+        self._stopped.set()
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        if self._watchdog is not None:
+            self._watchdog.join(timeout=self._interval * 2)
+            self._watchdog = None
+
+    async def _measure_lag(self) -> None:
+        while True:
+            expected = time.monotonic() + self._interval
+            await asyncio.sleep(self._interval)
+            now = time.monotonic()
+            self._heartbeat = now
+
+            lag = max(0.0, now - expected)
+            EVENT_LOOP_LAG.observe(lag)
+            EVENT_LOOP_LAG_LAST.set(lag)
+            if lag >= self._threshold:
+                self._logger.warning("Event loop was blocked for %.0f ms", lag * 1000)
+
+    def _watch(self) -> None:
+        reported_heartbeat: float | None = None
+        while not self._stopped.wait(self._interval):
+            heartbeat = self._heartbeat
+            blocked_for = time.monotonic() - heartbeat - self._interval
+            if blocked_for < self._threshold or heartbeat == reported_heartbeat:
+                continue
+
+            # Report every stall once, while it is happening, so the stack still shows the blocking code
+            reported_heartbeat = heartbeat
+            EVENT_LOOP_BLOCKED.inc()
+            frame = sys._current_frames().get(self._loop_thread_id)  # noqa: SLF001
+            stack = "".join(traceback.format_stack(frame)) if frame is not None else "<stack unavailable>\n"
+            self._logger.warning("Event loop blocked for more than %.0f ms, the loop thread is running:\n%s", blocked_for * 1000, stack.rstrip())
+
+
+event_loop_monitor = EventLoopMonitor(
+    interval=settings.loop_monitor_interval,
+    threshold=settings.loop_monitor_block_threshold,
+)
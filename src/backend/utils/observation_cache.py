@@ -0,0 +1,71 @@
+"""
+Per-worker cache of the serialized responses of observations in a terminal status.
+
+Completed, failed and cancelled observations never change again, so `GET /v1/observations/{id}` serves repeated views
+of them from memory, without a database query or re-serialization, and lets clients cache them as well. They only
+disappear when their partition is archived (`backend.utils.partitions`), which is announced on
+`OBSERVATIONS_ARCHIVED_CHANNEL` so every worker clears its cache, see `backend.utils.observation_events`.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from backend.configs.config import settings
+from backend.models.enums.observation_status import ObservationStatusEnum
+from backend.utils.metrics import Counter, registry
+
+# Notified by `archive_observation_partitions` with the name of every detached partition, delivered once it is committed
+OBSERVATIONS_ARCHIVED_CHANNEL = "observations_archived"
+
+TERMINAL_STATUSES = frozenset({ObservationStatusEnum.COMPLETED, ObservationStatusEnum.FAILED, ObservationStatusEnum.CANCELLED})
+
+OBSERVATION_CACHE_LOOKUPS = registry.register(Counter("observation_cache_lookups_total", "Observation lookups of the terminal observation cache"))
+OBSERVATION_CACHE_HITS = registry.register(Counter("observation_cache_hits_total", "Observations served from the terminal observation cache"))
+
+
+@dataclass(frozen=True, slots=True)
+class CachedObservation:
+    """Serialized response of a terminal observation."""
+
+    owner: str | None  # Principal subject the observation was served to, None when served to a guest
+    body: bytes
+
+
+class ObservationResponseCache:
+    """Bounded cache of terminal observation responses keyed by observation ID, least recently used evicted first."""
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self._entries: OrderedDict[int, CachedObservation] = OrderedDict()
+
+    def get(self, observation_id: int) -> CachedObservation | None:
+        """
+        Look up the cached response of an observation.
+
+        Returns:
+            CachedObservation | None: The cached response, None if the observation is not cached
+        """
+        OBSERVATION_CACHE_LOOKUPS.inc()
+        entry = self._entries.get(observation_id)
+        if entry is not None:
+            self._entries.move_to_end(observation_id)
+            OBSERVATION_CACHE_HITS.inc()
+        return entry
+
+    def put(self, observation_id: int, owner: str | None, body: bytes) -> None:
+        """Cache the response of an observation, which has to be in one of the `TERMINAL_STATUSES`."""
+        if self.max_size <= 0:
+            return
+        self._entries[observation_id] = CachedObservation(owner, body)
+        self._entries.move_to_end(observation_id)
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached response, e.g. once observations were archived."""
+        self._entries.clear()
+
+
+observation_response_cache = ObservationResponseCache(settings.observation_cache_size)
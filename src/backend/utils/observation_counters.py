@@ -0,0 +1,107 @@
+"""
+Reads and reconciliation of the observation counters.
+
+The counters are maintained by statement-level triggers on `observations` (migration 20261019_0007), so reading them
+costs the same however many observations are stored. Reconciliation recounts them from `observations`, correcting
+drift (e.g. rows changed while the triggers were disabled).
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from sqlalchemy import bindparam, func, text
+from sqlmodel import select
+
+from backend.models import ObservationDailyCount, ObservationStatusCount, ObservationUserCount
+
+if TYPE_CHECKING:
+    from datetime import date
+
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from backend.models.enums.observation_status import ObservationStatusEnum
+
+logger = logging.getLogger("astro_backend")
+
+# Built once per process, see `backend.utils.auth.USER_BY_USER_ID`
+USER_COUNTS = select(ObservationUserCount.status, ObservationUserCount.count).where(ObservationUserCount.user_id == bindparam("user_id"))
+STATUS_COUNTS = select(ObservationStatusCount.status, func.sum(ObservationStatusCount.count)).group_by(ObservationStatusCount.status)
+DAILY_COUNT = select(func.coalesce(func.sum(ObservationDailyCount.count), 0)).where(ObservationDailyCount.day == bindparam("day"))
+
+# Counter table, its key columns and the query recounting it from `observations`
+_RECOUNTS = {
+    "observation_user_counts": (
+        "user_id, status",
+        "SELECT user_id, status, count(*) AS count FROM observations GROUP BY user_id, status",
+    ),
+    "observation_status_counts": (
+        "status, shard",
+        "SELECT status, id % 16 AS shard, count(*) AS count FROM observations GROUP BY 1, 2",
+    ),
+    "observation_daily_counts": (
+        "day, shard",
+        "SELECT created_on::date AS day, id % 16 AS shard, count(*) AS count FROM observations GROUP BY 1, 2",
+    ),
+}
+
+
+async def user_observation_counts(session: AsyncSession, user_id: int) -> dict[ObservationStatusEnum, int]:
+    """
+    Count the observations of a user per status.
+
+    Returns:
+        dict[ObservationStatusEnum, int]: Number of observations per status, statuses without observations may be missing
+    """
+    result = await session.execute(USER_COUNTS, {"user_id": user_id})
+    return {status: count for status, count in result.all() if count}
+
+
+async def observation_status_counts(session: AsyncSession) -> dict[ObservationStatusEnum, int]:
+    """
+    Count all observations per status.
+
+    Returns:
+        dict[ObservationStatusEnum, int]: Number of observations per status, statuses without observations may be missing
+    """
+    result = await session.execute(STATUS_COUNTS)
+    return {status: int(count) for status, count in result.all() if count}
+
+
+async def observations_submitted_on(session: AsyncSession, day: date) -> int:
+    """
+    Count the observations submitted on a UTC day.
+
+    Returns:
+        int: Number of observations created on that day
+    """
+    return int(await session.scalar(DAILY_COUNT, {"day": day}) or 0)
+
+
+async def reconcile_observation_counters(session: AsyncSession) -> dict[str, int]:
+    """
+    Recount every counter from `observations` and replace the stored counts, committing the session.
+
+    Writes to `observations` wait until the recount is committed, so no observation is counted twice or missed.
+
+    Returns:
+        dict[str, int]: Number of counter rows that were wrong, per counter table
+    """
+    await session.execute(text("LOCK TABLE observations IN SHARE MODE"))
+    drift = {}
+    for table, (keys, recount) in _RECOUNTS.items():
+        drift[table] = await session.scalar(
+            text(
+                f"SELECT count(*) FROM {table} FULL JOIN ({recount}) recounted USING ({keys}) "
+                f"WHERE coalesce({table}.count, 0) <> coalesce(recounted.count, 0)",
+            ),
+        )
+        await session.execute(text(f"DELETE FROM {table}"))
+        await session.execute(text(f"INSERT INTO {table} ({keys}, count) {recount}"))
+    await session.commit()
+
+    for table, rows in drift.items():
+        if rows:
+            logger.warning("Corrected %s drifted rows of %s", rows, table)
+    return drift
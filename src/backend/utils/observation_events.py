@@ -0,0 +1,189 @@
+"""
+Shared PostgreSQL change listener fanning observation status events out to in-process subscribers.
+
+The same connection listens for archived partitions, so the worker's `observation_response_cache` never serves
+observations that were archived.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import logging
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Any
+
+import asyncpg
+
+from backend.configs.config import settings
+from backend.database import asyncpg_dsn
+from backend.models.enums.observation_status import ObservationStatusEnum
+from backend.utils.observation_cache import OBSERVATIONS_ARCHIVED_CHANNEL, observation_response_cache
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
+
+# Must match the channel used by the `notify_observation_status_change` trigger function (see migration 20261019_0001)
+OBSERVATION_STATUS_CHANNEL = "observation_status"
+
+logger = logging.getLogger("astro_backend")
+
+
+@dataclass(slots=True, frozen=True)
+class ObservationStatusEvent:
+    """A single observation status transition as published by the database."""
+
+    observation_id: int
+    user_id: int
+    status: ObservationStatusEnum
+    previous_status: ObservationStatusEnum | None
+    updated_on: str
+
+    @classmethod
+    def from_payload(cls, payload: str) -> ObservationStatusEvent:
+        """
+        Build an event from the JSON payload sent by the notification trigger.
+
+        Args:
+            payload: The raw NOTIFY payload
+
+        Returns:
+            ObservationStatusEvent: The parsed event
+        """
+        data: dict[str, Any] = json.loads(payload)
+        previous_status = data.get("previous_status")
+        return cls(
+            observation_id=int(data["id"]),
+            user_id=int(data["user_id"]),
+            status=ObservationStatusEnum(data["status"]),
+            previous_status=ObservationStatusEnum(previous_status) if previous_status else None,
+            updated_on=str(data["updated_on"]),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a JSON-serializable representation of the event."""
+        return asdict(self)
+
+
+class ObservationEventBroker:
+    """
+    Hold a single LISTEN connection per worker process and fan events out to per-user in-memory queues.
+
+    Every connected client gets its own bounded queue, so a slow consumer can only lose its own (oldest) events
+    and never blocks the listener or the other subscribers.
+    """
+
+    def __init__(self, queue_size: int, reconnect_delay: float) -> None:
+        self._queue_size = queue_size
+        self._reconnect_delay = reconnect_delay
+        self._subscribers: defaultdict[int, set[asyncio.Queue[ObservationStatusEvent]]] = defaultdict(set)
+        self._listener_task: asyncio.Task[None] | None = None
+
+    @property
+    def subscriber_count(self) -> int:
+        """Return the number of currently connected subscribers across all users."""
+        return sum(len(queues) for queues in self._subscribers.values())
+
+    async def start(self) -> None:
+        """Start the background listener task. Connection failures are retried and never fail the caller."""
+        if self._listener_task is None or self._listener_task.done():
+            self._listener_task = asyncio.create_task(self._listen_forever(), name="observation-event-listener")
+
+    async def stop(self) -> None:
+        """Stop the background listener task and close its connection."""
+        if self._listener_task is None:
+            return
+
+        self._listener_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._listener_task
+        self._listener_task = None
+
+    @asynccontextmanager
+    async def subscription(self, user_id: int) -> AsyncGenerator[asyncio.Queue[ObservationStatusEvent]]:
+        """
+        Subscribe to the status events of a single user for the lifetime of the context.
+
+        Args:
+            user_id: Local database ID of the user whose observations should be followed
+
+        Yields:
+            asyncio.Queue[ObservationStatusEvent]: Queue receiving the user's events
+        """
+        queue: asyncio.Queue[ObservationStatusEvent] = asyncio.Queue(maxsize=self._queue_size)
+        self._subscribers[user_id].add(queue)
+        try:
+            yield queue
+        finally:
+            queues = self._subscribers.get(user_id)
+            if queues is not None:
+                queues.discard(queue)
+                if not queues:
+                    del self._subscribers[user_id]
+
+    def publish(self, event: ObservationStatusEvent) -> None:
+        """
+        Deliver an event to every subscriber of its user without blocking.
+
+        Args:
+            event: The event to deliver
+        """
+        for queue in self._subscribers.get(event.user_id, ()):
+            if queue.full():
+                # Drop the oldest event, the newest status is the one that matters to the client
+                queue.get_nowait()
+            queue.put_nowait(event)
+
+    @staticmethod
+    def _on_archived(_: object, __: int, ___: str, payload: str) -> None:
+        # Cached responses are keyed by ID only, and archiving is rare: forget them all rather than look up the partition
+        observation_response_cache.clear()
+        logger.info("Cleared the observation response cache, partition %s was archived", payload)
+
+    def _on_notification(self, _: object, __: int, ___: str, payload: str) -> None:
+        if not self._subscribers:
+            # Nobody is connected to this worker, skip parsing the payload entirely
+            return
+
+        try:
+            event = ObservationStatusEvent.from_payload(payload)
+        except (ValueError, KeyError, TypeError):
+            logger.warning("Ignoring malformed observation status notification: %s", payload)
+            return
+
+        self.publish(event)
+
+    async def _listen_once(self) -> None:
+        connection: asyncpg.Connection = await asyncpg.connect(asyncpg_dsn())
+        try:
+            lost = asyncio.Event()
+            connection.add_termination_listener(lambda _: lost.set())
+            await connection.add_listener(OBSERVATION_STATUS_CHANNEL, self._on_notification)
+            await connection.add_listener(OBSERVATIONS_ARCHIVED_CHANNEL, self._on_archived)
+            # Archival notifications sent while no listener was connected are lost, so cached responses are not kept across
+            observation_response_cache.clear()
+            logger.info("Listening for observation status changes on channel '%s'", OBSERVATION_STATUS_CHANNEL)
+            await lost.wait()
+            logger.warning("Observation status listener connection was lost")
+        finally:
+            if not connection.is_closed():
+                with contextlib.suppress(Exception):
+                    await connection.close()
+
+    async def _listen_forever(self) -> None:
+        while True:
+            try:
+                await self._listen_once()
+            except Exception:
+                logger.exception("Observation status listener failed")
+
+            await asyncio.sleep(self._reconnect_delay)
+
+
+observation_event_broker = ObservationEventBroker(
+    queue_size=settings.observation_events_queue_size,
+    reconnect_delay=settings.observation_events_reconnect_delay,
+)
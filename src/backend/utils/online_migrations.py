@@ -0,0 +1,189 @@
+"""
+Helpers for migrations that run online, under production load, without blocking the API.
+
+Every migration runs in its own transaction on a connection with `lock_timeout` and `statement_timeout` set (see
+`migrations/env.py`), so a migration waiting for a lock held by a long request fails fast instead of queueing every
+request on the table behind it. `backend-db upgrade` retries a migration that failed on a lock.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from typing import TYPE_CHECKING
+
+from alembic import op
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+
+from backend.configs.config import settings
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+logger = logging.getLogger("astro_backend")
+
+# lock_not_available (lock_timeout) and deadlock_detected, both safe to retry once the other transaction is done
+RETRYABLE_SQLSTATES = frozenset({"55P03", "40P01"})
+LOCK_RETRY_MAX_DELAY = 30.0
+
+
+def _milliseconds(seconds: float) -> str:
+    return str(round(seconds * 1000))
+
+
+def migration_server_settings() -> dict[str, str]:
+    """
+    Session settings of the connection migrations run on.
+
+    Returns:
+        dict[str, str]: asyncpg `server_settings` with the configured migration timeouts
+    """
+    return {
+        "application_name": "backend-db migrations",
+        "lock_timeout": _milliseconds(settings.migration_lock_timeout),
+        "statement_timeout": _milliseconds(settings.migration_statement_timeout),
+    }
+
+
+def is_retryable_lock_error(exc: BaseException) -> bool:
+    """
+    Tell whether a migration (or maintenance statement run directly with asyncpg) failed on a lock and can be retried.
+
+    Returns:
+        bool: True for lock timeouts and deadlocks
+    """
+    error = exc.orig if isinstance(exc, DBAPIError) else exc
+    return getattr(error, "sqlstate", None) in RETRYABLE_SQLSTATES
+
+
+def lock_retry_delay(attempt: int) -> float:
+    """
+    Seconds to wait before retrying a statement that failed on a lock, doubling with every attempt.
+
+    Returns:
+        float: The delay, at most `LOCK_RETRY_MAX_DELAY`
+    """
+    return min(LOCK_RETRY_MAX_DELAY, 2.0**attempt)
+
+
+def set_migration_timeouts(*, lock_timeout: float | None = None, statement_timeout: float | None = None) -> None:
+    """
+    Override the configured timeouts, in seconds, for the rest of the current migration's transaction.
+
+    `0` disables a timeout. Statements run in an autocommit block (e.g. by the helpers below) are not affected.
+    """
+    if lock_timeout is not None:
+        op.execute(f"SET LOCAL lock_timeout = {_milliseconds(lock_timeout)}")
+    if statement_timeout is not None:
+        op.execute(f"SET LOCAL statement_timeout = {_milliseconds(statement_timeout)}")
+
+
+def create_index_concurrently(index_name: str, table_name: str, columns: Sequence[str], **kwargs: object) -> None:
+    """
+    Build an index with `CREATE INDEX CONCURRENTLY`, without blocking writes to the table.
+
+    The build runs outside the migration's transaction and without a statement timeout. A build that failed (e.g. on a
+    lock timeout) leaves an invalid index behind, which is dropped before the build is retried.
+
+    Args:
+        index_name: Name of the index
+        table_name: Table to index
+        columns: Indexed columns or expressions
+        **kwargs: Passed on to `op.create_index`, e.g. `unique` or `postgresql_where`
+    """
+    context = op.get_context()
+    with context.autocommit_block():
+        if not context.as_sql:
+            valid = op.get_bind().scalar(
+                text("SELECT indisvalid FROM pg_index WHERE indexrelid = to_regclass(:index_name)"),
+                {"index_name": index_name},
+            )
+            if valid is False:
+                logger.warning("Dropping invalid index %s left by an interrupted build", index_name)
+                op.drop_index(index_name, table_name=table_name, postgresql_concurrently=True, if_exists=True)
+
+        op.execute("SET statement_timeout = 0")
+        try:
+            op.create_index(index_name, table_name, list(columns), postgresql_concurrently=True, if_not_exists=True, **kwargs)
+        finally:
+            op.execute("RESET statement_timeout")
+
+
+def drop_index_concurrently(index_name: str, table_name: str) -> None:
+    """Drop an index with `DROP INDEX CONCURRENTLY`, without blocking queries on the table."""
+    with op.get_context().autocommit_block():
+        op.drop_index(index_name, table_name=table_name, postgresql_concurrently=True, if_exists=True)
+
+
+def backfill_in_batches(  # noqa: PLR0913
+    table_name: str,
+    assignments: str,
+    *,
+    where: str | None = None,
+    key: str = "id",
+    batch_size: int = 5_000,
+    pause: float = 0.1,
+) -> int:
+    """
+    Update a large table in keyset-ordered batches, each committed on its own.
+
+    Every batch only locks `batch_size` rows for a short transaction, and the pause between batches leaves room for
+    the API's writes (and for replicas to catch up). Row triggers fire as for any UPDATE, e.g. `updated_on` advances
+    so delta sync delivers the backfilled rows.
+
+    Args:
+        table_name: Table to update
+        assignments: SQL `SET` clause, e.g. `"priority = 0"`
+        where: SQL condition selecting the rows to update, all rows by default
+        key: Unique, indexed column the batches are ordered by
+        batch_size: Rows updated per transaction
+        pause: Seconds to sleep between batches
+
+    Returns:
+        int: Number of updated rows (0 when emitting offline SQL, where a single UPDATE is emitted)
+    """
+    context = op.get_context()
+    if context.as_sql:
+        op.execute(f"UPDATE {table_name} SET {assignments}" + (f" WHERE {where}" if where else ""))
+        return 0
+
+    def batch_statement(*, first: bool) -> str:
+        conditions = [f"({where})"] if where else []
+        if not first:
+            conditions.append(f"{key} > :last_key")
+        return f"""
+            WITH batch AS (
+                SELECT {key} AS batch_key FROM {table_name}
+                {"WHERE " + " AND ".join(conditions) if conditions else ""}
+                ORDER BY {key} LIMIT :batch_size
+            ), updated AS (
+                UPDATE {table_name} SET {assignments} FROM batch WHERE {table_name}.{key} = batch.batch_key RETURNING 1
+            )
+            SELECT (SELECT max(batch_key) FROM batch) AS last_key, (SELECT count(*) FROM updated) AS updated
+        """
+
+    first_batch, next_batch = text(batch_statement(first=True)), text(batch_statement(first=False))
+    total = 0
+    last_key = None
+    with context.autocommit_block():
+        bind = op.get_bind()
+        while True:
+            started = time.perf_counter()
+            statement = first_batch if last_key is None else next_batch
+            row = bind.execute(statement, {"last_key": last_key, "batch_size": batch_size}).one()
+            if row.last_key is None:
+                break
+
+            last_key = row.last_key
+            total += row.updated
+            logger.info(
+                "Backfilled %s rows of %s up to %s=%s in %.0f ms",
+                total,
+                table_name,
+                key,
+                last_key,
+                (time.perf_counter() - started) * 1000,
+            )
+            time.sleep(pause)
+    return total
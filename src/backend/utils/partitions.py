@@ -0,0 +1,209 @@
+"""
+Monthly partitions of the `observations` table: creation ahead of time and archival of old months.
+
+Observations are range partitioned by `created_on`, one partition per month named `observations_YYYY_MM`, plus
+`observations_default` for rows of months without a partition. Archiving detaches a month from `observations`, so its
+rows no longer weigh on the indexes, vacuum and queries of the active months.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import logging
+import re
+from dataclasses import dataclass
+from datetime import date
+from functools import partial
+from typing import TYPE_CHECKING
+
+from backend.configs.config import settings
+from backend.utils.observation_cache import OBSERVATIONS_ARCHIVED_CHANNEL
+from backend.utils.online_migrations import is_retryable_lock_error, lock_retry_delay
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+    from pathlib import Path
+
+    import asyncpg
+
+logger = logging.getLogger("astro_backend")
+
+DEFAULT_PARTITION = "observations_default"
+ARCHIVE_SCHEMA = "observations_archive"
+# Partition tables are managed here and by the migrations, never by autogenerate
+PARTITION_TABLE_PATTERN = re.compile(r"observations_(?:(?P<year>\d{4})_(?P<month>\d{2})|default)")
+
+
+@dataclass(frozen=True, slots=True)
+class ObservationPartition:
+    """A monthly partition of the `observations` table."""
+
+    name: str
+    month: date
+
+    @property
+    def end(self) -> date:
+        """First day after the partition's month."""
+        return add_months(self.month, 1)
+
+
+def add_months(month: date, months: int) -> date:
+    """
+    Shift the first day of a month by whole months.
+
+    Returns:
+        date: First day of the resulting month
+    """
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+async def observation_partitions(connection: asyncpg.Connection) -> list[ObservationPartition]:
+    """
+    List the monthly partitions attached to `observations`.
+
+    Returns:
+        list[ObservationPartition]: Partitions ordered by month, without the default partition
+    """
+    names = await connection.fetch("SELECT inhrelid::regclass::text AS name FROM pg_inherits WHERE inhparent = 'observations'::regclass")
+    partitions = []
+    for row in names:
+        match = PARTITION_TABLE_PATTERN.fullmatch(row["name"])
+        if match is not None and match["year"] is not None:
+            partitions.append(ObservationPartition(row["name"], date(int(match["year"]), int(match["month"]), 1)))
+    return sorted(partitions, key=lambda partition: partition.month)
+
+
+async def _in_lock_timeout_transaction[T](connection: asyncpg.Connection, statements: Callable[[], Awaitable[T]]) -> T:
+    async with connection.transaction():
+        await connection.execute(f"SET LOCAL lock_timeout = {round(settings.migration_lock_timeout * 1000)}")
+        return await statements()
+
+
+async def _lock_observations[T](connection: asyncpg.Connection, statements: Callable[[], Awaitable[T]], action: str) -> T:
+    """
+    Run statements locking `observations` (ATTACH, DETACH) in a transaction waiting at most `migration_lock_timeout` for the lock.
+
+    A statement queued for the lock of `observations` would queue every request on the table behind it, so it gives up
+    on the lock instead and is retried, up to `migration_lock_retries` times, as migrations are.
+
+    Returns:
+        T: The result of `statements`
+    """
+    for attempt in range(settings.migration_lock_retries):
+        try:
+            return await _in_lock_timeout_transaction(connection, statements)
+        except Exception as exc:
+            if not is_retryable_lock_error(exc):
+                raise
+            delay = lock_retry_delay(attempt)
+            logger.warning("%s failed on a lock (%s), retrying in %.0fs (%s/%s)", action, exc, delay, attempt + 1, settings.migration_lock_retries)
+            await asyncio.sleep(delay)
+    return await _in_lock_timeout_transaction(connection, statements)
+
+
+async def create_observation_partitions(connection: asyncpg.Connection, first_month: date, last_month: date) -> list[str]:
+    """
+    Create the missing partitions of the months from `first_month` to `last_month`, inclusive.
+
+    Rows already stored in the default partition for one of these months are moved into the new partition.
+
+    Returns:
+        list[str]: Names of the created partitions
+    """
+    created = []
+    month = first_month.replace(day=1)
+    while month <= last_month:
+        name = await _lock_observations(
+            connection,
+            partial(connection.fetchval, "SELECT create_observations_partition($1)", month),
+            f"Creating the partition of {month:%Y-%m}",
+        )
+        if name is not None:
+            logger.info("Created partition %s", name)
+            created.append(name)
+        month = add_months(month, 1)
+
+    stray = await connection.fetchval(f"SELECT count(*) FROM {DEFAULT_PARTITION}")
+    if stray:
+        logger.warning("%s observations are stored in %s, create the partitions of their months", stray, DEFAULT_PARTITION)
+    return created
+
+
+async def _export_partition(connection: asyncpg.Connection, name: str, export_dir: Path) -> Path:
+    path = export_dir / f"{name}.csv.gz"
+    with gzip.open(path, "wb") as file:
+
+        async def write(chunk: bytes) -> None:
+            await asyncio.to_thread(file.write, chunk)
+
+        await connection.copy_from_table(name, schema_name=ARCHIVE_SCHEMA, output=write, format="csv", header=True)
+    return path
+
+
+async def archive_observation_partitions(
+    connection: asyncpg.Connection,
+    before: date,
+    *,
+    export_dir: Path | None = None,
+    drop: bool = False,
+) -> list[str]:
+    """
+    Archive the partitions of the months that ended by `before`.
+
+    Every archived partition is detached from `observations`, moved to the `observations_archive` schema and frozen
+    (`VACUUM (FREEZE)`), so neither autovacuum nor queries of `observations` touch it again. With `export_dir` it is
+    also exported to a gzip-compressed CSV file, and with `drop` the table is dropped once exported.
+    Partitions still holding pending or in-progress observations are skipped.
+
+    Args:
+        connection: Connection outside of a transaction, detaching waits for the lock on `observations`
+        before: Months ending on or before this date are archived
+        export_dir: Directory receiving `<partition>.csv.gz` exports
+        drop: Drop archived partitions after exporting them
+
+    Returns:
+        list[str]: Names of the archived partitions
+
+    Raises:
+        ValueError: If `drop` is given without `export_dir`
+    """
+    if drop and export_dir is None:
+        msg = "Archived partitions are only dropped after they are exported"
+        raise ValueError(msg)
+
+    await connection.execute(f"CREATE SCHEMA IF NOT EXISTS {ARCHIVE_SCHEMA}")
+    archived = []
+    for partition in await observation_partitions(connection):
+        if partition.end > before:
+            break
+
+        # Statuses only move from PENDING or IN_PROGRESS to terminal ones, a partition without active rows stays so
+        active = await connection.fetchval(
+            f"SELECT count(*) FROM {partition.name} WHERE status IN ('PENDING', 'IN_PROGRESS')",
+        )
+        if active:
+            logger.warning("Skipping partition %s, it still holds %s pending or in-progress observations", partition.name, active)
+            continue
+
+        async def detach(name: str = partition.name) -> None:
+            await connection.execute(f"ALTER TABLE observations DETACH PARTITION {name}")
+            # Archived observations are no longer counted, as by `backend-db reconcile-counters`
+            await connection.execute("SELECT uncount_observation_partition($1::regclass)", name)
+            await connection.execute(f"ALTER TABLE {name} SET SCHEMA {ARCHIVE_SCHEMA}")
+            # API workers drop their cached responses of the detached observations once this commits
+            await connection.execute("SELECT pg_notify($1, $2)", OBSERVATIONS_ARCHIVED_CHANNEL, name)
+
+        await _lock_observations(connection, detach, f"Detaching partition {partition.name}")
+        await connection.execute(f"VACUUM (FREEZE, ANALYZE) {ARCHIVE_SCHEMA}.{partition.name}")
+        logger.info("Detached partition %s into schema %s", partition.name, ARCHIVE_SCHEMA)
+
+        if export_dir is not None:
+            path = await _export_partition(connection, partition.name, export_dir)
+            logger.info("Exported partition %s to %s", partition.name, path)
+            if drop:
+                await connection.execute(f"DROP TABLE {ARCHIVE_SCHEMA}.{partition.name}")
+                logger.info("Dropped archived partition %s", partition.name)
+        archived.append(partition.name)
+    return archived
@@ -0,0 +1,117 @@
+"""
+Daily observation quotas: integration seconds and pending observations per user and UTC day.
+
+Usage is kept in `observation_quota_usage` rather than summed over `observations`, so checking a submission takes a
+single row. The check and the reservation are one conditional upsert in the submission's transaction: concurrent
+submissions of a user queue on the row lock and each sees the usage left by the previous one, so they cannot overshoot
+the quota together, and a submission that rolls back gives its reservation back.
+"""
+
+from __future__ import annotations
+
+import logging
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
+
+from fastapi import HTTPException, status
+from sqlalchemy import bindparam, delete
+from sqlalchemy.dialects.postgresql import insert
+
+from backend.configs.config import settings
+from backend.models import ObservationQuotaUsage
+from backend.utils.time_utils import utc_now
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from datetime import date
+
+    from sqlalchemy.ext.asyncio import AsyncSession
+    from sqlalchemy.sql.dml import ReturningInsert
+
+    from backend.models import ObservationCreate
+
+logger = logging.getLogger("astro_backend")
+
+
+def _build_reserve_statement() -> ReturningInsert[tuple[int]]:
+    table = ObservationQuotaUsage.__table__
+    statement = insert(ObservationQuotaUsage).values(
+        user_id=bindparam("user_id"),
+        day=bindparam("day"),
+        integration_time=bindparam("integration_time"),
+        pending=bindparam("pending"),
+    )
+    reserved_integration_time = table.c.integration_time + statement.excluded.integration_time
+    reserved_pending = table.c.pending + statement.excluded.pending
+    # The row is only updated (and returned) when the reservation fits, the first reservation of a day is checked before
+    return statement.on_conflict_do_update(
+        index_elements=[ObservationQuotaUsage.user_id, ObservationQuotaUsage.day],
+        set_={"integration_time": reserved_integration_time, "pending": reserved_pending},
+        where=(reserved_integration_time <= bindparam("max_integration_time")) & (reserved_pending <= bindparam("max_pending")),
+    ).returning(ObservationQuotaUsage.user_id)
+
+
+# Built once per process, see `backend.utils.auth.USER_BY_USER_ID`
+RESERVE_QUOTA = _build_reserve_statement()
+
+
+def _seconds_until_next_day() -> int:
+    now = datetime.now(UTC)
+    tomorrow = datetime.combine(now.date() + timedelta(days=1), datetime.min.time(), UTC)
+    return int((tomorrow - now).total_seconds()) + 1
+
+
+async def reserve_observation_quota(db: AsyncSession, user_id: int, day: date, observations: Sequence[ObservationCreate]) -> None:
+    """
+    Reserve the daily quota of a user for new observations, as part of the transaction inserting them.
+
+    Args:
+        db: Database session dependency
+        user_id: ID of the user submitting the observations
+        day: UTC day the observations are submitted on
+        observations: The observations about to be inserted
+
+    Raises:
+        HTTPException: 429 with a `Retry-After` header (the start of the next UTC day at the latest) if the observations
+            do not fit in the quota left
+    """
+    integration_time = sum(observation.integration_time for observation in observations)
+    reserved = None
+    if integration_time <= settings.quota_daily_integration_time and len(observations) <= settings.quota_daily_pending_observations:
+        result = await db.execute(
+            RESERVE_QUOTA,
+            {
+                "user_id": user_id,
+                "day": day,
+                "integration_time": integration_time,
+                "pending": len(observations),
+                "max_integration_time": settings.quota_daily_integration_time,
+                "max_pending": settings.quota_daily_pending_observations,
+            },
+        )
+        reserved = result.scalar_one_or_none()
+
+    if reserved is None:
+        logger.info("Rejected %s observations of user %s over the daily quota", len(observations), user_id)
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=(
+                f"Daily observation quota exceeded: at most {settings.quota_daily_integration_time:g} integration seconds "
+                f"and {settings.quota_daily_pending_observations} pending observations per day"
+            ),
+            headers={"Retry-After": str(_seconds_until_next_day())},
+        )
+
+
+async def delete_expired_quota_usage(db: AsyncSession) -> int:
+    """
+    Delete the quota usage of the days before the current UTC day.
+
+    Args:
+        db: Database session dependency
+
+    Returns:
+        int: Number of deleted rows
+    """
+    result = await db.execute(delete(ObservationQuotaUsage).where(ObservationQuotaUsage.day < utc_now().date()))
+    return result.rowcount
@@ -0,0 +1,344 @@
+"""Bulk import of observation schedules from CSV, validated in batches and loaded with COPY."""
+
+from __future__ import annotations
+
+import codecs
+import csv
+import io
+import logging
+import uuid
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import text
+
+from backend.configs.config import settings
+from backend.models import ScheduleImportResult, ScheduleImportRowError
+from backend.models.enums.frequencies import BandwidthEnum, CentralFrequencyEnum
+from backend.models.enums.observation_type import ObservationTypeEnum
+from backend.models.enums.reference_frame import ReferenceFrameEnum
+from backend.utils.time_utils import utc_now
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterable, AsyncIterator, Callable
+
+    import asyncpg
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = logging.getLogger("astro_backend")
+
+STAGING_TABLE = "observation_import"
+MAX_REPORTED_ERRORS = 1000
+# A single record larger than this is not a schedule row, stop buffering instead of reading the whole upload
+MAX_RECORD_LENGTH = 64 * 1024
+TRUE_VALUES = frozenset({"true", "t", "yes", "y", "1"})
+FALSE_VALUES = frozenset({"false", "f", "no", "n", "0"})
+
+
+def _enum_by_value(enum: type[CentralFrequencyEnum | BandwidthEnum]) -> Callable[[str], str]:
+    members = {float(member.value): member.name for member in enum}
+
+    def convert(value: str) -> str:
+        try:
+            return members[float(value)]
+        except (KeyError, ValueError):
+            msg = f"Must be one of {', '.join(f'{member:g}' for member in members)}"
+            raise ValueError(msg) from None
+
+    return convert
+
+
+def _enum_by_name(enum: type[ReferenceFrameEnum | ObservationTypeEnum]) -> Callable[[str], str]:
+    names = tuple(enum.__members__)
+
+    def convert(value: str) -> str:
+        name = value.upper()
+        if name not in names:
+            msg = f"Must be one of {', '.join(names)}"
+            raise ValueError(msg)
+        return name
+
+    return convert
+
+
+def _boolean(value: str) -> bool:
+    lowered = value.lower()
+    if lowered in TRUE_VALUES:
+        return True
+    if lowered in FALSE_VALUES:
+        return False
+    msg = "Must be true or false"
+    raise ValueError(msg)
+
+
+def _timestamp(value: str) -> datetime:
+    parsed = datetime.fromisoformat(value)
+    # Stored as naive UTC like every other timestamp, offsets in the schedule are honoured
+    return parsed.astimezone(UTC).replace(tzinfo=None) if parsed.tzinfo else parsed
+
+
+def _text(max_length: int) -> Callable[[str], str]:
+    def convert(value: str) -> str:
+        if len(value) > max_length:
+            msg = f"Must be at most {max_length} characters"
+            raise ValueError(msg)
+        return value
+
+    return convert
+
+
+@dataclass(frozen=True, slots=True)
+class _Column:
+    convert: Callable[[str], Any]
+    default: Any = None
+    required: bool = False
+    check: Callable[[Any], bool] | None = None
+    check_message: str = ""
+
+
+# Staging and target columns, in COPY order, with the API defaults of `ObservationCreate` and the table's check constraints
+COLUMNS: dict[str, _Column] = {
+    "target_name": _Column(_text(255)),
+    "ra": _Column(float, required=True, check=lambda ra: 0 <= ra < 360, check_message="Right Ascension must be in [0, 360)"),  # noqa: PLR2004
+    "dec": _Column(float, required=True, check=lambda dec: -90 <= dec <= 90, check_message="Declination must be in [-90, 90]"),  # noqa: PLR2004
+    "bandwidth": _Column(_enum_by_value(BandwidthEnum), default=BandwidthEnum.BW_1_5_MHZ.name),
+    "center_frequency": _Column(_enum_by_value(CentralFrequencyEnum), default=CentralFrequencyEnum.FREQ_1420_MHZ.name),
+    "velocity_frame": _Column(_enum_by_name(ReferenceFrameEnum), default=ReferenceFrameEnum.LSRK.name),
+    "observation_type": _Column(_enum_by_name(ObservationTypeEnum), default=ObservationTypeEnum.TARGET_OBSERVATION.name),
+    "fft_size": _Column(int, default=1024, check=lambda size: size > 0, check_message="FFT size must be positive"),
+    "integration_time": _Column(float, required=True, check=lambda time: time > 0, check_message="Integration time must be positive"),
+    "planned_start": _Column(_timestamp),
+    "output_filename": _Column(_text(1000), required=True),
+    "receive_csv": _Column(_boolean, default=False),
+    "perform_data_analysis": _Column(_boolean, default=True),
+}
+
+
+@dataclass(slots=True)
+class _ImportReport:
+    rejected: int = 0
+    errors: list[ScheduleImportRowError] = field(default_factory=list)
+    errors_truncated: bool = False
+
+    def add(self, row: int, column: str | None, value: str | None, message: str) -> None:
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append(ScheduleImportRowError(row=row, column=column, value=value, message=message))
+        else:
+            self.errors_truncated = True
+
+
+def _complete_records_end(buffer: str) -> int:
+    """Return the end of the last complete CSV record in the buffer, i.e. the last line break outside of quotes."""
+    end = buffer.rfind("\n")
+    # An odd number of quotes before the line break means it is inside a quoted value, try an earlier one
+    while end != -1 and buffer.count('"', 0, end) % 2:
+        end = buffer.rfind("\n", 0, end)
+    return end + 1
+
+
+async def iter_csv_records(chunks: AsyncIterable[bytes]) -> AsyncIterator[list[str]]:
+    """
+    Parse CSV records from a byte stream without reading it whole.
+
+    Args:
+        chunks: UTF-8 encoded CSV, in chunks of any size
+
+    Yields:
+        list[str]: The fields of every record, quoted values may span lines and chunks
+
+    Raises:
+        ValueError: If the stream is not UTF-8 or not valid CSV
+    """
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    buffer = ""
+    async for chunk in chunks:
+        buffer += decoder.decode(chunk)
+        end = _complete_records_end(buffer)
+        if end:
+            for record in _parse_records(buffer[:end]):
+                yield record
+            buffer = buffer[end:]
+        elif len(buffer) > MAX_RECORD_LENGTH:
+            msg = f"CSV record longer than {MAX_RECORD_LENGTH} characters"
+            raise ValueError(msg)
+
+    buffer += decoder.decode(b"", final=True)
+    for record in _parse_records(buffer):
+        yield record
+
+
+def _parse_records(complete_records: str) -> list[list[str]]:
+    try:
+        return list(csv.reader(io.StringIO(complete_records, newline=""), strict=True))
+    except csv.Error as exc:
+        msg = f"Invalid CSV: {exc}"
+        raise ValueError(msg) from exc
+
+
+def _header_columns(header: list[str]) -> list[str]:
+    columns = [name.strip().lower() for name in header]
+    duplicates = sorted({name for name in columns if columns.count(name) > 1})
+    if duplicates:
+        msg = f"Duplicate columns: {', '.join(duplicates)}"
+        raise ValueError(msg)
+    unknown = [name for name in columns if name not in COLUMNS]
+    if unknown:
+        msg = f"Unknown columns: {', '.join(unknown)}. Expected columns: {', '.join(COLUMNS)}"
+        raise ValueError(msg)
+    missing = [name for name, column in COLUMNS.items() if column.required and name not in columns]
+    if missing:
+        msg = f"Missing required columns: {', '.join(missing)}"
+        raise ValueError(msg)
+    return columns
+
+
+def _convert_column(name: str, rows: list[tuple[int, list[str]]], position: int, report: _ImportReport, invalid: set[int]) -> list[Any]:
+    """Convert and check the values of one column for a whole batch of rows, marking the rows with invalid values."""
+    column = COLUMNS[name]
+    converted = []
+    for line, fields in rows:
+        value = fields[position].strip()
+        result = column.default
+        if not value:
+            if column.required:
+                report.add(line, name, value, "Value is required")
+                invalid.add(line)
+        else:
+            try:
+                result = column.convert(value)
+            except ValueError as exc:
+                report.add(line, name, value, str(exc) or "Invalid value")
+                invalid.add(line)
+            else:
+                if column.check is not None and not column.check(result):
+                    report.add(line, name, value, column.check_message)
+                    invalid.add(line)
+        converted.append(result)
+    return converted
+
+
+def _validate_batch(header: list[str], rows: list[tuple[int, list[str]]], report: _ImportReport) -> list[tuple[Any, ...]]:
+    """
+    Validate a batch of rows column by column and return the staging records of the valid ones.
+
+    Every column is converted for the whole batch in one pass with the same converter,
+    instead of building and validating a model per row.
+    """
+    shaped = []
+    for line, fields in rows:
+        if len(fields) == len(header):
+            shaped.append((line, fields))
+        else:
+            report.add(line, None, None, f"Expected {len(header)} values, got {len(fields)}")
+    report.rejected += len(rows) - len(shaped)
+
+    invalid: set[int] = set()
+    columns = [
+        _convert_column(name, shaped, header.index(name), report, invalid) if name in header else [column.default] * len(shaped)
+        for name, column in COLUMNS.items()
+    ]
+    report.rejected += len(invalid)
+
+    today = utc_now().strftime("%Y%m%d")
+    records = []
+    for (line, _), values in zip(shaped, zip(*columns, strict=True), strict=True):
+        if line in invalid:
+            continue
+        # Same generated target name as API submissions without one
+        target_name = values[0] or f"obs_{today}_{uuid.uuid4().hex[:8]}"
+        records.append((line, target_name, *values[1:]))
+    return records
+
+
+async def _row_batches(records: AsyncIterator[list[str]]) -> AsyncIterator[tuple[list[str], list[tuple[int, list[str]]]]]:
+    """Yield the header columns with batches of `(record number, fields)` rows, skipping blank rows."""
+    header: list[str] | None = None
+    rows: list[tuple[int, list[str]]] = []
+    row_count = 0
+    line = 0
+    async for record in records:
+        line += 1
+        if header is None:
+            header = _header_columns(record)
+            continue
+        if not any(value.strip() for value in record):
+            continue
+
+        row_count += 1
+        if row_count > settings.schedule_import_max_rows:
+            msg = f"A schedule can contain at most {settings.schedule_import_max_rows} rows"
+            raise ValueError(msg)
+
+        rows.append((line, record))
+        if len(rows) >= settings.schedule_import_batch_size:
+            yield header, rows
+            rows = []
+
+    if header is None:
+        msg = "The schedule is empty"
+        raise ValueError(msg)
+    if rows:
+        yield header, rows
+
+
+async def import_schedule(
+    db: AsyncSession,
+    chunks: AsyncIterable[bytes],
+    user_id: int,
+    *,
+    partial: bool = False,
+) -> ScheduleImportResult:
+    """
+    Create pending observations for every row of a CSV schedule.
+
+    The CSV is parsed while it streams in and validated in batches of `schedule_import_batch_size` rows. Valid rows
+    are copied with binary COPY into a temporary staging table, then moved into `observations` with a single
+    `INSERT ... SELECT`. The caller commits the session.
+
+    Args:
+        db: Database session, the import runs in its transaction
+        chunks: The CSV file, with a header row naming `ObservationCreate` fields
+        user_id: ID of the local user the observations are created for
+        partial: Import the valid rows even if some rows are invalid, instead of importing nothing
+
+    Returns:
+        ScheduleImportResult: Number of imported observations and the errors of rejected rows
+
+    Raises:
+        ValueError: If the file is not a valid CSV schedule or has too many rows
+    """
+    connection = await db.connection()
+    await connection.execute(
+        # Copies the column types, enums included, but none of the constraints or defaults of `observations`
+        text(f"CREATE TEMPORARY TABLE {STAGING_TABLE} ON COMMIT DROP AS SELECT {', '.join(COLUMNS)} FROM observations WITH NO DATA"),
+    )
+    await connection.execute(text(f"ALTER TABLE {STAGING_TABLE} ADD COLUMN line integer NOT NULL"))
+    driver_connection: asyncpg.Connection = (await connection.get_raw_connection()).driver_connection
+
+    report = _ImportReport()
+    async for header, rows in _row_batches(iter_csv_records(chunks)):
+        records = _validate_batch(header, rows, report)
+        if records:
+            await driver_connection.copy_records_to_table(STAGING_TABLE, records=records, columns=("line", *COLUMNS))
+
+    result = ScheduleImportResult(
+        imported=0,
+        rejected=report.rejected,
+        # Validated column by column, list the errors row by row
+        errors=sorted(report.errors, key=lambda error: error.row),
+        errors_truncated=report.errors_truncated,
+    )
+    if report.rejected and not partial:
+        return result
+
+    inserted = await connection.execute(
+        text(
+            f"INSERT INTO observations (user_id, status, created_on, updated_on, {', '.join(COLUMNS)}) "
+            f"SELECT :user_id, 'PENDING', :now, :now, {', '.join(COLUMNS)} FROM {STAGING_TABLE} ORDER BY line",
+        ),
+        {"user_id": user_id, "now": utc_now()},
+    )
+    result.imported = inserted.rowcount
+    logger.info("Imported %s observations for user %s, rejected %s rows", result.imported, user_id, result.rejected)
+    return result
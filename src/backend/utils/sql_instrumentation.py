@@ -0,0 +1,236 @@
+"""SQL statement instrumentation: per-request query counts, slow query log and N+1 detection."""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections import Counter as StatementCounter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import event
+from starlette.datastructures import MutableHeaders
+
+from backend.configs.config import settings
+from backend.utils.metrics import Counter, Histogram, registry
+from backend.utils.timing import current_request_timings, route_template
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Iterator
+
+    from sqlalchemy.engine import Connection, Engine, ExceptionContext
+    from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger("astro_backend")
+
+DB_QUERY_DURATION = registry.register(
+    Histogram("db_query_duration_seconds", "Execution time of SQL statements", ("operation",)),
+)
+DB_SLOW_QUERIES = registry.register(
+    Counter("db_slow_queries_total", "SQL statements slower than the slow query threshold", ("operation",)),
+)
+DB_QUERIES_PER_REQUEST = registry.register(
+    Histogram(
+        "db_queries_per_request",
+        "Number of SQL statements executed while handling a request",
+        ("route",),
+        buckets=(1, 2, 3, 5, 10, 20, 50, 100),
+    ),
+)
+DB_QUERY_BUDGET_EXCEEDED = registry.register(
+    Counter("db_query_budget_exceeded_total", "Requests executing more SQL statements than the query budget", ("route",)),
+)
+
+
+@dataclass(slots=True)
+class RequestQueries:
+    """SQL statements executed while handling a single request."""
+
+    count: int = 0
+    duration: float = 0.0
+    statements: StatementCounter[str] = field(default_factory=StatementCounter)
+    # Set by routes declaring their own budget (see `query_budget`), overrides `db_query_budget`
+    budget: int | None = None
+
+
+_request_queries: ContextVar[RequestQueries | None] = ContextVar("request_queries", default=None)
+
+
+def current_request_queries() -> RequestQueries | None:
+    """Return the statements of the request being handled, or None outside of a request."""
+    return _request_queries.get()
+
+
+@contextmanager
+def track_queries() -> Iterator[RequestQueries]:
+    """
+    Count the SQL statements executed in the current context, outside of HTTP requests (e.g. background jobs).
+
+    Yields:
+        RequestQueries: Updated with every statement executed until the block exits
+    """
+    queries = RequestQueries()
+    token = _request_queries.set(queries)
+    try:
+        yield queries
+    finally:
+        _request_queries.reset(token)
+
+
+def query_budget(statements: int) -> Callable[[], Awaitable[None]]:
+    """
+    Build a route dependency replacing `db_query_budget` with the statements the route is expected to execute.
+
+    Hot routes declare a tight budget, so a change adding round trips to them is logged and counted
+    in `db_query_budget_exceeded_total` like an N+1 pattern.
+
+    Args:
+        statements: Maximum number of SQL statements of a request to the route
+
+    Returns:
+        Callable[[], Awaitable[None]]: The dependency, to be used with `Depends`
+    """
+
+    async def set_query_budget() -> None:
+        queries = _request_queries.get()
+        if queries is not None:
+            queries.budget = statements
+
+    return set_query_budget
+
+
+def _operation(statement: str) -> str:
+    return statement.lstrip().split(None, 1)[0].upper() if statement.strip() else "UNKNOWN"
+
+
+def redact_parameters(parameters: Any, *, executemany: bool = False) -> str:  # noqa: ANN401
+    """
+    Describe statement parameters without their values, which may hold personal data such as email addresses.
+
+    Args:
+        parameters: Parameters as passed to the DBAPI cursor
+        executemany: Whether `parameters` is a sequence of parameter sets
+
+    Returns:
+        str: The parameter names (or positions) and value types
+    """
+    if executemany:
+        return f"<{len(parameters)} parameter sets>"
+    if isinstance(parameters, dict):
+        return "{" + ", ".join(f"{key}: <{type(value).__name__}>" for key, value in parameters.items()) + "}"
+    if isinstance(parameters, list | tuple):
+        return "(" + ", ".join(f"<{type(value).__name__}>" for value in parameters) + ")"
+    return "<none>" if parameters is None else f"<{type(parameters).__name__}>"
+
+
+def _before_cursor_execute(conn: Connection, *_: object) -> None:
+    conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(
+    conn: Connection,
+    _: object,
+    statement: str,
+    parameters: Any,  # noqa: ANN401
+    __: object,
+    executemany: bool,  # noqa: FBT001
+) -> None:
+    elapsed = time.perf_counter() - conn.info["query_started"].pop()
+    operation = _operation(statement)
+    DB_QUERY_DURATION.observe(elapsed, operation)
+
+    timings = current_request_timings()
+    if timings is not None:
+        timings.add("db", elapsed)
+
+    queries = _request_queries.get()
+    if queries is not None:
+        queries.count += 1
+        queries.duration += elapsed
+        queries.statements[statement] += 1
+
+    if elapsed * 1000 >= settings.db_slow_query_threshold_ms:
+        DB_SLOW_QUERIES.inc(operation)
+        logger.warning(
+            "Slow query (%.1f ms): %s | parameters: %s",
+            elapsed * 1000,
+            " ".join(statement.split()),
+            redact_parameters(parameters, executemany=executemany),
+        )
+
+
+def _handle_error(context: ExceptionContext) -> None:
+    # `after_cursor_execute` is skipped for failed statements, drop their start time
+    started = context.connection.info.get("query_started") if context.connection is not None else None
+    if started:
+        started.pop()
+
+
+def instrument_engine(engine: Engine) -> None:
+    """
+    Time and count every SQL statement executed through the engine.
+
+    Statement time is also reported as the `db` phase of the current request (see `backend.utils.timing`).
+
+    Args:
+        engine: The synchronous engine behind the application's `AsyncEngine`
+    """
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
+
+
+class QueryBudgetMiddleware:
+    """
+    Count the SQL statements of every HTTP request and flag requests exceeding the query budget.
+
+    A request running more statements than `db_query_budget` usually loads related rows one by one (N+1),
+    the most repeated statement is logged to point at the culprit. In debug mode the counts are also sent
+    to the client in `X-DB-Query-Count` and `X-DB-Query-Duration-Ms` headers.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with track_queries() as queries:
+
+            async def send_with_query_headers(message: Message) -> None:
+                if message["type"] == "http.response.start" and settings.debug:
+                    headers = MutableHeaders(scope=message)
+                    headers["X-DB-Query-Count"] = str(queries.count)
+                    headers["X-DB-Query-Duration-Ms"] = f"{queries.duration * 1000:.2f}"
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_query_headers)
+            finally:
+                # Recorded after the response, so statements of dependency teardown (e.g. the session commit) are included
+                self._report(scope, queries)
+
+    @staticmethod
+    def _report(scope: Scope, queries: RequestQueries) -> None:
+        if not queries.count:
+            return
+
+        route = route_template(scope)
+        DB_QUERIES_PER_REQUEST.observe(queries.count, route)
+        budget = queries.budget if queries.budget is not None else settings.db_query_budget
+        if budget and queries.count > budget:
+            DB_QUERY_BUDGET_EXCEEDED.inc(route)
+            statement, repetitions = queries.statements.most_common(1)[0]
+            logger.warning(
+                "%s %s executed %s SQL statements (budget %s), possible N+1. Most repeated (%sx): %s",
+                scope["method"],
+                route,
+                queries.count,
+                budget,
+                repetitions,
+                " ".join(statement.split()),
+            )
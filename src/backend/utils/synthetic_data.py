@@ -0,0 +1,333 @@
+"""Synthetic users and observations for benchmarking at production scale, bulk loaded with binary COPY."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing
+import random
+import secrets
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from itertools import islice
+from typing import TYPE_CHECKING, Any
+
+import asyncpg
+
+from backend.models.enums.frequencies import BandwidthEnum, CentralFrequencyEnum
+from backend.models.enums.observation_status import ObservationStatusEnum
+from backend.models.enums.observation_type import ObservationTypeEnum
+from backend.models.enums.reference_frame import ReferenceFrameEnum
+from backend.utils.partitions import create_observation_partitions
+from backend.utils.time_utils import utc_now
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+logger = logging.getLogger("astro_backend")
+
+USER_COLUMNS = ("id", "user_id", "username", "email", "auth_provider", "created_at", "updated_at", "is_active")
+OBSERVATION_COLUMNS = (
+    "user_id",
+    "status",
+    "created_on",
+    "updated_on",
+    "completed_on",
+    "target_name",
+    "ra",
+    "dec",
+    "center_frequency",
+    "bandwidth",
+    "velocity_frame",
+    "observation_type",
+    "fft_size",
+    "integration_time",
+    "receive_csv",
+    "perform_data_analysis",
+    "planned_start",
+    "output_filename",
+    "csv_download_url",
+    "analysis_results_url",
+    "data_download_url",
+)
+
+# Weights roughly following a telescope that has been in service for a while: most requests are finished
+STATUS_WEIGHTS = {
+    ObservationStatusEnum.COMPLETED: 70,
+    ObservationStatusEnum.PENDING: 12,
+    ObservationStatusEnum.CANCELLED: 8,
+    ObservationStatusEnum.FAILED: 5,
+    ObservationStatusEnum.IN_PROGRESS: 5,
+}
+# Center frequency with the bandwidths used around it, weighted towards the 21 cm hydrogen line
+FREQUENCY_SETUPS = {
+    CentralFrequencyEnum.FREQ_1420_MHZ: (70, (BandwidthEnum.BW_1_5_MHZ, BandwidthEnum.BW_2_5_MHZ, BandwidthEnum.BW_5_5_MHZ, BandwidthEnum.BW_10_MHZ)),
+    CentralFrequencyEnum.FREQ_1670_MHZ: (20, (BandwidthEnum.BW_1_75_MHZ, BandwidthEnum.BW_3_MHZ, BandwidthEnum.BW_6_MHZ)),
+    CentralFrequencyEnum.FREQ_22000_MHZ: (10, (BandwidthEnum.BW_8_75_MHZ, BandwidthEnum.BW_14_MHZ, BandwidthEnum.BW_28_MHZ)),
+}
+VELOCITY_FRAME_WEIGHTS = {
+    ReferenceFrameEnum.LSRK: 75,
+    ReferenceFrameEnum.BARY: 10,
+    ReferenceFrameEnum.TOPO: 10,
+    ReferenceFrameEnum.HELIO: 3,
+    ReferenceFrameEnum.GEO: 2,
+}
+OBSERVATION_TYPE_WEIGHTS = {
+    ObservationTypeEnum.TARGET_OBSERVATION: 90,
+    ObservationTypeEnum.HOT_CALIBRATION: 5,
+    ObservationTypeEnum.COLD_CALIBRATION: 5,
+}
+TARGETS = ("Cas A", "Cyg A", "Tau A", "Sgr A*", "M31", "M33", "LMC", "Orion KL", "W51", "DR21", "Galactic plane", "Sun")
+FFT_SIZES = (512, 1024, 2048, 4096)
+INTEGRATION_TIMES = (60.0, 300.0, 600.0, 1800.0, 3600.0)
+# Size of the pool of pre-generated telescope configurations rows are drawn from
+CONFIGURATION_POOL_SIZE = 4096
+STORAGE_URL = "https://storage.example.com/observations"
+
+
+def _weighted_choice[T](rng: random.Random, weights: dict[T, int]) -> T:
+    return rng.choices(tuple(weights), weights=tuple(weights.values()))[0]
+
+
+def _configuration_pool(rng: random.Random) -> list[tuple[Any, ...]]:
+    """
+    Pre-generate telescope configurations (frequency to planning flags) with realistic correlations.
+
+    Drawing whole configurations from a pool keeps the per-row work to a few random numbers,
+    generation would otherwise be slower than COPY itself.
+    """
+    frequency_weights = {frequency: weight for frequency, (weight, _) in FREQUENCY_SETUPS.items()}
+    pool = []
+    for _ in range(CONFIGURATION_POOL_SIZE):
+        frequency = _weighted_choice(rng, frequency_weights)
+        observation_type = _weighted_choice(rng, OBSERVATION_TYPE_WEIGHTS)
+        pool.append(
+            (
+                frequency.name,
+                rng.choice(FREQUENCY_SETUPS[frequency][1]).name,
+                _weighted_choice(rng, VELOCITY_FRAME_WEIGHTS).name,
+                observation_type.name,
+                rng.choice(FFT_SIZES),
+                rng.choice(INTEGRATION_TIMES),
+                rng.random() < 0.3,  # noqa: PLR2004
+                observation_type is ObservationTypeEnum.TARGET_OBSERVATION and rng.random() < 0.8,  # noqa: PLR2004
+            ),
+        )
+    return pool
+
+
+@dataclass(frozen=True, slots=True)
+class SeedPlan:
+    """Parameters shared by the row generators of one seeding run."""
+
+    first_user_id: int
+    users: int
+    now: datetime
+    days: int
+    run: str
+
+
+def user_records(plan: SeedPlan, rng: random.Random) -> Iterator[tuple[Any, ...]]:
+    """
+    Generate `users` rows with consecutive ids.
+
+    Args:
+        plan: Ids, count and time span of the users; `run` keeps their unique columns distinct from earlier runs
+        rng: Random number generator
+
+    Yields:
+        tuple[Any, ...]: Row values in the order of `USER_COLUMNS`
+    """
+    span = plan.days * 86_400
+    for number in range(plan.users):
+        created_at = plan.now - timedelta(seconds=rng.random() * span)
+        name = f"seed_{plan.run}_{number}"
+        yield (
+            plan.first_user_id + number,
+            f"seed-{plan.run}-{number}",
+            name,
+            f"{name}@example.com",
+            "supabase" if rng.random() < 0.7 else "guest",  # noqa: PLR2004
+            created_at,
+            created_at,
+            rng.random() < 0.98,  # noqa: PLR2004
+        )
+
+
+def observation_records(plan: SeedPlan, count: int, rng: random.Random) -> Iterator[tuple[Any, ...]]:
+    """
+    Generate `observations` rows for the users of the plan.
+
+    A few users submit most observations. Pointings follow the sky visible from the telescope, concentrated
+    along the galactic plane region, and status dependent timestamps (completion, download URLs) are consistent.
+
+    Args:
+        plan: The users to assign observations to and the time span of the submissions
+        count: Number of observations
+        rng: Random number generator
+
+    Yields:
+        tuple[Any, ...]: Row values in the order of `OBSERVATION_COLUMNS`
+    """
+    configurations = _configuration_pool(rng)
+    # One entry per weight unit, indexing it is much cheaper than a weighted choice per row
+    statuses = [status.name for status, weight in STATUS_WEIGHTS.items() for _ in range(weight)]
+    random_value = rng.random
+    gauss = rng.gauss
+    first_user_id, users, now = plan.first_user_id, plan.users, plan.now
+    span = plan.days * 86_400
+
+    for number in range(count):
+        status = statuses[int(random_value() * len(statuses))]
+        created_on = now - timedelta(seconds=random_value() * span)
+        configuration = configurations[int(random_value() * CONFIGURATION_POOL_SIZE)]
+        planned_start = created_on + timedelta(hours=random_value() * 72)
+        output_filename = f"seed_{number}"
+
+        completed_on = csv_url = analysis_url = data_url = None
+        updated_on = created_on
+        if status == "COMPLETED":
+            completed_on = updated_on = min(now, planned_start + timedelta(seconds=configuration[5] + random_value() * 600))
+            data_url = f"{STORAGE_URL}/{output_filename}.fits"
+            csv_url = f"{STORAGE_URL}/{output_filename}.csv" if configuration[6] else None
+            analysis_url = f"{STORAGE_URL}/{output_filename}_analysis.zip" if configuration[7] else None
+        elif status == "FAILED":
+            completed_on = updated_on = min(now, planned_start + timedelta(seconds=random_value() * configuration[5]))
+        elif status in {"CANCELLED", "IN_PROGRESS"}:
+            updated_on = min(now, created_on + timedelta(seconds=random_value() * 3600))
+
+        yield (
+            first_user_id + int(users * random_value() ** 3),
+            status,
+            created_on,
+            updated_on,
+            completed_on,
+            TARGETS[int(random_value() * len(TARGETS))],
+            random_value() * 360,
+            max(-40.0, min(90.0, gauss(20, 30))),
+            *configuration,
+            planned_start,
+            output_filename,
+            csv_url,
+            analysis_url,
+            data_url,
+        )
+
+
+async def _copy_in_batches(
+    connection: asyncpg.Connection,
+    table: str,
+    columns: tuple[str, ...],
+    records: Iterator[tuple[Any, ...]],
+    batch_size: int,
+) -> int:
+    """
+    COPY rows into a table in batches, generating the next batch while the previous one is being copied.
+
+    Every batch is its own COPY and transaction, so memory stays bounded and an interrupted seed keeps its progress.
+
+    Returns:
+        int: The number of copied rows
+    """
+    copied = 0
+    copying: asyncio.Task[str] | None = None
+    # Generation runs in a thread so the event loop keeps streaming the previous batch to the server meanwhile
+    while batch := await asyncio.to_thread(list, islice(records, batch_size)):
+        if copying is not None:
+            await copying
+        copying = asyncio.create_task(connection.copy_records_to_table(table, records=batch, columns=columns))
+        copied += len(batch)
+    if copying is not None:
+        await copying
+    return copied
+
+
+async def _reserve_user_ids(connection: asyncpg.Connection, count: int) -> int:
+    """Advance the `users.id` sequence past `count` ids in one step and return the first reserved id."""
+    last_id = await connection.fetchval(
+        "SELECT setval(pg_get_serial_sequence('users', 'id'), nextval(pg_get_serial_sequence('users', 'id')) + $1 - 1)",
+        count,
+    )
+    return last_id - count + 1
+
+
+async def _copy_observations(dsn: str, plan: SeedPlan, count: int, batch_size: int, seed: int | None) -> int:
+    connection: asyncpg.Connection = await asyncpg.connect(dsn)
+    try:
+        records = observation_records(plan, count, random.Random(seed))  # noqa: S311
+        return await _copy_in_batches(connection, "observations", OBSERVATION_COLUMNS, records, batch_size)
+    finally:
+        await connection.close()
+
+
+def _copy_observations_in_process(*arguments: Any) -> int:  # noqa: ANN401
+    return asyncio.run(_copy_observations(*arguments))
+
+
+async def seed_database(  # noqa: PLR0913
+    dsn: str,
+    users: int,
+    observations: int,
+    *,
+    days: int = 365,
+    batch_size: int = 50_000,
+    jobs: int = 1,
+    seed: int | None = None,
+) -> SeedPlan:
+    """
+    Bulk load synthetic users and observations.
+
+    Rows are generated lazily and sent with binary COPY in batches of `batch_size`, so millions of rows can be
+    loaded without holding them in memory. Generating rows in Python is the bottleneck, with `jobs` > 1 the
+    observations are split between that many processes, each copying over its own connection.
+    Repeated unseeded runs add more rows instead of clashing on unique columns.
+
+    Args:
+        dsn: asyncpg DSN of the migrated database
+        users: Number of users to create
+        observations: Number of observations to create, spread over the new users
+        days: Creation timestamps are spread over this many days before now
+        batch_size: Rows per COPY
+        jobs: Number of processes copying observations
+        seed: Seed of the random generators, for reproducible data sets
+
+    Returns:
+        SeedPlan: The ids and time span of the created users
+    """
+    if users < 1:
+        msg = "At least one user is needed to assign observations to"
+        raise ValueError(msg)
+
+    run = secrets.token_hex(4) if seed is None else f"s{seed}"
+    started = time.perf_counter()
+    connection: asyncpg.Connection = await asyncpg.connect(dsn)
+    try:
+        plan = SeedPlan(await _reserve_user_ids(connection, users), users, utc_now(), days, run)
+        records = user_records(plan, random.Random(seed))  # noqa: S311
+        await _copy_in_batches(connection, "users", USER_COLUMNS, records, batch_size)
+        logger.info("Copied %s users in %.1f s", users, time.perf_counter() - started)
+
+        # Rows of months without a partition would all land in the default partition
+        await create_observation_partitions(connection, (plan.now - timedelta(days=days)).date(), plan.now.date())
+
+        started = time.perf_counter()
+        shares = [observations // jobs + (job < observations % jobs) for job in range(jobs)]
+        arguments = [(dsn, plan, share, batch_size, None if seed is None else seed + job + 1) for job, share in enumerate(shares)]
+        if jobs == 1:
+            copied = await _copy_observations(*arguments[0])
+        else:
+            loop = asyncio.get_running_loop()
+            # Spawned rather than forked, the parent already runs an event loop and threads
+            with ProcessPoolExecutor(max_workers=jobs, mp_context=multiprocessing.get_context("spawn")) as executor:
+                copies = (loop.run_in_executor(executor, _copy_observations_in_process, *job) for job in arguments)
+                copied = sum(await asyncio.gather(*copies))
+        elapsed = time.perf_counter() - started
+        logger.info("Copied %s observations in %.1f s (%.0f rows/s)", copied, elapsed, copied / elapsed if elapsed else 0)
+
+        # Fresh planner statistics, so benchmarks run against the plans production data would get
+        await connection.execute("ANALYZE users, observations")
+    finally:
+        await connection.close()
+    return plan
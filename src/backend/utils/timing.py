@@ -0,0 +1,254 @@
+"""Context-local request phase timers, reported in a `Server-Timing` header and aggregated per route."""
+
+from __future__ import annotations
+
+import functools
+import inspect
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from fastapi.routing import APIRoute
+from starlette.datastructures import MutableHeaders
+
+from backend.configs.config import settings
+from backend.utils.metrics import Histogram, registry
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Phases in reporting order. `app` is the route body, so it includes the `db` and `email` time spent inside it.
+PHASES = ("auth", "db", "email", "app", "serialization", "total")
+
+PHASE_DESCRIPTIONS = {
+    "auth": "JWT verification",
+    "db": "SQL execution",
+    "email": "SMTP delivery",
+    "app": "Route body",
+    "serialization": "Response serialization",
+    "total": "Time to response start",
+}
+
+
+HTTP_REQUEST_DURATION = registry.register(
+    Histogram(
+        "http_request_duration_seconds",
+        "Time from receiving a request to starting its response",
+        ("method", "route", "status"),
+    ),
+)
+
+
+@dataclass(slots=True)
+class RequestTimings:
+    """Accumulated phase durations (in seconds) of a single request."""
+
+    started: float = field(default_factory=time.perf_counter)
+    phases: dict[str, float] = field(default_factory=dict)
+    endpoint_finished: float | None = None
+
+    def add(self, phase: str, seconds: float) -> None:
+        """Add time to a phase, phases entered several times (e.g. one per SQL statement) are summed."""
+        self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+
+    def server_timing(self) -> str:
+        """Render the phases as a `Server-Timing` header value with durations in milliseconds."""
+        return ", ".join(
+            f'{phase};dur={self.phases[phase] * 1000:.2f};desc="{PHASE_DESCRIPTIONS[phase]}"' for phase in PHASES if phase in self.phases
+        )
+
+
+_request_timings: ContextVar[RequestTimings | None] = ContextVar("request_timings", default=None)
+
+
+def current_request_timings() -> RequestTimings | None:
+    """Return the timings of the request being handled, or None outside of a request."""
+    return _request_timings.get()
+
+
+@contextmanager
+def request_phase(phase: str) -> Iterator[None]:
+    """
+    Time the enclosed block as part of a phase of the current request.
+
+    Outside of a request (e.g. in the observation processor) this does nothing.
+
+    Args:
+        phase: One of `PHASES`
+
+    Yields:
+        None
+    """
+    timings = _request_timings.get()
+    if timings is None:
+        yield
+        return
+
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings.add(phase, time.perf_counter() - started)
+
+
+@dataclass(slots=True)
+class PhaseStats:
+    """Running statistics of a single phase of a route."""
+
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+
+    def record(self, seconds: float) -> None:
+        """Record one observed duration."""
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+
+class RouteTimingAggregator:
+    """
+    Per-route phase statistics of the current worker process.
+
+    Only ever updated from the event loop thread without awaiting in between, so no locking is needed.
+    """
+
+    def __init__(self) -> None:
+        self._routes: defaultdict[str, defaultdict[str, PhaseStats]] = defaultdict(lambda: defaultdict(PhaseStats))
+
+    def record(self, route: str, timings: RequestTimings) -> None:
+        """Record the phases of a finished request under its route."""
+        route_stats = self._routes[route]
+        for phase, seconds in timings.phases.items():
+            route_stats[phase].record(seconds)
+
+    def snapshot(self) -> dict[str, dict[str, dict[str, float]]]:
+        """
+        Return the statistics of every route.
+
+        Returns:
+            dict[str, dict[str, dict[str, float]]]: Per route and phase, the request count, mean and max duration in milliseconds
+        """
+        return {
+            route: {
+                phase: {
+                    "count": stats.count,
+                    "mean_ms": round(stats.total / stats.count * 1000, 3),
+                    "max_ms": round(stats.max * 1000, 3),
+                }
+                for phase, stats in sorted(phases.items(), key=lambda item: PHASES.index(item[0]))
+            }
+            for route, phases in sorted(self._routes.items())
+        }
+
+
+route_timings = RouteTimingAggregator()
+
+
+def route_template(scope: Scope) -> str:
+    """
+    Return the path template of the matched route, so path parameters do not create one entry per ID.
+
+    The route in the scope carries the path of its own router, the prefixes it was included with are taken from the request path.
+    """
+    route = scope.get("route")
+    template = getattr(route, "path", None)
+    if template is None:
+        return "unmatched"
+
+    if isinstance(route, APIRoute):
+        template = scope["path"].rsplit("/", template.count("/"))[0] + template
+
+    return template
+
+
+class ServerTimingMiddleware:
+    """Start the phase timers of every HTTP request and add the `Server-Timing` header to its response."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timings = RequestTimings()
+        token = _request_timings.set(timings)
+        status_code = 500
+
+        async def send_with_server_timing(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                nonlocal status_code
+                status_code = message["status"]
+                now = time.perf_counter()
+                if timings.endpoint_finished is not None:
+                    timings.add("serialization", now - timings.endpoint_finished)
+                timings.add("total", now - timings.started)
+                if settings.server_timing_header:
+                    MutableHeaders(scope=message).append("Server-Timing", timings.server_timing())
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_server_timing)
+        finally:
+            _request_timings.reset(token)
+            template = route_template(scope)
+            route_timings.record(f"{scope['method']} {template}", timings)
+            HTTP_REQUEST_DURATION.observe(
+                timings.phases.get("total", time.perf_counter() - timings.started),
+                scope["method"],
+                template,
+                str(status_code),
+            )
+
+
+def _timed_endpoint(endpoint: Callable[..., Any], *, is_coroutine: bool) -> Callable[..., Any]:
+    """Wrap a route endpoint so its body is timed as the `app` phase."""
+
+    def finish(timings: RequestTimings | None, started: float) -> None:
+        if timings is not None:
+            timings.endpoint_finished = time.perf_counter()
+            timings.add("app", timings.endpoint_finished - started)
+
+    if is_coroutine:
+
+        @functools.wraps(endpoint)
+        async def timed_coroutine_endpoint(*args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+            timings, started = _request_timings.get(), time.perf_counter()
+            try:
+                return await endpoint(*args, **kwargs)
+            finally:
+                finish(timings, started)
+
+        return timed_coroutine_endpoint
+
+    @functools.wraps(endpoint)
+    def timed_endpoint(*args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+        timings, started = _request_timings.get(), time.perf_counter()
+        try:
+            return endpoint(*args, **kwargs)
+        finally:
+            finish(timings, started)
+
+    return timed_endpoint
+
+
+class TimedRoute(APIRoute):
+    """
+    API route timing its body as the `app` phase, the serialization that follows is timed by `ServerTimingMiddleware`.
+
+    FastAPI analyses the signature of the wrapped endpoint, so parameters and dependencies are unaffected.
+    Streaming endpoints (generators) are left alone, their body runs while the response is being sent.
+    """
+
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs: Any) -> None:  # noqa: ANN401
+        if not (inspect.isgeneratorfunction(endpoint) or inspect.isasyncgenfunction(endpoint)):
+            endpoint = _timed_endpoint(endpoint, is_coroutine=inspect.iscoroutinefunction(endpoint))
+
+        super().__init__(path, endpoint, **kwargs)
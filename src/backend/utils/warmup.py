@@ -0,0 +1,71 @@
+"""Worker warm-up run before a worker accepts requests, so its first requests are served at steady-state latency."""
+
+from __future__ import annotations
+
+import asyncio
+import importlib
+import logging
+import time
+
+from backend.configs.config import settings
+from backend.database import get_db_session, get_read_db_session, open_pool_connections
+from backend.routers.observations import CHANGES_STATEMENTS, LIST_STATEMENTS, OBSERVATION_BY_ID, changes_parameters
+from backend.utils.auth import get_local_user_by_email, get_local_user_by_user_id
+from backend.utils.idempotency import IdempotentRequest, get_stored_response
+
+logger = logging.getLogger("astro_backend")
+
+# Imported lazily so importing the application stays fast, but needed by the first requests
+DEFERRED_MODULES = ("backend.utils.jwks", "backend.utils.email.service")
+
+
+async def _warm_up_database() -> None:
+    """
+    Open pool connections and run the statements of the hottest endpoints once.
+
+    Running them (with values matching no row) configures the ORM mappers and fills SQLAlchemy's compiled statement cache,
+    so the first requests neither compile SQL nor open connections.
+    """
+    opened = await open_pool_connections(settings.warmup_db_connections)
+    async with get_db_session() as session:
+        await get_local_user_by_user_id(session, "")
+        await get_local_user_by_email(session, "")
+        await get_stored_response(session, IdempotentRequest(scope="", key="", fingerprint=""))
+    async with get_read_db_session() as session:
+        await get_local_user_by_user_id(session, "")
+        await session.execute(OBSERVATION_BY_ID, {"observation_id": 0})
+        await session.execute(LIST_STATEMENTS[True], {"user_id": 0})
+        await session.execute(CHANGES_STATEMENTS[True, False], changes_parameters(limit=1, user_id=0))
+    logger.debug("Warm-up opened %s database connections", opened)
+
+
+async def _prime_jwks() -> None:
+    """Download the Supabase signing keys, so the first authenticated request does not wait for the JWKS."""
+    from backend.utils.jwks import jwks_client  # noqa: PLC0415
+
+    # PyJWKClient downloads with blocking I/O
+    await asyncio.to_thread(jwks_client().get_signing_keys)
+
+
+async def warm_up() -> None:
+    """
+    Prepare the worker for its first requests, bounded by `warmup_timeout`.
+
+    Failures are logged and the worker serves requests anyway, as it did before warm-ups existed.
+    """
+    started = time.perf_counter()
+    for module in DEFERRED_MODULES:
+        importlib.import_module(module)
+
+    steps = {"database": _warm_up_database(), "JWKS": _prime_jwks()}
+    try:
+        async with asyncio.timeout(settings.warmup_timeout):
+            results = await asyncio.gather(*steps.values(), return_exceptions=True)
+    except TimeoutError:
+        logger.warning("Warm-up did not finish within %ss, serving requests anyway", settings.warmup_timeout)
+        return
+
+    for step, result in zip(steps, results, strict=True):
+        if isinstance(result, Exception):
+            logger.warning("Warm-up of the %s failed, serving requests anyway: %s", step, result)
+    logger.info("Warm-up finished in %.0f ms", (time.perf_counter() - started) * 1000)
@@ -0,0 +1,98 @@
+"""
+Round trip budget of `POST /v1/observations/`: the exact SQL statements a submission by an existing user executes.
+
+Runs against the database configured by `DATABASE_URL`, migrated to the latest revision (`backend-db init`), and is
+skipped when it is not reachable.
+"""
+
+import uuid
+from collections.abc import AsyncIterator, Iterator
+from typing import Any
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event, text
+
+from backend import database
+from backend.main import app
+from backend.models import ObservationCreate
+from backend.utils import admission
+from backend.utils.auth import AuthPrincipal, get_optional_principal, get_or_create_local_user_from_principal
+
+pytestmark = pytest.mark.anyio
+
+OBSERVATION: dict[str, Any] = ObservationCreate.model_config["json_schema_extra"]["example"]
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+@pytest.fixture
+async def principal() -> AsyncIterator[AuthPrincipal]:
+    database.initialize_database_connection()
+    subject = f"query-count-{uuid.uuid4().hex}"
+    principal = AuthPrincipal(subject=subject, email=f"{subject}@example.com", username=subject)
+    try:
+        async with database.get_db_session() as session:
+            user = await get_or_create_local_user_from_principal(session, principal)
+    except OSError as exc:
+        await database.close_database_connection()
+        pytest.skip(f"Database not reachable: {exc}")
+
+    yield principal
+
+    async with database.get_db_session() as session:
+        # Observations first: their delete trigger (migration 20261019_0007) writes the user's counter rows back
+        for table in ("observations", "observation_user_counts", "observation_quota_usage", "idempotency_keys"):
+            column = "scope" if table == "idempotency_keys" else "user_id"
+            value = subject if table == "idempotency_keys" else user.id
+            await session.execute(text(f"DELETE FROM {table} WHERE {column} = :value"), {"value": value})
+        await session.execute(text("DELETE FROM users WHERE id = :id"), {"id": user.id})
+    await database.close_database_connection()
+
+
+@pytest.fixture
+def statements(principal: AuthPrincipal, monkeypatch: pytest.MonkeyPatch) -> Iterator[list[str]]:
+    async def no_email(*_: object) -> None:
+        return None
+
+    # Statements of the route only: the principal is verified without a JWKS, the default in-memory rate limiter
+    # executes nothing and no confirmation email is sent
+    app.dependency_overrides[get_optional_principal] = lambda: principal
+    monkeypatch.setattr(admission, "rate_limiter", admission.InMemoryRateLimiter(burst=100, refill_per_second=1.0))
+    monkeypatch.setattr("backend.utils.email.service.send_observation_confirmation_email", no_email)
+
+    executed: list[str] = []
+
+    def record(_connection: object, _cursor: object, statement: str, *_: object) -> None:
+        executed.append(statement)
+
+    engine = database.engine.sync_engine
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield executed
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+        app.dependency_overrides.pop(get_optional_principal, None)
+
+
+async def _submit(headers: dict[str, str] | None = None) -> int:
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.post("/v1/observations/", json={"observation": OBSERVATION}, headers=headers)
+    return response.status_code
+
+
+async def test_submit_by_existing_user(statements: list[str]) -> None:
+    assert await _submit() == 202
+
+    # User lookup, quota reservation, observation INSERT ... RETURNING
+    assert [statement.split()[0] for statement in statements] == ["SELECT", "INSERT", "INSERT"], statements
+
+
+async def test_idempotent_submit_by_existing_user(statements: list[str]) -> None:
+    assert await _submit({"Idempotency-Key": uuid.uuid4().hex}) == 202
+
+    # Idempotency key lookup, user lookup, quota reservation, observation INSERT ... RETURNING, stored response
+    assert [statement.split()[0] for statement in statements] == ["SELECT", "SELECT", "INSERT", "INSERT", "INSERT"], statements
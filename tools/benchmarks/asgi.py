@@ -0,0 +1,78 @@
+"""Minimal in-process ASGI driver, so benchmarks measure the application and not an HTTP client or the network."""
+
+import time
+from collections.abc import Awaitable, Callable, MutableMapping
+from typing import Any
+
+Message = MutableMapping[str, Any]
+ASGIApp = Callable[[Message, Callable[[], Awaitable[Message]], Callable[[Message], Awaitable[None]]], Awaitable[None]]
+
+
+async def call_asgi(
+    app: ASGIApp,
+    method: str,
+    path: str,
+    body: bytes = b"",
+    headers: list[tuple[bytes, bytes]] | None = None,
+) -> tuple[int, dict[bytes, bytes], bytes]:
+    """
+    Send a single HTTP request straight to an ASGI application.
+
+    Args:
+        app: The ASGI application
+        method: HTTP method
+        path: Request path, without query string
+        body: Request body
+        headers: Raw request headers
+
+    Returns:
+        tuple[int, dict[bytes, bytes], bytes]: Status code, response headers and response body
+    """
+    scope: Message = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"host", b"benchmark"), *(headers or [])],
+        "client": ("127.0.0.1", 50000),
+        "server": ("benchmark", 80),
+    }
+    request_sent = False
+    status_code = 0
+    response_headers: dict[bytes, bytes] = {}
+    chunks: list[bytes] = []
+
+    async def receive() -> Message:
+        nonlocal request_sent
+        if request_sent:
+            return {"type": "http.disconnect"}
+        request_sent = True
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message: Message) -> None:
+        nonlocal status_code
+        if message["type"] == "http.response.start":
+            status_code = message["status"]
+            response_headers.update(message.get("headers", []))
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return status_code, response_headers, b"".join(chunks)
+
+
+async def timed_call(app: ASGIApp, method: str, path: str, body: bytes = b"") -> float:
+    """
+    Send a single request and return its latency.
+
+    Returns:
+        float: Latency in milliseconds
+    """
+    started = time.perf_counter()
+    await call_asgi(app, method, path, body)
+    return (time.perf_counter() - started) * 1000
@@ -0,0 +1,98 @@
+"""Minimal keep-alive HTTP/1.1 client, so the load generator itself stays cheap and dependency free."""
+
+import asyncio
+import contextlib
+import json
+from typing import Any
+
+
+class HttpConnection:
+    """A single persistent connection sending one request at a time, reconnecting when the server closes it."""
+
+    def __init__(self, host: str, port: int) -> None:
+        self.host = host
+        self.port = port
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        payload: Any = None,  # noqa: ANN401
+        headers: dict[str, str] | None = None,
+    ) -> tuple[int, bytes]:
+        """
+        Send a request and read the whole response.
+
+        Args:
+            method: HTTP method
+            path: Request path including the query string
+            payload: JSON-serializable request body
+            headers: Extra request headers
+
+        Returns:
+            tuple[int, bytes]: Status code and response body
+        """
+        body = json.dumps(payload).encode() if payload is not None else b""
+        head = [f"{method} {path} HTTP/1.1", f"Host: {self.host}:{self.port}", f"Content-Length: {len(body)}"]
+        if payload is not None:
+            head.append("Content-Type: application/json")
+        head.extend(f"{name}: {value}" for name, value in (headers or {}).items())
+        message = ("\r\n".join(head) + "\r\n\r\n").encode() + body
+
+        if self._writer is None or self._writer.is_closing():
+            await self._connect()
+
+        try:
+            return await self._exchange(message)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            # The server may close idle keep-alive connections (e.g. a recycled worker), retry once on a new one
+            await self._connect()
+            return await self._exchange(message)
+
+    async def close(self) -> None:
+        """Close the connection."""
+        if self._writer is not None:
+            self._writer.close()
+            with contextlib.suppress(ConnectionError):
+                await self._writer.wait_closed()
+            self._writer = None
+
+    async def _connect(self) -> None:
+        await self.close()
+        self._reader, self._writer = await asyncio.open_connection(self.host, self.port)
+
+    async def _exchange(self, message: bytes) -> tuple[int, bytes]:
+        assert self._reader is not None  # noqa: S101
+        assert self._writer is not None  # noqa: S101
+
+        self._writer.write(message)
+        await self._writer.drain()
+
+        status_line = await self._reader.readuntil(b"\r\n")
+        status_code = int(status_line.split(b" ", 2)[1])
+        response_headers: dict[bytes, bytes] = {}
+        while (line := await self._reader.readuntil(b"\r\n")) != b"\r\n":
+            name, _, value = line.partition(b":")
+            response_headers[name.strip().lower()] = value.strip()
+
+        if response_headers.get(b"transfer-encoding") == b"chunked":
+            body = await self._read_chunked()
+        else:
+            body = await self._reader.readexactly(int(response_headers.get(b"content-length", b"0")))
+
+        if response_headers.get(b"connection", b"").lower() == b"close":
+            await self.close()
+
+        return status_code, body
+
+    async def _read_chunked(self) -> bytes:
+        assert self._reader is not None  # noqa: S101
+
+        chunks: list[bytes] = []
+        while size := int((await self._reader.readuntil(b"\r\n")).split(b";", 1)[0], 16):
+            chunks.append(await self._reader.readexactly(size))
+            await self._reader.readexactly(2)
+        await self._reader.readuntil(b"\r\n")
+        return b"".join(chunks)
@@ -0,0 +1,105 @@
+"""
+Import-time benchmark of the application, the bulk of a worker's cold start.
+
+Imports the application in fresh interpreters with `-X importtime`, reports the median import time and the
+packages it is spent in, and fails when the median exceeds the budget or a deferred subsystem is imported eagerly.
+
+Usage:
+    uv run python -m tools.benchmarks.import_time
+    uv run python -m tools.benchmarks.import_time --runs 20 --budget-ms 800 --top 15
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+from pathlib import Path
+from typing import Any
+
+from tools.benchmarks.results import git_commit, write_results
+
+DEFAULT_MODULE = "backend.main"
+DEFAULT_BUDGET_MS = 1500.0
+# Loaded on first use (or by the worker warm-up), importing the application must not pull them in
+DEFERRED_MODULES = ("jwt", "aiosmtplib", "jinja2", "backend.utils.jwks", "backend.utils.email.service")
+
+
+def measure_import(module: str) -> tuple[float, dict[str, float]]:
+    """
+    Import `module` in a fresh interpreter.
+
+    Returns:
+        tuple[float, dict[str, float]]: Cumulative import time of the module and self time per imported module, in milliseconds
+    """
+    completed = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    self_times: dict[str, float] = {}
+    total_ms = 0.0
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, cumulative_us, name = (field.strip() for field in line.removeprefix("import time:").split("|"))
+        if not self_us.isdigit():
+            continue  # Header line
+        self_times[name] = int(self_us) / 1000
+        if name == module:
+            total_ms = int(cumulative_us) / 1000
+    return total_ms, self_times
+
+
+def run(arguments: argparse.Namespace) -> dict[str, Any]:
+    """Run the benchmark and return its results."""
+    totals = []
+    package_times: defaultdict[str, list[float]] = defaultdict(list)
+    imported: set[str] = set()
+    for _ in range(arguments.runs):
+        total_ms, self_times = measure_import(arguments.module)
+        totals.append(total_ms)
+        imported.update(self_times)
+        per_package: defaultdict[str, float] = defaultdict(float)
+        for name, self_ms in self_times.items():
+            per_package[name.split(".", 1)[0]] += self_ms
+        for package, self_ms in per_package.items():
+            package_times[package].append(self_ms)
+
+    median_ms = statistics.median(totals)
+    packages = sorted(((package, statistics.median(times)) for package, times in package_times.items()), key=lambda item: -item[1])
+    return {
+        "commit": git_commit(),
+        "config": {"module": arguments.module, "runs": arguments.runs, "budget_ms": arguments.budget_ms},
+        "median_ms": round(median_ms, 1),
+        "min_ms": round(min(totals), 1),
+        "max_ms": round(max(totals), 1),
+        "within_budget": median_ms <= arguments.budget_ms,
+        "eagerly_imported": sorted(module for module in DEFERRED_MODULES if module in imported),
+        "packages_ms": {package: round(self_ms, 1) for package, self_ms in packages[: arguments.top]},
+    }
+
+
+def main() -> None:
+    """Entry point of the import-time benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--module", default=DEFAULT_MODULE, help="Module to import")
+    parser.add_argument("--runs", type=int, default=10, help="Fresh interpreters to import the module in")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS, help="Maximum median import time")
+    parser.add_argument("--top", type=int, default=10, help="Packages to list by import time")
+    parser.add_argument("--output", type=Path, help="Results file")
+    arguments = parser.parse_args()
+
+    results = run(arguments)
+    output = write_results("import-time", results, arguments.output)
+    sys.stdout.write(json.dumps(results, indent=2) + "\n")
+    sys.stdout.write(f"Results written to {output}\n")
+
+    if not results["within_budget"] or results["eagerly_imported"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,322 @@
+"""
+End-to-end HTTP load test of the observation API.
+
+Starts a local JWKS stub and SMTP sink, launches the backend against them (and the configured PostgreSQL database,
+which must already be migrated), then drives submit, list, get and cancel requests with signed test tokens.
+Throughput and p50/p95/p99 latency per endpoint are printed and stored as JSON, so runs can be compared across commits.
+
+Usage:
+    docker run --rm -d -p 5432:5432 -e POSTGRES_PASSWORD=postgres -e POSTGRES_DB=astro_beam postgres:17
+    uv run backend-db init
+    uv run python -m tools.benchmarks.load_test --duration 60 --concurrency 64
+    uv run python -m tools.benchmarks.load_test --compare benchmark-results/<previous>.json
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import random
+import signal
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+from backend.configs.config import settings
+from tools.benchmarks.http_client import HttpConnection
+from tools.benchmarks.results import RESULTS_DIR, git_commit, write_results
+from tools.benchmarks.stats import summarize
+from tools.benchmarks.stubs import JwksStub, SmtpSink
+
+STARTUP_TIMEOUT = 60
+DEFAULT_MIX = "submit=15,list=25,get=50,cancel=10"
+API_PREFIX = "/v1/observations"
+
+# Realistic submission values, weighted towards the common 1420 MHz hydrogen line setups
+FREQUENCY_SETUPS = [(1420.0, [1.5, 2.5, 5.5, 10.0], 70), (1670.0, [1.75, 3.0, 6.0], 20), (22000.0, [8.75, 14.0, 28.0], 10)]
+OBSERVATION_TYPES = [("TARGET_OBSERVATION", 90), ("HOT_CALIBRATION", 5), ("COLD_CALIBRATION", 5)]
+VELOCITY_FRAMES = [("LSRK", 75), ("BARY", 10), ("TOPO", 10), ("HELIO", 3), ("GEO", 2)]
+
+
+@dataclass
+class VirtualUser:
+    """A test user with its own token and the observations it submitted."""
+
+    token: str
+    observation_ids: list[int] = field(default_factory=list)
+    pending_ids: list[int] = field(default_factory=list)
+
+    @property
+    def headers(self) -> dict[str, str]:
+        """Return the authorization header of the user."""
+        return {"Authorization": f"Bearer {self.token}"}
+
+
+@dataclass
+class Results:
+    """Latencies and status codes per endpoint."""
+
+    latencies_ms: defaultdict[str, list[float]] = field(default_factory=lambda: defaultdict(list))
+    statuses: defaultdict[str, defaultdict[int, int]] = field(default_factory=lambda: defaultdict(lambda: defaultdict(int)))
+
+    def record(self, endpoint: str, status_code: int, latency_ms: float) -> None:
+        """Record one finished request."""
+        self.latencies_ms[endpoint].append(latency_ms)
+        self.statuses[endpoint][status_code] += 1
+
+
+def _weighted[T](choices: list[tuple[T, int]]) -> T:
+    values, weights = zip(*choices, strict=True)
+    return random.choices(values, weights=weights)[0]  # noqa: S311
+
+
+def random_observation(sequence: int) -> dict[str, Any]:
+    """Build a plausible observation submission payload."""
+    center_frequency, bandwidths, _ = _weighted([(setup, setup[2]) for setup in FREQUENCY_SETUPS])
+    planned_start = datetime.now(UTC) + timedelta(hours=random.uniform(1, 24 * 30))  # noqa: S311
+    return {
+        "observation": {
+            "target_name": f"LOAD-{sequence}",
+            "ra": round(random.uniform(0, 360), 6),  # noqa: S311
+            # Clustered around the sky visible from the telescope
+            "dec": round(max(-40.0, min(90.0, random.gauss(30, 25))), 6),
+            "bandwidth": random.choice(bandwidths),  # noqa: S311
+            "center_frequency": center_frequency,
+            "velocity_frame": _weighted(VELOCITY_FRAMES),
+            "observation_type": _weighted(OBSERVATION_TYPES),
+            "fft_size": random.choice([512, 1024, 2048, 4096]),  # noqa: S311
+            "integration_time": random.choice([60.0, 300.0, 600.0, 1800.0]),  # noqa: S311
+            "planned_start": planned_start.replace(tzinfo=None).isoformat(timespec="seconds"),
+            "output_filename": f"load_{sequence}",
+            "receive_csv": random.random() < 0.3,  # noqa: PLR2004, S311
+            "perform_data_analysis": random.random() < 0.8,  # noqa: PLR2004, S311
+        },
+    }
+
+
+def parse_mix(mix: str) -> list[tuple[str, int]]:
+    """Parse an endpoint mix such as `submit=15,list=25,get=50,cancel=10`."""
+    weights = [(name.strip(), int(weight)) for name, weight in (part.split("=") for part in mix.split(","))]
+    unknown = {name for name, _ in weights} - {"submit", "list", "get", "cancel"}
+    if unknown:
+        msg = f"Unknown endpoints in mix: {', '.join(sorted(unknown))}"
+        raise ValueError(msg)
+    return weights
+
+
+class LoadGenerator:
+    """Concurrent clients sending the configured request mix on keep-alive connections."""
+
+    def __init__(self, host: str, port: int, users: list[VirtualUser], mix: list[tuple[str, int]]) -> None:
+        self.host = host
+        self.port = port
+        self.users = users
+        self.mix = mix
+        self._sequence = 0
+
+    async def run(self, concurrency: int, duration: float) -> tuple[Results, float]:
+        """
+        Run the request mix for a fixed duration.
+
+        Returns:
+            tuple[Results, float]: The recorded requests and the measured duration in seconds
+        """
+        results = Results()
+        deadline = time.perf_counter() + duration
+        started = time.perf_counter()
+        await asyncio.gather(*(self._client(results, deadline) for _ in range(concurrency)))
+        return results, time.perf_counter() - started
+
+    async def _client(self, results: Results, deadline: float) -> None:
+        connection = HttpConnection(self.host, self.port)
+        try:
+            while time.perf_counter() < deadline:
+                user = random.choice(self.users)  # noqa: S311
+                endpoint = _weighted(self.mix)
+                started = time.perf_counter()
+                endpoint, status_code = await self._send(connection, user, endpoint)
+                results.record(endpoint, status_code, (time.perf_counter() - started) * 1000)
+        finally:
+            await connection.close()
+
+    async def _send(self, connection: HttpConnection, user: VirtualUser, endpoint: str) -> tuple[str, int]:
+        if endpoint == "get" and user.observation_ids:
+            observation_id = random.choice(user.observation_ids)  # noqa: S311
+            status_code, _ = await connection.request("GET", f"{API_PREFIX}/{observation_id}", headers=user.headers)
+            return endpoint, status_code
+
+        if endpoint == "cancel" and user.pending_ids:
+            observation_id = user.pending_ids.pop(random.randrange(len(user.pending_ids)))  # noqa: S311
+            status_code, _ = await connection.request("DELETE", f"{API_PREFIX}/{observation_id}", headers=user.headers)
+            return endpoint, status_code
+
+        if endpoint == "list":
+            status_code, _ = await connection.request("GET", f"{API_PREFIX}/", headers=user.headers)
+            return endpoint, status_code
+
+        # Submissions, also used for get/cancel while the user has nothing to read or cancel yet
+        self._sequence += 1
+        status_code, body = await connection.request("POST", f"{API_PREFIX}/", random_observation(self._sequence), headers=user.headers)
+        if status_code < 300:  # noqa: PLR2004
+            observation_id = json.loads(body)["id"]
+            user.observation_ids.append(observation_id)
+            user.pending_ids.append(observation_id)
+        return "submit", status_code
+
+
+def summarize_results(results: Results, elapsed: float) -> dict[str, dict[str, Any]]:
+    """Summarize throughput, errors and latency percentiles per endpoint and in total."""
+    summary: dict[str, dict[str, Any]] = {}
+    all_latencies: list[float] = []
+    all_errors = 0
+    for endpoint, latencies in sorted(results.latencies_ms.items()):
+        errors = sum(count for status_code, count in results.statuses[endpoint].items() if status_code >= 400)  # noqa: PLR2004
+        summary[endpoint] = {
+            "requests": len(latencies),
+            "errors": errors,
+            "throughput_rps": round(len(latencies) / elapsed, 1),
+            **summarize(latencies),
+            "statuses": {str(status_code): count for status_code, count in sorted(results.statuses[endpoint].items())},
+        }
+        all_latencies.extend(latencies)
+        all_errors += errors
+
+    if all_latencies:
+        summary["total"] = {
+            "requests": len(all_latencies),
+            "errors": all_errors,
+            "throughput_rps": round(len(all_latencies) / elapsed, 1),
+            **summarize(all_latencies),
+        }
+    return summary
+
+
+def compare(current: dict[str, Any], previous: dict[str, Any]) -> str:
+    """Render the relative change of throughput and latency percentiles against a previous run."""
+    lines = [f"Compared with {previous.get('commit', '?')} ({previous.get('timestamp', '?')}):"]
+    for endpoint, stats in current["endpoints"].items():
+        before = previous.get("endpoints", {}).get(endpoint)
+        if not before:
+            continue
+        changes = [
+            f"{metric} {stats[metric]} ({(stats[metric] - before[metric]) / before[metric]:+.1%})"
+            for metric in ("throughput_rps", "p50_ms", "p95_ms", "p99_ms")
+            if before.get(metric)
+        ]
+        lines.append(f"  {endpoint:<8} " + ", ".join(changes))
+    return "\n".join(lines)
+
+
+async def _wait_until_healthy(host: str, port: int) -> None:
+    connection = HttpConnection(host, port)
+    try:
+        while True:
+            with contextlib.suppress(OSError, asyncio.IncompleteReadError):
+                status_code, _ = await connection.request("GET", "/v1/web/health")
+                if status_code == 200:  # noqa: PLR2004
+                    return
+            await asyncio.sleep(0.25)
+    finally:
+        await connection.close()
+
+
+async def _start_backend(arguments: argparse.Namespace, jwks: JwksStub, smtp: SmtpSink, log_file: Path) -> asyncio.subprocess.Process:
+    environment = {
+        **os.environ,
+        "DEBUG": "False",
+        "HOST": "127.0.0.1",
+        "PORT": str(arguments.port),
+        "WORKERS": str(arguments.workers),
+        "DATABASE_URL": arguments.database_url,
+        "SUPABASE_URL": jwks.url,
+        "SMTP_SERVER": smtp.host,
+        "SMTP_PORT": str(smtp.port),
+        "SMTP_USE_TLS": "False",
+        # The load generator deliberately exceeds per-client limits, measure the endpoints instead of the limiter
+        "RATE_LIMIT_ENABLED": str(arguments.rate_limit),
+    }
+    with log_file.open("wb") as log:
+        return await asyncio.create_subprocess_exec(
+            sys.executable,
+            "-c",
+            "from backend.main import main; main()",
+            env=environment,
+            stdout=log,
+            stderr=subprocess.STDOUT,
+        )
+
+
+async def run(arguments: argparse.Namespace) -> dict[str, Any]:
+    """Run the load test and return its results."""
+    jwks, smtp = JwksStub(), SmtpSink()
+    await jwks.start()
+    await smtp.start()
+    backend = await _start_backend(arguments, jwks, smtp, RESULTS_DIR / "load-test-backend.log")
+    try:
+        async with asyncio.timeout(STARTUP_TIMEOUT):
+            await _wait_until_healthy("127.0.0.1", arguments.port)
+        users = [VirtualUser(token=jwks.issue_token()) for _ in range(arguments.users)]
+        generator = LoadGenerator("127.0.0.1", arguments.port, users, parse_mix(arguments.mix))
+
+        if arguments.warmup:
+            await generator.run(arguments.concurrency, arguments.warmup)
+        results, elapsed = await generator.run(arguments.concurrency, arguments.duration)
+    finally:
+        with contextlib.suppress(ProcessLookupError):
+            backend.send_signal(signal.SIGINT)
+        await backend.wait()
+        await jwks.stop()
+        await smtp.stop()
+
+    return {
+        "commit": git_commit(),
+        "timestamp": datetime.now(UTC).isoformat(timespec="seconds"),
+        "config": {
+            "duration_s": arguments.duration,
+            "warmup_s": arguments.warmup,
+            "concurrency": arguments.concurrency,
+            "users": arguments.users,
+            "workers": arguments.workers,
+            "mix": arguments.mix,
+            "rate_limit": arguments.rate_limit,
+        },
+        "endpoints": summarize_results(results, elapsed),
+        "emails_received": smtp.messages,
+        "jwks_requests": jwks.requests,
+    }
+
+
+def main() -> None:
+    """Entry point of the load test."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", default=str(settings.database_url), help="Migrated PostgreSQL database to run against")
+    parser.add_argument("--duration", type=float, default=30, help="Seconds of measured load")
+    parser.add_argument("--warmup", type=float, default=5, help="Seconds of unmeasured load before the measurement")
+    parser.add_argument("--concurrency", type=int, default=32, help="Number of concurrent connections")
+    parser.add_argument("--users", type=int, default=50, help="Number of distinct authenticated users")
+    parser.add_argument("--workers", type=int, default=1, help="Backend worker processes")
+    parser.add_argument("--port", type=int, default=8765, help="Port the backend is started on")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help="Relative endpoint weights")
+    parser.add_argument("--rate-limit", action="store_true", help="Keep write rate limiting enabled")
+    parser.add_argument("--output", type=Path, help="Results file, defaults to benchmark-results/load-test-<commit>-<time>.json")
+    parser.add_argument("--compare", type=Path, help="Previous results file to compare against")
+    arguments = parser.parse_args()
+
+    RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+    results = asyncio.run(run(arguments))
+
+    output = write_results("load-test", results, arguments.output)
+    sys.stdout.write(json.dumps(results["endpoints"], indent=2) + "\n")
+    sys.stdout.write(f"Results written to {output}\n")
+    if arguments.compare:
+        sys.stdout.write(compare(results, json.loads(arguments.compare.read_text(encoding="utf-8"))) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Benchmark request latency with logging disabled, synchronous and queue-based.
+
+Every request goes through a FastAPI route logging like the observation routes do, while `concurrency`
+clients keep the event loop busy. Log files are written to a temporary directory and console output is discarded.
+
+Usage:
+    python -m tools.benchmarks.logging_overhead --requests 20000 --concurrency 50
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from fastapi import FastAPI
+
+from backend.configs.custom_logging import setup_logger, stop_queue_listeners
+from tools.benchmarks.asgi import timed_call
+from tools.benchmarks.stats import summarize
+
+LOGGER_NAME = "logging_benchmark"
+
+MODES: dict[str, dict[str, object]] = {
+    "off": {},
+    "sync": {"use_queue": False, "json_format": False, "sample_every": 1},
+    "queue": {"use_queue": True, "json_format": False, "sample_every": 1},
+    "queue-json": {"use_queue": True, "json_format": True, "sample_every": 1},
+    "queue-sampled": {"use_queue": True, "json_format": False, "sample_every": 10},
+}
+
+
+def build_app(logger: logging.Logger) -> FastAPI:
+    """Build a single-route application logging three records per request."""
+    app = FastAPI()
+
+    @app.get("/observations/{observation_id}")
+    async def read_observation(observation_id: int) -> dict[str, object]:
+        logger.info("Fetching observation %s", observation_id)
+        logger.debug("Observation %s lookup parameters: %s", observation_id, {"user": 1})
+        logger.info("Returning observation %s", observation_id)
+        return {"id": observation_id, "status": "pending"}
+
+    return app
+
+
+async def run_mode(mode: str, total_requests: int, concurrency: int) -> dict[str, object]:
+    """Run the benchmark for a single logging mode."""
+    logger = setup_logger(LOGGER_NAME, **MODES[mode]) if mode != "off" else logging.getLogger(LOGGER_NAME)
+    logger.disabled = mode == "off"
+    app = build_app(logger)
+    latencies: list[float] = []
+    per_client = total_requests // concurrency
+
+    async def client(client_id: int) -> None:
+        latencies.extend(
+            [await timed_call(app, "GET", f"/observations/{client_id * per_client + number}") for number in range(per_client)],
+        )
+
+    started = time.perf_counter()
+    await asyncio.gather(*(client(client_id) for client_id in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    # Draining is not part of the request latency, but it is reported so the background work stays visible
+    drain_started = time.perf_counter()
+    stop_queue_listeners()
+    drain_ms = (time.perf_counter() - drain_started) * 1000
+
+    return {
+        "mode": mode,
+        "requests": len(latencies),
+        "requests_per_second": round(len(latencies) / elapsed, 1),
+        **summarize(latencies),
+        "queue_drain_ms": round(drain_ms, 2),
+    }
+
+
+def _with_discarded_console(function: Callable[[], list[dict[str, object]]]) -> list[dict[str, object]]:
+    with Path(os.devnull).open("w", encoding="utf-8") as devnull, contextlib.redirect_stderr(devnull):
+        return function()
+
+
+def main() -> None:
+    """Entry point of the logging benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=20_000, help="Total number of requests per mode")
+    parser.add_argument("--concurrency", type=int, default=50, help="Number of concurrent clients")
+    parser.add_argument("--modes", nargs="+", choices=list(MODES), default=list(MODES), help="Logging modes to compare")
+    arguments = parser.parse_args()
+
+    working_directory = Path.cwd()
+    with tempfile.TemporaryDirectory() as log_directory:
+        os.chdir(log_directory)
+        try:
+            results = _with_discarded_console(
+                lambda: [asyncio.run(run_mode(mode, arguments.requests, arguments.concurrency)) for mode in arguments.modes],
+            )
+        finally:
+            os.chdir(working_directory)
+
+    json.dump(results, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
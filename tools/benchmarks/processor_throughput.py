@@ -0,0 +1,156 @@
+"""
+Throughput benchmark of the observation processor.
+
+Seeds the configured PostgreSQL database (migrated, ideally dedicated to benchmarks, as every pending observation in it
+is processed) with pending observations, then drains them with the processor loop and a zero-cost simulated telescope.
+Reports claims per second, SQL statements per observation and the latency from submission to completion.
+
+Usage:
+    uv run python -m tools.benchmarks.processor_throughput --observations 5000
+    uv run python -m tools.benchmarks.processor_throughput --observations 5000 --processors 4 --delay 0.01
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import random
+import sys
+import time
+from datetime import timedelta
+from pathlib import Path
+from typing import Any
+
+import asyncpg
+
+from backend.configs.config import settings
+from backend.database import asyncpg_dsn, close_database_connection, initialize_database_connection
+from backend.utils.sql_instrumentation import track_queries
+from backend.utils.synthetic_data import OBSERVATION_COLUMNS, observation_records, seed_database
+from backend.utils.time_utils import utc_now
+from tools.benchmarks.results import git_commit, write_results
+from tools.benchmarks.stats import summarize
+from tools.observation_processor import process_next_observation
+
+
+async def seed_pending_observations(count: int) -> int:
+    """
+    Create a user with `count` pending observations, submitted in order just now.
+
+    Returns:
+        int: Database ID of the user owning the observations
+    """
+    plan = await seed_database(asyncpg_dsn(), 1, 0)
+    submitted = utc_now()
+    records = (
+        # Status dependent columns of the synthetic rows are reset to those of a fresh submission
+        (plan.first_user_id, "PENDING", submitted + timedelta(microseconds=number), submitted, None, *record[5:18], None, None, None)
+        for number, record in enumerate(observation_records(plan, count, random.Random()))  # noqa: S311
+    )
+    connection: asyncpg.Connection = await asyncpg.connect(asyncpg_dsn())
+    try:
+        await connection.copy_records_to_table("observations", records=records, columns=OBSERVATION_COLUMNS)
+    finally:
+        await connection.close()
+    return plan.first_user_id
+
+
+async def drain_queue(processors: int) -> tuple[int, int, float]:
+    """
+    Process pending observations with concurrent processor loops until none is left.
+
+    Returns:
+        tuple[int, int, float]: Processed observations, executed SQL statements and elapsed seconds
+    """
+
+    async def processor() -> int:
+        processed = 0
+        while await process_next_observation():
+            processed += 1
+        return processed
+
+    with track_queries() as queries:
+        started = time.perf_counter()
+        processed = sum(await asyncio.gather(*(processor() for _ in range(processors))))
+        elapsed = time.perf_counter() - started
+    return processed, queries.count, elapsed
+
+
+async def _completion_latencies_ms(user_id: int) -> tuple[list[float], int]:
+    connection: asyncpg.Connection = await asyncpg.connect(asyncpg_dsn())
+    try:
+        rows = await connection.fetch(
+            "SELECT status, EXTRACT(EPOCH FROM completed_on - created_on) * 1000 AS latency_ms FROM observations WHERE user_id = $1",
+            user_id,
+        )
+    finally:
+        await connection.close()
+    completed = [float(row["latency_ms"]) for row in rows if row["status"] == "COMPLETED"]
+    return completed, len(rows) - len(completed)
+
+
+async def _delete_seeded(user_id: int) -> None:
+    connection: asyncpg.Connection = await asyncpg.connect(asyncpg_dsn())
+    try:
+        async with connection.transaction():
+            await connection.execute("DELETE FROM observations WHERE user_id = $1", user_id)
+            await connection.execute("DELETE FROM users WHERE id = $1", user_id)
+    finally:
+        await connection.close()
+
+
+async def run(arguments: argparse.Namespace) -> dict[str, Any]:
+    """Run the benchmark and return its results."""
+    settings.processor_process_delay = arguments.delay
+    user_id = await seed_pending_observations(arguments.observations)
+
+    initialize_database_connection()
+    try:
+        processed, statements, elapsed = await drain_queue(arguments.processors)
+    finally:
+        await close_database_connection()
+
+    latencies, unfinished = await _completion_latencies_ms(user_id)
+    if not arguments.keep:
+        await _delete_seeded(user_id)
+
+    return {
+        "commit": git_commit(),
+        "config": {
+            "observations": arguments.observations,
+            "processors": arguments.processors,
+            "process_delay_s": arguments.delay,
+        },
+        "processed": processed,
+        # More processed than seeded observations means several processors claimed the same one
+        "duplicate_claims": max(0, processed - len(latencies)),
+        "not_completed": unfinished,
+        "elapsed_s": round(elapsed, 3),
+        "claims_per_second": round(processed / elapsed, 1) if elapsed else 0.0,
+        "queries_per_observation": round(statements / processed, 2) if processed else 0.0,
+        "completion_latency": summarize(latencies),
+    }
+
+
+def main() -> None:
+    """Entry point of the processor benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--observations", type=int, default=2000, help="Pending observations to seed")
+    parser.add_argument("--processors", type=int, default=1, help="Concurrent processor loops")
+    parser.add_argument("--delay", type=float, default=0.0, help="Seconds the simulated telescope takes per observation")
+    parser.add_argument("--keep", action="store_true", help="Keep the seeded user and observations")
+    parser.add_argument("--verbose", action="store_true", help="Keep the per-observation INFO logs of the processor")
+    parser.add_argument("--output", type=Path, help="Results file")
+    arguments = parser.parse_args()
+
+    if not arguments.verbose:
+        logging.getLogger("observation_processor").setLevel(logging.WARNING)
+
+    results = asyncio.run(run(arguments))
+    output = write_results("processor-throughput", results, arguments.output)
+    sys.stdout.write(json.dumps(results, indent=2) + "\n")
+    sys.stdout.write(f"Results written to {output}\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,236 @@
+r"""
+Discrete-event simulator of the observation queue.
+
+Replays observation submissions against a number of processors, without a database, to compare the order in which
+pending observations are claimed. Processors behave like `tools.observation_processor`: they claim observations back
+to back while the queue is non-empty and poll again after `--poll-delay` seconds once it is empty.
+
+Submissions are either replayed from a CSV export of the production table:
+
+    psql "$DATABASE_URL" -c "\copy (SELECT created_on, planned_start, integration_time FROM observations
+        ORDER BY created_on) TO 'history.csv' CSV HEADER"
+
+or generated as Poisson arrivals with `--synthetic`.
+
+Usage:
+    uv run python -m tools.benchmarks.queue_simulator --history history.csv --processors 2
+    uv run python -m tools.benchmarks.queue_simulator --synthetic 10000 --rate 600 --use-integration-time
+"""
+
+import argparse
+import csv
+import heapq
+import random
+import sys
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from backend.configs.config import settings
+from tools.benchmarks.results import git_commit, write_results
+from tools.benchmarks.stats import summarize
+
+
+@dataclass(frozen=True, slots=True)
+class Submission:
+    """An observation as seen by the queue, times in seconds since the first submission."""
+
+    number: int
+    created: float
+    planned_start: float | None
+    integration_time: float
+
+
+# Sort key of a pending observation per policy, the smallest key is claimed first
+POLICIES: dict[str, Callable[[Submission], tuple[float, ...]]] = {
+    # Current behaviour of the processor (ORDER BY created_on)
+    "fifo": lambda submission: (submission.created, submission.number),
+    "planned_start": lambda submission: (
+        submission.planned_start if submission.planned_start is not None else float("inf"),
+        submission.created,
+        submission.number,
+    ),
+    "shortest": lambda submission: (submission.integration_time, submission.created, submission.number),
+}
+
+_ARRIVAL = 0
+_WAKE = 1
+
+
+def _parse_timestamp(value: str) -> datetime:
+    return datetime.fromisoformat(value.strip()).replace(tzinfo=None)
+
+
+def read_history(path: Path) -> list[Submission]:
+    """
+    Read submissions exported with `created_on`, `planned_start` and `integration_time` columns.
+
+    Returns:
+        list[Submission]: The submissions ordered by creation time
+    """
+    with path.open(newline="", encoding="utf-8") as file:
+        rows = [
+            (_parse_timestamp(row["created_on"]), _parse_timestamp(row["planned_start"]) if row.get("planned_start") else None, row)
+            for row in csv.DictReader(file)
+        ]
+    rows.sort(key=lambda row: row[0])
+    if not rows:
+        return []
+
+    origin = rows[0][0]
+    return [
+        Submission(
+            number=number,
+            created=(created - origin).total_seconds(),
+            planned_start=(planned_start - origin).total_seconds() if planned_start is not None else None,
+            integration_time=float(row.get("integration_time") or 0.0),
+        )
+        for number, (created, planned_start, row) in enumerate(rows)
+    ]
+
+
+def synthetic_submissions(count: int, rate_per_hour: float, rng: random.Random) -> list[Submission]:
+    """
+    Generate Poisson arrivals with planned starts up to a day ahead and the integration times users usually pick.
+
+    Returns:
+        list[Submission]: The submissions ordered by creation time
+    """
+    submissions = []
+    created = 0.0
+    for number in range(count):
+        created += rng.expovariate(rate_per_hour / 3600)
+        planned_start = created + rng.uniform(0, 86_400) if rng.random() < 0.3 else None  # noqa: PLR2004
+        integration_time = rng.choice((1.0, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0))
+        submissions.append(Submission(number, created, planned_start, integration_time))
+    return submissions
+
+
+def simulate(  # noqa: PLR0913
+    submissions: list[Submission],
+    policy: str,
+    *,
+    processors: int,
+    process_delay: float,
+    poll_delay: float,
+    use_integration_time: bool,
+) -> dict[str, Any]:
+    """
+    Run the queue with one claim order until every submission is processed.
+
+    Returns:
+        dict[str, Any]: Throughput, waiting time from submission to claim, queue length and processor utilization
+    """
+    key = POLICIES[policy]
+    events: list[tuple[float, int, int]] = [(submission.created, _ARRIVAL, submission.number) for submission in submissions]
+    # Processors start polling together, like processes started at the same time
+    events.extend((0.0, _WAKE, processor) for processor in range(processors))
+    heapq.heapify(events)
+
+    pending: list[tuple[tuple[float, ...], int]] = []
+    waits_ms: list[float] = []
+    busy = 0.0
+    max_queue = 0
+    finished = 0.0
+    remaining = len(submissions)
+
+    while remaining and events:
+        now, kind, identifier = heapq.heappop(events)
+        if kind == _ARRIVAL:
+            submission = submissions[identifier]
+            heapq.heappush(pending, (key(submission), identifier))
+            max_queue = max(max_queue, len(pending))
+            continue
+
+        if not pending:
+            heapq.heappush(events, (now + poll_delay, _WAKE, identifier))
+            continue
+
+        _, number = heapq.heappop(pending)
+        submission = submissions[number]
+        service = submission.integration_time if use_integration_time else process_delay
+        waits_ms.append((now - submission.created) * 1000)
+        busy += service
+        finished = max(finished, now + service)
+        remaining -= 1
+        # A processor that finished an observation claims the next one without waiting
+        heapq.heappush(events, (now + service, _WAKE, identifier))
+
+    # Time from the first submission until the last observation is processed
+    makespan = finished
+    return {
+        "processed": len(waits_ms),
+        "makespan_s": round(makespan, 3),
+        "throughput_per_hour": round(len(waits_ms) / makespan * 3600, 1) if makespan else 0.0,
+        "wait": summarize(waits_ms),
+        "max_queue_length": max_queue,
+        "utilization": round(busy / (processors * makespan), 4) if makespan else 0.0,
+    }
+
+
+def _table(results: dict[str, dict[str, Any]]) -> Iterator[str]:
+    yield f"{'policy':<14}{'throughput/h':>14}{'wait p50 s':>12}{'wait p95 s':>12}{'wait p99 s':>12}{'max queue':>11}{'utilization':>13}"
+    for policy, result in results.items():
+        wait = result["wait"]
+        yield (
+            f"{policy:<14}{result['throughput_per_hour']:>14.1f}{wait['p50_ms'] / 1000:>12.1f}{wait['p95_ms'] / 1000:>12.1f}"
+            f"{wait['p99_ms'] / 1000:>12.1f}{result['max_queue_length']:>11}{result['utilization']:>13.1%}"
+        )
+
+
+def main() -> None:
+    """Entry point of the queue simulator."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--history", type=Path, help="CSV export of created_on, planned_start and integration_time")
+    source.add_argument("--synthetic", type=int, metavar="COUNT", help="Generate COUNT Poisson arrivals")
+    parser.add_argument("--rate", type=float, default=600.0, help="Synthetic arrivals per hour")
+    parser.add_argument("--seed", type=int, help="Seed of the synthetic arrivals")
+    parser.add_argument("--policies", nargs="+", choices=tuple(POLICIES), default=list(POLICIES), help="Claim orders to compare")
+    parser.add_argument("--processors", type=int, default=1, help="Concurrent processors")
+    parser.add_argument("--process-delay", type=float, default=settings.processor_process_delay, help="Seconds per observation")
+    parser.add_argument("--poll-delay", type=float, default=settings.processor_poll_delay, help="Seconds between polls of an empty queue")
+    parser.add_argument("--use-integration-time", action="store_true", help="Take each observation's integration time as its processing time")
+    parser.add_argument("--output", type=Path, help="Results file")
+    arguments = parser.parse_args()
+
+    if arguments.history is not None:
+        submissions = read_history(arguments.history)
+    else:
+        submissions = synthetic_submissions(arguments.synthetic, arguments.rate, random.Random(arguments.seed))  # noqa: S311
+
+    results = {
+        policy: simulate(
+            submissions,
+            policy,
+            processors=arguments.processors,
+            process_delay=arguments.process_delay,
+            poll_delay=arguments.poll_delay,
+            use_integration_time=arguments.use_integration_time,
+        )
+        for policy in arguments.policies
+    }
+    output = write_results(
+        "queue-simulator",
+        {
+            "commit": git_commit(),
+            "config": {
+                "source": str(arguments.history) if arguments.history is not None else f"synthetic:{arguments.synthetic}@{arguments.rate}/h",
+                "submissions": len(submissions),
+                "processors": arguments.processors,
+                "process_delay_s": arguments.process_delay,
+                "poll_delay_s": arguments.poll_delay,
+                "use_integration_time": arguments.use_integration_time,
+            },
+            "policies": results,
+        },
+        arguments.output,
+    )
+    sys.stdout.write("\n".join(_table(results)) + "\n")
+    sys.stdout.write(f"Results written to {output}\n")
+
+
+if __name__ == "__main__":
+    main()
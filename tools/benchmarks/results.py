@@ -0,0 +1,36 @@
+"""Storing benchmark results as JSON, tagged with the commit they were measured on."""
+
+import json
+import subprocess
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+RESULTS_DIR = Path("benchmark-results")
+
+
+def git_commit() -> str:
+    """Return the short hash of the checked out commit, or `unknown` outside of a git checkout."""
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()  # noqa: S607
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def write_results(benchmark: str, results: dict[str, Any], output: Path | None = None) -> Path:
+    """
+    Write benchmark results as JSON.
+
+    Args:
+        benchmark: Name of the benchmark, used in the default file name
+        results: The results, including the `commit` they were measured on
+        output: Results file, defaults to `benchmark-results/<benchmark>-<commit>-<time>.json`
+
+    Returns:
+        Path: The written file
+    """
+    if output is None:
+        RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+        output = RESULTS_DIR / f"{benchmark}-{results.get('commit', 'unknown')}-{datetime.now(UTC):%Y%m%dT%H%M%S}.json"
+    output.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+    return output
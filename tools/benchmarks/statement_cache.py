@@ -0,0 +1,186 @@
+"""
+Benchmark the per-request SQL preparation cost of the hot statements, built per request versus built once.
+
+Before SQLAlchemy looks up the compiled SQL of a statement in the engine's compiled cache, it computes the statement's
+cache key. A statement built per request is constructed and hashed on every execution, a statement built once has a
+memoized key. Compiling (a cache miss) happens once per process and statement shape either way.
+
+Without a database the preparation cost (build, cache key, compile) is reported. With `--execute` every read-only statement is
+also executed against the configured database, to put that cost next to the execution time of a request.
+
+Usage:
+    uv run python -m tools.benchmarks.statement_cache
+    uv run python -m tools.benchmarks.statement_cache --execute --iterations 500
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import Executable, func, tuple_, update
+from sqlalchemy.dialects.postgresql.asyncpg import dialect as asyncpg_dialect
+from sqlmodel import select
+
+from backend.database import close_database_connection, get_read_db_session, initialize_database_connection
+from backend.models import IdempotencyKey, Observation, ObservationStatusCount, User
+from backend.models.enums.observation_status import ObservationStatusEnum
+from backend.routers.observations import CHANGES_STATEMENTS, LIST_STATEMENTS, OBSERVATION_BY_ID, changes_parameters
+from backend.utils.auth import USER_BY_EMAIL, USER_BY_USER_ID
+from backend.utils.idempotency import STORED_RESPONSE
+from backend.utils.observation_counters import STATUS_COUNTS
+from tools.benchmarks.results import git_commit, write_results
+from tools.benchmarks.stats import summarize
+from tools.observation_processor import CLAIM_NEXT_PENDING
+
+CURSOR = datetime(2026, 1, 1)  # noqa: DTZ001
+SETTLED_BEFORE = datetime(2026, 1, 2)  # noqa: DTZ001
+
+
+@dataclass(frozen=True, slots=True)
+class HotStatement:
+    """A hot statement as it used to be built per request, its prebuilt form and the parameters it is executed with."""
+
+    build: Callable[[], Executable]
+    prebuilt: Executable
+    parameters: dict[str, Any]
+    read_only: bool = True  # Statements that write are only prepared, never executed
+
+
+# The `build` callables reproduce how each statement was built per request before it was prebuilt
+STATEMENTS: dict[str, HotStatement] = {
+    "user_by_user_id": HotStatement(lambda: select(User).where(User.user_id == ""), USER_BY_USER_ID, {"user_id": ""}),
+    "user_by_email": HotStatement(lambda: select(User).where(User.email == ""), USER_BY_EMAIL, {"email": ""}),
+    "stored_response": HotStatement(
+        lambda: select(IdempotencyKey).where(IdempotencyKey.scope == "", IdempotencyKey.key == ""),
+        STORED_RESPONSE,
+        {"scope": "", "key": ""},
+    ),
+    "observation_by_id": HotStatement(lambda: select(Observation).where(Observation.id == 0), OBSERVATION_BY_ID, {"observation_id": 0}),
+    "list_observations": HotStatement(
+        lambda: select(Observation).where(Observation.user_id == 0).order_by(Observation.created_on.desc()),
+        LIST_STATEMENTS[True],
+        {"user_id": 0},
+    ),
+    "observation_changes": HotStatement(
+        lambda: (
+            select(Observation)
+            .where(Observation.updated_on <= SETTLED_BEFORE)
+            .where(Observation.user_id == 0)
+            .where(tuple_(Observation.updated_on, Observation.id) > tuple_(CURSOR, 0))
+            .order_by(Observation.updated_on.asc(), Observation.id.asc())
+            .limit(101)
+        ),
+        CHANGES_STATEMENTS[True, True],
+        changes_parameters(limit=100, user_id=0, cursor=(CURSOR, 0)),
+    ),
+    "status_counts": HotStatement(
+        lambda: select(ObservationStatusCount.status, func.sum(ObservationStatusCount.count)).group_by(ObservationStatusCount.status),
+        STATUS_COUNTS,
+        {},
+    ),
+    "claim_next_pending": HotStatement(
+        lambda: (
+            update(Observation)
+            .where(
+                Observation.id
+                == select(Observation.id)
+                .where(Observation.status == ObservationStatusEnum.PENDING)
+                .order_by(Observation.created_on.asc())
+                .limit(1)
+                .with_for_update(skip_locked=True)
+                .scalar_subquery(),
+            )
+            .values(status=ObservationStatusEnum.IN_PROGRESS)
+            .returning(Observation)
+        ),
+        CLAIM_NEXT_PENDING,
+        {},
+        read_only=False,
+    ),
+}
+
+
+def _mean_us(operation: Callable[[], object], iterations: int) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        operation()
+    return (time.perf_counter() - started) / iterations * 1_000_000
+
+
+def preparation_costs(statement: HotStatement, iterations: int) -> dict[str, float]:
+    """
+    Measure the preparation cost of one statement.
+
+    Returns:
+        dict[str, float]: Mean microseconds to build and hash the statement per request, to hash the prebuilt statement
+        and to compile it (a compiled cache miss)
+    """
+    dialect = asyncpg_dialect()
+    return {
+        "per_request_us": round(_mean_us(lambda: statement.build()._generate_cache_key(), iterations), 2),  # noqa: SLF001
+        # Looked up on every call: the memoized key is installed on the instance after the first call
+        "prebuilt_us": round(_mean_us(lambda: statement.prebuilt._generate_cache_key(), iterations), 2),  # noqa: PLW0108, SLF001
+        "compile_us": round(_mean_us(lambda: statement.prebuilt.compile(dialect=dialect), max(1, iterations // 10)), 2),
+    }
+
+
+async def execution_latencies(iterations: int) -> dict[str, dict[str, dict[str, float]]]:
+    """
+    Execute every statement, built per request and prebuilt, against the configured database.
+
+    Returns:
+        dict[str, dict[str, dict[str, float]]]: Latency summary per statement and form
+    """
+    initialize_database_connection()
+    latencies: dict[str, dict[str, dict[str, float]]] = {}
+    try:
+        async with get_read_db_session() as session:
+            for name, statement in STATEMENTS.items():
+                if not statement.read_only:
+                    continue
+                forms = {"per_request": lambda statement=statement: statement.build(), "prebuilt": lambda statement=statement: statement.prebuilt}
+                latencies[name] = {}
+                for form, build in forms.items():
+                    parameters = statement.parameters if form == "prebuilt" else {}
+                    await session.execute(build(), parameters)  # Fill the compiled and prepared statement caches
+                    samples = []
+                    for _ in range(iterations):
+                        started = time.perf_counter()
+                        await session.execute(build(), parameters)
+                        samples.append((time.perf_counter() - started) * 1000)
+                    latencies[name][form] = summarize(samples)
+    finally:
+        await close_database_connection()
+    return latencies
+
+
+def main() -> None:
+    """Entry point of the statement cache benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=5000, help="Repetitions per measurement")
+    parser.add_argument("--execute", action="store_true", help="Also execute the statements against the configured database")
+    parser.add_argument("--output", type=Path, help="Results file")
+    arguments = parser.parse_args()
+
+    results: dict[str, Any] = {
+        "commit": git_commit(),
+        "config": {"iterations": arguments.iterations, "execute": arguments.execute},
+        "preparation": {name: preparation_costs(statement, arguments.iterations) for name, statement in STATEMENTS.items()},
+    }
+    if arguments.execute:
+        results["execution"] = asyncio.run(execution_latencies(arguments.iterations))
+
+    output = write_results("statement-cache", results, arguments.output)
+    sys.stdout.write(json.dumps(results, indent=2) + "\n")
+    sys.stdout.write(f"Results written to {output}\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,22 @@
+"""Latency statistics shared by all benchmarks."""
+
+import statistics
+
+
+def summarize(latencies_ms: list[float]) -> dict[str, float]:
+    """
+    Summarize latencies into the percentiles reported by all benchmarks.
+
+    Returns:
+        dict[str, float]: Mean, p50, p95 and p99 latency in milliseconds
+    """
+    if len(latencies_ms) < 2:  # noqa: PLR2004
+        latencies_ms = latencies_ms * 2 or [0.0, 0.0]
+
+    quantiles = statistics.quantiles(latencies_ms, n=100, method="inclusive")
+    return {
+        "mean_ms": round(statistics.fmean(latencies_ms), 4),
+        "p50_ms": round(quantiles[49], 4),
+        "p95_ms": round(quantiles[94], 4),
+        "p99_ms": round(quantiles[98], 4),
+    }
@@ -0,0 +1,139 @@
+"""Local stand-ins for Supabase Auth (JWKS + token signing) and the SMTP server used by the load test."""
+
+import asyncio
+import contextlib
+import json
+import time
+import uuid
+
+import jwt
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jwt.algorithms import RSAAlgorithm
+
+JWKS_PATH = "/auth/v1/.well-known/jwks.json"
+KEY_ID = "load-test-key"
+MAX_MESSAGE_SIZE = 10 * 1024 * 1024
+
+
+class JwksStub:
+    """
+    Serve a JWKS for a freshly generated RSA key and sign test tokens with it.
+
+    Pointing `SUPABASE_URL` at `url` makes the backend verify these tokens exactly like real Supabase ones.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", audience: str = "authenticated") -> None:
+        self.host = host
+        self.audience = audience
+        self._private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        public_jwk = json.loads(RSAAlgorithm.to_jwk(self._private_key.public_key()))
+        self._jwks = json.dumps({"keys": [{**public_jwk, "kid": KEY_ID, "alg": "RS256", "use": "sig"}]}).encode()
+        self._server: asyncio.Server | None = None
+        self.port = 0
+        self.requests = 0
+
+    @property
+    def url(self) -> str:
+        """Return the Supabase project URL of the stub."""
+        return f"http://{self.host}:{self.port}"
+
+    def issue_token(self, subject: str | None = None, email: str | None = None, lifetime: int = 3600) -> str:
+        """
+        Sign a Supabase-like access token.
+
+        Args:
+            subject: The `sub` claim, a random UUID by default
+            email: The `email` claim, derived from the subject by default
+            lifetime: Seconds until the token expires
+
+        Returns:
+            str: The encoded JWT
+        """
+        subject = subject or str(uuid.uuid4())
+        now = int(time.time())
+        claims = {
+            "sub": subject,
+            "email": email or f"load-{subject[:8]}@example.com",
+            "aud": self.audience,
+            "iss": f"{self.url}/auth/v1",
+            "iat": now,
+            "exp": now + lifetime,
+            "role": "authenticated",
+        }
+        return jwt.encode(claims, self._private_key, algorithm="RS256", headers={"kid": KEY_ID})
+
+    async def start(self) -> None:
+        """Start serving the JWKS on a free port."""
+        self._server = await asyncio.start_server(self._handle, self.host, 0)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        """Stop serving the JWKS."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            request_line = (await reader.readuntil(b"\r\n\r\n")).split(b"\r\n", 1)[0]
+            self.requests += 1
+            if request_line.split(b" ")[1].decode() == JWKS_PATH:
+                head = f"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\nContent-Length: {len(self._jwks)}\r\nConnection: close\r\n\r\n"
+                writer.write(head.encode() + self._jwks)
+            else:
+                writer.write(b"HTTP/1.1 404 Not Found\r\nContent-Length: 0\r\nConnection: close\r\n\r\n")
+            await writer.drain()
+        except (asyncio.IncompleteReadError, IndexError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+class SmtpSink:
+    """Accept and discard every email, answering just enough SMTP for `aiosmtplib` (no TLS, any AUTH PLAIN)."""
+
+    def __init__(self, host: str = "127.0.0.1") -> None:
+        self.host = host
+        self.port = 0
+        self.messages = 0
+        self._server: asyncio.Server | None = None
+
+    async def start(self) -> None:
+        """Start accepting emails on a free port."""
+        self._server = await asyncio.start_server(self._handle, self.host, 0, limit=MAX_MESSAGE_SIZE)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        """Stop accepting emails."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        writer.write(b"220 smtp-sink ESMTP\r\n")
+        try:
+            while line := await reader.readline():
+                command = line.strip().split(b" ", 1)[0].upper()
+                if command in {b"EHLO", b"HELO"}:
+                    writer.write(b"250-smtp-sink\r\n250-AUTH PLAIN\r\n250 8BITMIME\r\n")
+                elif command == b"AUTH":
+                    writer.write(b"235 2.7.0 Authentication successful\r\n")
+                elif command == b"DATA":
+                    writer.write(b"354 End data with <CR><LF>.<CR><LF>\r\n")
+                    await writer.drain()
+                    await reader.readuntil(b"\r\n.\r\n")
+                    self.messages += 1
+                    writer.write(b"250 2.0.0 Ok: queued\r\n")
+                elif command == b"QUIT":
+                    writer.write(b"221 2.0.0 Bye\r\n")
+                    await writer.drain()
+                    break
+                else:
+                    writer.write(b"250 2.0.0 Ok\r\n")
+                await writer.drain()
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
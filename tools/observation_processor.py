@@ -1,108 +1,184 @@
 """Background-style tool that processes pending observations one by one."""
 
 import asyncio
+import contextlib
+import time
 
+from sqlalchemy import bindparam, update
 from sqlmodel import select
 
+from backend.configs.config import settings
 from backend.configs.custom_logging import setup_logger
 from backend.database import close_database_connection, get_db_session, initialize_database_connection
 from backend.models import Observation
 from backend.models.enums.observation_status import ObservationStatusEnum
+from backend.utils.loop_monitor import event_loop_monitor
+from backend.utils.metrics import Gauge, Histogram, registry, serve_metrics
+from backend.utils.observation_counters import observation_status_counts
 from backend.utils.time_utils import utc_now
 
-PROCESS_DELAY_SECONDS = 5
-POLL_DELAY_SECONDS = 10
-
 logger = setup_logger("observation_processor")
 
-
-async def claim_next_pending_observation() -> Observation | None:
-    """Fetch and claim one pending observation for processing."""
+QUEUE_DEPTH = registry.register(Gauge("observation_processor_queue_depth", "Pending observations waiting to be processed"))
+CLAIM_DURATION = registry.register(
+    Histogram("observation_processor_claim_duration_seconds", "Time to find and claim the next pending observation", ("result",)),
+)
+PROCESSING_DURATION = registry.register(
+    Histogram(
+        "observation_processor_processing_duration_seconds",
+        "Time to process a claimed observation",
+        ("outcome",),
+        buckets=(0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0),
+    ),
+)
+
+# Built once per process, see `backend.utils.auth.USER_BY_USER_ID`.
+# Claims the oldest pending observation in one statement. SKIP LOCKED lets concurrent processors claim different rows
+# instead of waiting on (and then claiming) the same one, `updated_on` is maintained by a trigger.
+CLAIM_NEXT_PENDING = (
+    update(Observation)
+    .where(
+        Observation.id
+        == select(Observation.id)
+        .where(Observation.status == ObservationStatusEnum.PENDING)
+        .order_by(Observation.created_on.asc())
+        .limit(1)
+        .with_for_update(skip_locked=True)
+        .scalar_subquery(),
+    )
+    .values(status=ObservationStatusEnum.IN_PROGRESS)
+    .returning(Observation)
+    .execution_options(synchronize_session=False)
+)
+COMPLETE_OBSERVATION = (
+    update(Observation)
+    .where(Observation.id == bindparam("observation_id"))
+    .values(status=ObservationStatusEnum.COMPLETED, completed_on=bindparam("completed_on"))
+    .execution_options(synchronize_session=False)
+)
+FAIL_OBSERVATION = (
+    update(Observation)
+    .where(Observation.id == bindparam("observation_id"))
+    .values(status=ObservationStatusEnum.FAILED)
+    .execution_options(synchronize_session=False)
+)
+
+
+async def refresh_queue_depth() -> None:
+    """Read the number of pending observations for the queue depth gauge from the observation counters."""
     async with get_db_session() as session:
-        result = await session.exec(
-            select(Observation).where(Observation.status == ObservationStatusEnum.PENDING).order_by(Observation.created_on.asc()).limit(1),
-        )
-        observation = result.first()
+        counts = await observation_status_counts(session)
+    QUEUE_DEPTH.set(counts.get(ObservationStatusEnum.PENDING, 0))
 
-        if observation is None:
-            return None
 
-        observation.status = ObservationStatusEnum.IN_PROGRESS
-        observation.updated_on = utc_now()
+async def refresh_queue_depth_periodically() -> None:
+    """Keep the queue depth gauge up to date, off the claim and process path."""
+    while True:
+        try:
+            await refresh_queue_depth()
+        except Exception:
+            logger.exception("Failed to refresh the queue depth")
+        await asyncio.sleep(settings.processor_queue_depth_interval)
 
-        logger.info("Claimed observation %s for processing", observation.id)
 
-        await session.flush()
-        await session.refresh(observation)
+async def claim_next_pending_observation() -> Observation | None:
+    """Claim the oldest pending observation for processing."""
+    async with get_db_session() as session:
+        result = await session.scalars(CLAIM_NEXT_PENDING)
+        observation = result.first()
+
+        if observation is not None:
+            logger.info("Claimed observation %s for processing", observation.id)
         return observation
 
 
 async def mark_observation_completed(observation_id: int) -> None:
     """Mark an observation as completed after successful processing."""
     async with get_db_session() as session:
-        observation = await session.get(Observation, observation_id)
-        if observation is None:
+        result = await session.execute(COMPLETE_OBSERVATION, {"observation_id": observation_id, "completed_on": utc_now()})
+        if result.rowcount == 0:
             logger.warning("Observation with database id %s no longer exists", observation_id)
             return
 
-        observation.status = ObservationStatusEnum.COMPLETED
-        observation.completed_on = utc_now()
-        observation.updated_on = utc_now()
-
         logger.info("Marked observation %s as completed", observation_id)
 
 
 async def mark_observation_failed(observation_id: int) -> None:
     """Mark an observation as failed when processing raises an exception."""
     async with get_db_session() as session:
-        observation = await session.get(Observation, observation_id)
-        if observation is None:
+        result = await session.execute(FAIL_OBSERVATION, {"observation_id": observation_id})
+        if result.rowcount == 0:
             logger.warning("Observation with database id %s no longer exists", observation_id)
-            return
-
-        observation.status = ObservationStatusEnum.FAILED
-        observation.updated_on = utc_now()
 
 
 async def process_observation(observation: Observation) -> None:
-    """Simulate processing of an observation using a fixed delay."""
+    """Simulate processing of an observation using the configured delay."""
     logger.info(
         "Processing observation %s (%s)",
         observation.id,
         observation.target_name,
     )
 
-    await asyncio.sleep(PROCESS_DELAY_SECONDS)
+    await asyncio.sleep(settings.processor_process_delay)
     await mark_observation_completed(observation.id)
 
     logger.info("Completed observation %s", observation.id)
 
 
+async def process_next_observation() -> bool:
+    """
+    Claim and process the oldest pending observation.
+
+    Returns:
+        bool: False if there was no pending observation to process
+    """
+    started = time.perf_counter()
+    observation = await claim_next_pending_observation()
+    CLAIM_DURATION.observe(time.perf_counter() - started, "empty" if observation is None else "claimed")
+    if observation is None:
+        return False
+
+    started = time.perf_counter()
+    try:
+        await process_observation(observation)
+    except Exception:
+        logger.exception("Observation processing failed for %s", observation.id)
+        await mark_observation_failed(observation.id)
+        PROCESSING_DURATION.observe(time.perf_counter() - started, "failed")
+    else:
+        PROCESSING_DURATION.observe(time.perf_counter() - started, "completed")
+    return True
+
+
 async def run_processor() -> None:
     """Run the worker loop that processes pending observations and polls for new ones."""
     logger.info(
         "Starting observation processor (process delay: %ss, poll delay: %ss)",
-        PROCESS_DELAY_SECONDS,
-        POLL_DELAY_SECONDS,
+        settings.processor_process_delay,
+        settings.processor_poll_delay,
     )
 
+    await event_loop_monitor.start(logger)
     initialize_database_connection()
+    metrics_server = (
+        await serve_metrics(settings.processor_metrics_host, settings.processor_metrics_port) if settings.processor_metrics_port else None
+    )
+    queue_depth_task = asyncio.create_task(refresh_queue_depth_periodically()) if metrics_server is not None else None
 
     try:
         while True:
-            observation = await claim_next_pending_observation()
-            if observation is None:
-                logger.info("No pending observations found; polling again in %s seconds", POLL_DELAY_SECONDS)
-                await asyncio.sleep(POLL_DELAY_SECONDS)
-                continue
-
-            try:
-                await process_observation(observation)
-            except Exception:
-                logger.exception("Observation processing failed for %s", observation.id)
-                await mark_observation_failed(observation.id)
+            if not await process_next_observation():
+                logger.info("No pending observations found; polling again in %s seconds", settings.processor_poll_delay)
+                await asyncio.sleep(settings.processor_poll_delay)
     finally:
+        if queue_depth_task is not None:
+            queue_depth_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await queue_depth_task
+        if metrics_server is not None:
+            metrics_server.close()
         await close_database_connection()
+        await event_loop_monitor.stop()
         logger.info("Observation processor stopped")
 
 